@@ -2,16 +2,44 @@
 GameVault Core Package
 """
 
-from .backup_engine import BackupEngine
-from .game_detector import GameDetector
-from .bat_generator import BatGenerator
-from .config_manager import ConfigManager
-from .game_db import GameDatabase
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Static imports for type checkers and PyInstaller's dependency scan
+    from .backup_engine import BackupEngine
+    from .game_detector import GameDetector
+    from .bat_generator import BatGenerator
+    from .config_manager import ConfigManager
+    from .game_db import GameDatabase
 
 __all__ = [
-    "BackupEngine", 
-    "GameDetector", 
+    "BackupEngine",
+    "GameDetector",
     "BatGenerator",
     "ConfigManager",
     "GameDatabase"
 ]
+
+# Public name -> submodule; imported on first access (PEP 562) so a CLI call
+# only pays for the modules it actually uses
+_LAZY_IMPORTS = {
+    "BackupEngine": "backup_engine",
+    "GameDetector": "game_detector",
+    "BatGenerator": "bat_generator",
+    "ConfigManager": "config_manager",
+    "GameDatabase": "game_db",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
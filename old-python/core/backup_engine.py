@@ -4,93 +4,1107 @@ Core backup engine with rolling backup support, compression, and deduplication
 """
 
 import os
+import errno
+import functools
 import re
+import base64
 import shutil
-import json
+import sys
 import hashlib
+import io
+import mmap
+import tarfile
+import time
+import uuid
 import zipfile
+import zlib
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
+from .fileio import atomic_write, json_dumps, json_loads
+
+try:
+    from blake3 import blake3 as _blake3  # type: ignore
+except ImportError:
+    _blake3 = None
+
+try:
+    import xxhash as _xxhash  # type: ignore
+except ImportError:
+    _xxhash = None
+
+try:
+    from fastcdc import fastcdc as _fastcdc  # type: ignore
+except ImportError:
+    _fastcdc = None
+
+try:
+    import zstandard as _zstd  # type: ignore
+except ImportError:
+    _zstd = None
+
+# Content hash choices for deduplication, fastest first. None of these need to
+# be cryptographic: they only tell unchanged save data apart from changed data.
+HASH_ALGOS = ("xxh3", "blake3", "sha256")
+DEFAULT_HASH_ALGO = "xxh3"
+# Read size used when streaming file contents through a hasher
+HASH_CHUNK_SIZE = 1024 * 1024
+# Files above this size are hashed with BLAKE3's multithreaded mode
+BLAKE3_THREADED_MIN_SIZE = 1024 * 1024
+# Buffer size used when streaming members out of a zip backup
+COPY_CHUNK_SIZE = 1024 * 1024
+# Files up to this size are memory-mapped and hashed in a single update. 64-bit
+# builds have address space to map any save file; 32-bit ones stay conservative.
+MMAP_MAX_SIZE = (1 << 40) if sys.maxsize > 2**32 else 256 * 1024 * 1024
+# Worker threads used to hash save files concurrently
+HASH_WORKERS = min(32, os.cpu_count() or 1)
+# Worker threads used to read zip backup metadata when listing backups
+METADATA_WORKERS = 4
+# Worker threads used to deflate save files concurrently (zlib releases the GIL)
+COMPRESS_WORKERS = min(8, os.cpu_count() or 1)
+# Raw bytes of files being compressed or waiting to be written. Member data is
+# at most the raw size (stored or incompressible files), so this bounds memory
+COMPRESS_MAX_PENDING_BYTES = 256 * 1024 * 1024
+# Larger files are streamed into the archive by zipfile itself
+PARALLEL_COMPRESS_MAX_SIZE = 64 * 1024 * 1024
+# Below this many files, thread startup and handoff outweigh the parallelism
+PARALLEL_COMPRESS_MIN_FILES = 16
+# Deflate level for new archives; 9 is much slower for little gain on save data
+DEFAULT_COMPRESSION_LEVEL = 6
+# How much of the save folder is test-compressed before choosing a method
+COMPRESSION_PROBE_FILES = 8
+COMPRESSION_PROBE_BYTES = 64 * 1024
+# Below this raw/compressed ratio the data is stored instead of deflated
+MIN_COMPRESSION_RATIO = 1.05
+# Already-compressed formats; stored as-is in zip backups
+INCOMPRESSIBLE_EXTENSIONS = frozenset({
+    ".zip", ".7z", ".rar", ".gz", ".xz", ".bz2", ".zst", ".lz4",
+    ".png", ".jpg", ".jpeg", ".webp", ".ogg", ".mp3", ".mp4", ".pak",
+})
+
+# Characters dropped from game names when building backup folder names
+_NAME_STRIP = re.compile(r"[^\w\s-]")
+_WS = re.compile(r"\s+")
+
+# Supported on-disk backup layouts: one zip per backup, or a manifest that
+# points into a content-addressed object store shared by all backups
+ARCHIVE_FORMATS = ("zip", "tar.zst", "objects")
+# File name suffix of zstd-compressed tar backups
+TAR_ZST_SUFFIX = ".tar.zst"
+# zstd level for tar.zst backups; level 3 beats deflate 6 on speed and ratio
+ZSTD_LEVEL = 3  # Default; fast with a DEFLATE-6-like ratio, 19 for max ratio
+# Object store folder under the backup root (dot-prefixed so it can never
+# collide with a legacy per-game folder)
+OBJECTS_DIR_NAME = ".objects"
+# Persisted metadata index under the backup root
+INDEX_FILE_NAME = ".index.json"
+# Most entries the metadata index keeps; least recently used ones are dropped
+# (e.g. backups deleted outside GameVault that would otherwise linger forever)
+INDEX_MAX_ENTRIES = 4096
+# File name suffix of object-store backups
+MANIFEST_SUFFIX = ".manifest.json"
+# Object-store files above this size are split into content-defined chunks
+# (FastCDC, when installed) so a partly changed file only stores new chunks
+CDC_MIN_FILE_SIZE = 4 * 1024 * 1024
+CDC_MIN_CHUNK_SIZE = 16 * 1024
+CDC_AVG_CHUNK_SIZE = 64 * 1024
+CDC_MAX_CHUNK_SIZE = 256 * 1024
+# Object GC normally only checks the objects a deletion could orphan; every
+# this many passes it sweeps the whole store to catch anything else
+GC_FULL_SWEEP_INTERVAL = 16
+
+
+def _make_sha256():
+    """Return a SHA-256 hasher from the fastest backend hashlib offers.
+
+    CPython's hashlib is backed by OpenSSL, which dispatches to SHA-NI (or
+    AVX2) code at runtime on CPUs that have it, so no extra extension is
+    needed. usedforsecurity=False skips FIPS wrappers on builds that use them.
+    """
+    return hashlib.sha256(usedforsecurity=False)
+
+
+def _resolve_hash_algo(algo: str) -> str:
+    """Map a requested hash algorithm to one that is installed.
+
+    xxh3 falls back to BLAKE3 and then SHA-256; unknown names use the default.
+    """
+    if algo not in HASH_ALGOS:
+        algo = DEFAULT_HASH_ALGO
+    if algo == "xxh3" and _xxhash is None:
+        algo = "blake3"
+    if algo == "blake3" and _blake3 is None:
+        algo = "sha256"
+    return algo
+
+
+def _new_hasher(size: int = 0, algo: str = "sha256"):
+    """Return a fresh hasher for a resolved algorithm (see _resolve_hash_algo).
+
+    xxh3_128 is the fastest; BLAKE3 is threaded for large inputs.
+    """
+    if algo == "xxh3":
+        return _xxhash.xxh3_128()
+    if algo == "blake3":
+        if size > BLAKE3_THREADED_MIN_SIZE:
+            return _blake3(max_threads=_blake3.AUTO)
+        return _blake3()
+    return _make_sha256()
+
+
+def _invalidates_backup_listing(method):
+    """Drop cached get_backups results before and after a method that changes backups on disk."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._backups_cache.clear()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._backups_cache.clear()
+    return wrapper
+
+
+_read_buffers = threading.local()
+
+
+class _HashingReader:
+    """Read-only file wrapper that feeds everything read through a hasher."""
+
+    def __init__(self, f, hasher):
+        self._f = f
+        self._hasher = hasher
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._f.read(size)
+        self._hasher.update(data)
+        return data
+
+
+def _update_from_stream(hasher, f):
+    """Feed a binary file into hasher through a reusable per-thread buffer.
+
+    readinto() fills the same 1 MiB buffer every time instead of allocating a
+    new bytes object per chunk.
+    """
+    view = getattr(_read_buffers, "view", None)
+    if view is None:
+        view = _read_buffers.view = memoryview(bytearray(HASH_CHUNK_SIZE))
+    while n := f.readinto(view):
+        hasher.update(view[:n])
+    return hasher
+
+
+def _set_compress_level(zinfo: zipfile.ZipInfo, level: int):
+    """Set the deflate level zf.open(zinfo, "w") compresses with.
+
+    The attribute is public (compress_level) from Python 3.13; older
+    versions only have the private _compresslevel that ZipFile.write sets.
+    Without either, zlib's default level is used.
+    """
+    if hasattr(zinfo, "compress_level"):
+        zinfo.compress_level = level
+    elif hasattr(zinfo, "_compresslevel"):
+        zinfo._compresslevel = level
+
+
+def _append_precompressed(zf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, parts: List[bytes]):
+    """
+    Append a member whose data (parts, in order) is already in
+    zinfo.compress_type form. This
+    mirrors ZipFile.write minus the compression step, using ZipFile
+    internals; only call it when _precompressed_writes_work() is True.
+    """
+    zf._writecheck(zinfo)
+    zf._didModify = True
+    zf.fp.seek(zf.start_dir)
+    zinfo.header_offset = zf.fp.tell()
+    zf.fp.write(zinfo.FileHeader(False))
+    for part in parts:
+        zf.fp.write(part)
+    zf.filelist.append(zinfo)
+    zf.NameToInfo[zinfo.filename] = zinfo
+    zf.start_dir = zf.fp.tell()
+
+
+@functools.lru_cache(maxsize=None)
+def _precompressed_writes_work() -> bool:
+    """
+    Round-trip check, once per process, that _append_precompressed produces
+    valid archives with this Python's zipfile. If it doesn't (the internals
+    it uses changed), zip backups fall back to ZipFile.write.
+    """
+    payload = b"GameVault precompressed member check\n" * 64
+    try:
+        compressor = zlib.compressobj(DEFAULT_COMPRESSION_LEVEL, zlib.DEFLATED, -15)
+        data = compressor.compress(payload) + compressor.flush()
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w") as zf:
+            zinfo = zipfile.ZipInfo("check.bin", date_time=(2020, 1, 1, 0, 0, 0))
+            zinfo.compress_type = zipfile.ZIP_DEFLATED
+            zinfo.CRC = zlib.crc32(payload)
+            zinfo.file_size = len(payload)
+            zinfo.compress_size = len(data)
+            _append_precompressed(zf, zinfo, [data])
+            zf.writestr("after.txt", b"ok")  # A regular member must still follow it
+        with zipfile.ZipFile(io.BytesIO(buf.getvalue())) as zf:
+            return (
+                zf.testzip() is None
+                and zf.read("check.bin") == payload
+                and zf.read("after.txt") == b"ok"
+            )
+    except Exception:
+        return False
+
 
 class BackupEngine:
     """Handles backup operations with rolling backup support, compression, and deduplication"""
     
-    def __init__(self, backup_root: str, max_backups: int = 10):
+    def __init__(
+        self,
+        backup_root: str,
+        max_backups: int = 10,
+        compression_level: int = DEFAULT_COMPRESSION_LEVEL,
+        archive_format: str = "zip",
+        zstd_level: int = ZSTD_LEVEL,
+        hash_algo: str = DEFAULT_HASH_ALGO,
+    ):
         self.backup_root = Path(backup_root)
         self.max_backups = max_backups
+        self.compression_level = compression_level
+        self.zstd_level = zstd_level
+        # Digests of different algorithms never match, so switching only
+        # costs one non-deduplicated backup
+        self.hash_algo = _resolve_hash_algo(hash_algo)
+        self.archive_format = archive_format if archive_format in ARCHIVE_FORMATS else "zip"
+        if self.archive_format == "tar.zst" and _zstd is None:
+            self.archive_format = "zip"  # zstandard not installed
+        # Serializes object writes against garbage collection of the store
+        self._objects_lock = threading.Lock()
+        self._gc_passes = 0  # Candidate-only GC passes since the last full sweep
+        # Parsed zip metadata keyed by path -> ((zip mtime_ns, sidecar mtime_ns), metadata),
+        # in LRU order and persisted to .index.json so listings don't reopen
+        # archives across sessions
+        self._index: "OrderedDict[str, tuple]" = OrderedDict()
+        self._index_lock = threading.Lock()
+        self._index_dirty = False
+        # get_backups results: game_id -> (folder mtimes, backups, their
+        # collection IDs as a parallel column). A folder's mtime changes
+        # whenever a backup is added to or removed from it
+        self._backups_cache: Dict[str, tuple] = {}
         
         # Create backup directory if it doesn't exist
         self.backup_root.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+    
+    @property
+    def _index_path(self) -> Path:
+        return self.backup_root / INDEX_FILE_NAME
+
+    def _load_index(self):
+        """Load the persisted metadata index, ignoring a missing or corrupt file."""
+        try:
+            with open(self._index_path, "rb") as f:
+                saved = json_loads(f.read())
+            self._index = OrderedDict(
+                (key, (tuple(entry["stamp"]), entry["metadata"]))
+                for key, entry in saved.items()
+            )
+        except Exception:
+            self._index = OrderedDict()
+        while len(self._index) > INDEX_MAX_ENTRIES:
+            self._index.popitem(last=False)
+
+    def _save_index(self):
+        """Atomically persist the metadata index if it changed."""
+        with self._index_lock:
+            if not self._index_dirty:
+                return
+            snapshot = {
+                key: {"stamp": list(stamp), "metadata": metadata}
+                for key, (stamp, metadata) in self._index.items()
+            }
+            self._index_dirty = False
+        tmp_path = self._index_path.with_name(f"{INDEX_FILE_NAME}.{uuid.uuid4().hex}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(json_dumps(snapshot, indent=False))
+            os.replace(tmp_path, self._index_path)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)  # The index is only a cache
     
-    def _compute_folder_hash(self, folder_path: Path) -> str:
+    def _hash_file(self, file_path: str, size: int = 0) -> bytes:
+        """Return the content digest of a single file."""
+        algo = self.hash_algo
+        if algo == "blake3" and size > BLAKE3_THREADED_MIN_SIZE and hasattr(_blake3, "update_mmap"):
+            # Hand the whole mapping to BLAKE3 so it can hash it across threads
+            return _new_hasher(size, algo).update_mmap(file_path).digest()
+        with open(file_path, 'rb') as f:
+            if 0 < size <= MMAP_MAX_SIZE:
+                # Zero-copy: the hasher reads straight from the page cache
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        hasher = _new_hasher(size, algo)
+                        with memoryview(mm) as view:
+                            hasher.update(view)
+                        return hasher.digest()
+                except (OSError, ValueError):
+                    f.seek(0)  # Not mappable (e.g. truncated meanwhile); stream it
+            if algo == "sha256" and hasattr(hashlib, "file_digest"):
+                # Python 3.11+: the read/update loop runs in C without the GIL
+                return hashlib.file_digest(f, _make_sha256).digest()
+            return _update_from_stream(_new_hasher(size, algo), f).digest()
+
+    @staticmethod
+    def _iter_files(root: Path):
         """
-        Compute a hash of the entire folder contents (like git tree hash).
-        This is used for deduplication - if hash is same, skip backup.
+        Walk a folder with os.scandir, yielding (rel_path, full_path, size,
+        mtime_ns) for every file. Reuses DirEntry's cached stat instead of
+        building Path objects per entry; symlinked directories are not followed.
         """
-        hasher = hashlib.sha256()
-        
-        # Get all files sorted by relative path for consistent hashing
-        all_files = sorted(folder_path.rglob("*"), key=lambda x: str(x.relative_to(folder_path)))
-        
-        for file_path in all_files:
-            if file_path.is_file():
-                # Add relative path to hash
-                rel_path = str(file_path.relative_to(folder_path))
-                hasher.update(rel_path.encode('utf-8'))
+        stack = [(str(root), "")]
+        while stack:
+            dir_path, rel_prefix = stack.pop()
+            try:
+                with os.scandir(dir_path) as it:
+                    for entry in it:
+                        rel_path = rel_prefix + entry.name
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append((entry.path, rel_path + os.sep))
+                            elif entry.is_file():
+                                st = entry.stat()
+                                yield rel_path, entry.path, st.st_size, st.st_mtime_ns
+                        except OSError:
+                            continue
+            except OSError:
+                continue  # Unreadable folder (or save path is a single file)
+
+    @staticmethod
+    def _iter_subdirs(root: Path):
+        """Yield (name, path) of the immediate subfolders of root via os.scandir."""
+        try:
+            with os.scandir(root) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir():
+                            yield entry.name, Path(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            return
+
+    def _choose_compression(self, files: List[tuple]) -> int:
+        """
+        Pick ZIP_DEFLATED or ZIP_STORED by test-compressing a sample of the
+        first few files. Encrypted or already-compressed saves barely shrink,
+        so deflating them only burns CPU.
+        """
+        compressor = zlib.compressobj(self.compression_level)
+        raw_size = 0
+        compressed_size = 0
+        for _rel_path, full_path, size, _mtime_ns in files[:COMPRESSION_PROBE_FILES]:
+            if size <= 0:
+                continue
+            try:
+                with open(full_path, 'rb') as f:
+                    sample = f.read(COMPRESSION_PROBE_BYTES)
+            except OSError:
+                continue
+            raw_size += len(sample)
+            compressed_size += len(compressor.compress(sample))
+        compressed_size += len(compressor.flush())
+
+        if raw_size == 0:
+            return zipfile.ZIP_DEFLATED
+        if raw_size / max(compressed_size, 1) < MIN_COMPRESSION_RATIO:
+            return zipfile.ZIP_STORED
+        return zipfile.ZIP_DEFLATED
+
+    def _compress_file(self, full_path: str, compression: int, size_hint: int = 0) -> tuple:
+        """
+        Read a file once and return (member_parts, crc, size, digest). The
+        parts, concatenated, can be written into a zip as-is; deflated data
+        is raw (no zlib header), as zip expects. They are not joined, which
+        would briefly hold the member twice. The digest matches _hash_file.
+        """
+        compressor = None
+        if compression == zipfile.ZIP_DEFLATED:
+            compressor = zlib.compressobj(self.compression_level, zlib.DEFLATED, -15)
+        hasher = _new_hasher(size_hint, self.hash_algo)
+        parts = []
+        crc = 0
+        size = 0
+        with open(full_path, 'rb') as f:
+            while chunk := f.read(COPY_CHUNK_SIZE):
+                hasher.update(chunk)
+                crc = zlib.crc32(chunk, crc)
+                size += len(chunk)
+                parts.append(compressor.compress(chunk) if compressor else chunk)
+        if compressor:
+            parts.append(compressor.flush())
+        return parts, crc, size, hasher.digest()
+
+    @staticmethod
+    def _write_precompressed(
+        zf: zipfile.ZipFile,
+        full_path: str,
+        arcname: str,
+        compression: int,
+        parts: List[bytes],
+        crc: int,
+        size: int,
+    ):
+        """
+        Append an already-compressed member to an open zip, or re-add the
+        file through the public ZipFile.write if this Python's zipfile
+        failed the _precompressed_writes_work round-trip check.
+        """
+        if not _precompressed_writes_work():
+            zf.write(full_path, arcname, compress_type=compression, compresslevel=zf.compresslevel)
+            return
+        zinfo = zipfile.ZipInfo.from_file(full_path, arcname)
+        zinfo.compress_type = compression
+        zinfo.CRC = crc
+        zinfo.file_size = size
+        zinfo.compress_size = sum(map(len, parts))
+        _append_precompressed(zf, zinfo, parts)
+
+    def _write_zip_backup(self, zip_path: Path, files: List[tuple], finish_metadata) -> Dict[str, Any]:
+        """
+        Write a zip backup, hashing files as they stream in. finish_metadata
+        receives the per-file digests and returns the metadata to embed.
+        """
+        # Stored if the data won't shrink
+        compression = self._choose_compression(files)
+        with zipfile.ZipFile(
+            zip_path, 'w', compression, compresslevel=self.compression_level
+        ) as zf:
+            # Add all files from save folder
+            metadata = finish_metadata(self._write_members(zf, files, compression))
+            
+            # Add metadata inside the zip
+            zf.writestr("_backup_info.json", json_dumps(metadata))
+        return metadata
+
+    def _write_tar_zst_backup(self, tar_path: Path, files: List[tuple], finish_metadata) -> Dict[str, Any]:
+        """
+        Stream save files into a zstd-compressed tar, hashing each file as
+        tarfile reads it. finish_metadata works as in _write_zip_backup; the
+        metadata member is written last, once the content hash is known.
+        """
+        compressor = _zstd.ZstdCompressor(level=self.zstd_level, threads=-1)
+        digests = []
+        with open(tar_path, 'wb') as fp, compressor.stream_writer(fp) as writer:
+            # dereference: symlinked save files are archived by content,
+            # matching what gets hashed
+            with tarfile.open(fileobj=writer, mode='w|', dereference=True) as tf:
+                for rel_path, full_path, size, _mtime_ns in files:
+                    tarinfo = tf.gettarinfo(full_path, arcname=rel_path.replace(os.sep, "/"))
+                    hasher = _new_hasher(size, self.hash_algo)
+                    with open(full_path, 'rb') as f:
+                        tf.addfile(tarinfo, _HashingReader(f, hasher))
+                    digests.append(hasher.digest())
                 
-                # Add file content hash
+                metadata = finish_metadata(digests)
+                info_bytes = json_dumps(metadata)
+                info = tarfile.TarInfo("_backup_info.json")
+                info.size = len(info_bytes)
+                info.mtime = int(time.time())
+                tf.addfile(info, io.BytesIO(info_bytes))
+        return metadata
+
+    @staticmethod
+    def _restore_tar_zst_backup(tar_path: Path, target_root: Path):
+        """Stream files out of a tar.zst backup in a single pass."""
+        if _zstd is None:
+            raise RuntimeError("Restoring .tar.zst backups requires the zstandard package")
+        with open(tar_path, 'rb') as fp, _zstd.ZstdDecompressor().stream_reader(fp) as reader:
+            with tarfile.open(fileobj=reader, mode='r|') as tf:
+                for member in tf:
+                    if member.name == "_backup_info.json":
+                        continue
+                    dest = (target_root / member.name).resolve()
+                    if target_root not in dest.parents:
+                        continue  # Never write outside the save folder
+                    if member.isdir():
+                        dest.mkdir(parents=True, exist_ok=True)
+                        continue
+                    if not member.isfile():
+                        continue  # Links and devices are never backed up
+                    dest.parent.mkdir(parents=True, exist_ok=True)
+                    with tf.extractfile(member) as src, open(dest, 'wb') as dst:
+                        shutil.copyfileobj(src, dst, COPY_CHUNK_SIZE)
+
+    @staticmethod
+    def _member_compression(rel_path: str, compression: int) -> int:
+        """Store files whose format is already compressed; deflating them is wasted CPU."""
+        if os.path.splitext(rel_path)[1].lower() in INCOMPRESSIBLE_EXTENSIONS:
+            return zipfile.ZIP_STORED
+        return compression
+
+    def _stream_member(
+        self,
+        zf: zipfile.ZipFile,
+        full_path: str,
+        arcname: str,
+        size: int,
+        compression: int,
+    ) -> bytes:
+        """
+        Stream a large file into the zip through zf.open, hashing the same
+        buffer on the way. Returns the file digest.
+        """
+        zinfo = zipfile.ZipInfo.from_file(full_path, arcname)
+        zinfo.compress_type = compression
+        _set_compress_level(zinfo, zf.compresslevel)
+        hasher = _new_hasher(size, self.hash_algo)
+        view = memoryview(bytearray(COPY_CHUNK_SIZE))
+        with open(full_path, 'rb') as src, zf.open(zinfo, 'w', force_zip64=True) as dst:
+            while n := src.readinto(view):
+                hasher.update(view[:n])
+                dst.write(view[:n])
+        return hasher.digest()
+
+    def _write_members(self, zf: zipfile.ZipFile, files: List[tuple], compression: int) -> List[bytes]:
+        """
+        Add save files to a zip, deflating them on worker threads (serially
+        for small folders). Members are written in the original order;
+        oversized files are streamed in on the calling thread. At most
+        COMPRESS_MAX_PENDING_BYTES of raw file data is compressed ahead of
+        the writer. Returns each file's digest, read in the same pass.
+        """
+        digests = []
+
+        def write(item, result: Optional[tuple]):
+            rel_path, full_path, size, _mtime_ns = item
+            member_compression = self._member_compression(rel_path, compression)
+            if result is None:
+                digests.append(self._stream_member(zf, full_path, rel_path, size, member_compression))
+            else:
+                parts, crc, file_size, digest = result
+                self._write_precompressed(zf, full_path, rel_path, member_compression, parts, crc, file_size)
+                digests.append(digest)
+
+        def compress(item) -> tuple:
+            rel_path, full_path, size, _mtime_ns = item
+            return self._compress_file(full_path, self._member_compression(rel_path, compression), size)
+
+        if COMPRESS_WORKERS <= 1 or len(files) < PARALLEL_COMPRESS_MIN_FILES:
+            for item in files:
+                write(item, None if item[2] > PARALLEL_COMPRESS_MAX_SIZE else compress(item))
+            return digests
+
+        pending = deque()  # (item, future or None for streamed files), in file order
+        pending_bytes = 0
+
+        def write_oldest():
+            nonlocal pending_bytes
+            item, future = pending.popleft()
+            if future is not None:
+                pending_bytes -= item[2]
+            write(item, future.result() if future is not None else None)
+
+        with ThreadPoolExecutor(max_workers=COMPRESS_WORKERS) as pool:
+            for item in files:
+                size = item[2]
+                if size > PARALLEL_COMPRESS_MAX_SIZE:
+                    pending.append((item, None))
+                    continue
+                while pending and pending_bytes + size > COMPRESS_MAX_PENDING_BYTES:
+                    write_oldest()
+                pending.append((item, pool.submit(compress, item)))
+                pending_bytes += size
+            while pending:
+                write_oldest()
+        return digests
+
+    @property
+    def _objects_dir(self) -> Path:
+        """Content-addressed store shared by all object-format backups."""
+        return self.backup_root / OBJECTS_DIR_NAME
+
+    def _object_path(self, digest_hex: str) -> Path:
+        """Location of an object in the store (fanned out by hash prefix)."""
+        return self._objects_dir / digest_hex[:2] / digest_hex
+
+    def _store_object(self, full_path: str, size: int, digest: Optional[bytes], level: int) -> tuple:
+        """
+        Make sure a file's content is in the object store and return
+        (digest_hex, stored_size). Content that is already stored is not
+        rewritten. New objects are hashed while they are written, so the key
+        always matches what ended up on disk even if the file changed since
+        the dedup hash was taken.
+        """
+        if digest is not None:
+            existing = self._object_path(digest.hex())
+            try:
+                return digest.hex(), existing.stat().st_size
+            except OSError:
+                pass
+
+        tmp_path = self._objects_dir / f".tmp-{uuid.uuid4().hex}"
+        hasher = _new_hasher(size, self.hash_algo)
+        compressor = zlib.compressobj(level)
+        try:
+            with open(full_path, 'rb') as src, open(tmp_path, 'wb') as dst:
+                while chunk := src.read(COPY_CHUNK_SIZE):
+                    hasher.update(chunk)
+                    dst.write(compressor.compress(chunk))
+                dst.write(compressor.flush())
+            digest_hex = hasher.hexdigest()
+            object_path = self._object_path(digest_hex)
+            object_path.parent.mkdir(exist_ok=True)
+            if object_path.exists():
+                tmp_path.unlink()
+            else:
+                os.replace(tmp_path, object_path)
+            return digest_hex, object_path.stat().st_size
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _put_object_bytes(self, data: bytes, level: int) -> tuple:
+        """Store an in-memory blob (a chunk) and return (digest_hex, stored_size)."""
+        hasher = _new_hasher(len(data), self.hash_algo)
+        hasher.update(data)
+        digest_hex = hasher.hexdigest()
+        object_path = self._object_path(digest_hex)
+        try:
+            return digest_hex, object_path.stat().st_size
+        except OSError:
+            pass
+
+        object_path.parent.mkdir(exist_ok=True)
+        tmp_path = self._objects_dir / f".tmp-{uuid.uuid4().hex}"
+        try:
+            with open(tmp_path, 'wb') as dst:
+                dst.write(zlib.compress(data, level))
+            os.replace(tmp_path, object_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return digest_hex, object_path.stat().st_size
+
+    def _store_chunks(self, full_path: str, level: int) -> tuple:
+        """
+        Split a large file with FastCDC and store each chunk as an object.
+        Returns (ordered chunk digests, stored size of those chunks).
+        """
+        chunk_hashes = []
+        stored_size = 0
+        for chunk in _fastcdc(
+            full_path,
+            min_size=CDC_MIN_CHUNK_SIZE,
+            avg_size=CDC_AVG_CHUNK_SIZE,
+            max_size=CDC_MAX_CHUNK_SIZE,
+            fat=True,
+        ):
+            digest_hex, object_size = self._put_object_bytes(bytes(chunk.data), level)
+            chunk_hashes.append(digest_hex)
+            stored_size += object_size
+        return chunk_hashes, stored_size
+
+    def _write_objects_backup(
+        self,
+        manifest_path: Path,
+        files: List[tuple],
+        digests: List[Optional[bytes]],
+        metadata: Dict[str, Any],
+    ) -> int:
+        """
+        Store save files in the object store and write the backup manifest.
+        Returns the total stored size of the objects the backup references.
+        """
+        level = self.compression_level
+        if self._choose_compression(files) == zipfile.ZIP_STORED:
+            level = 0  # Incompressible data: zlib just frames it
+
+        def store_one(args) -> tuple:
+            (_rel_path, full_path, size, _mtime_ns), digest = args
+            if _fastcdc is not None and size > CDC_MIN_FILE_SIZE:
+                chunk_hashes, object_size = self._store_chunks(full_path, level)
+                return {"chunks": chunk_hashes, "size": size}, object_size
+            digest_hex, object_size = self._store_object(full_path, size, digest, level)
+            return {"hash": digest_hex, "size": size}, object_size
+
+        self._objects_dir.mkdir(parents=True, exist_ok=True)
+        manifest_files = {}
+        stored_size = 0
+        with ThreadPoolExecutor(max_workers=COMPRESS_WORKERS) as pool:
+            stored = pool.map(store_one, zip(files, digests))
+            for (rel_path, _full_path, _size, _mtime_ns), (entry, object_size) in zip(files, stored):
+                manifest_files[rel_path.replace(os.sep, "/")] = entry
+                stored_size += object_size
+
+        manifest = dict(metadata)
+        manifest["stored_size"] = stored_size
+        manifest["files"] = manifest_files
+        self._write_manifest(manifest_path, manifest)
+        return stored_size
+
+    @staticmethod
+    def _write_manifest(manifest_path: Path, manifest: Dict[str, Any]):
+        """Atomically write a backup manifest."""
+        with atomic_write(manifest_path, "wb") as f:
+            f.write(json_dumps(manifest))
+
+    @staticmethod
+    def _load_manifest(manifest_path: Path) -> Dict[str, Any]:
+        """Read a backup manifest including its file list."""
+        with open(manifest_path, "rb") as f:
+            return json_loads(f.read())
+
+    def _restore_objects_backup(self, manifest_path: Path, target_root: Path):
+        """Rebuild a save folder from a manifest and the object store."""
+        manifest = self._load_manifest(manifest_path)
+        for arcname, entry in manifest.get("files", {}).items():
+            dest = (target_root / arcname).resolve()
+            if target_root not in dest.parents:
+                continue  # Never write outside the save folder
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            with open(dest, 'wb') as dst:
+                # Chunked files are the concatenation of their chunk objects
+                for digest_hex in entry.get("chunks") or [entry["hash"]]:
+                    decompressor = zlib.decompressobj()
+                    with open(self._object_path(digest_hex), 'rb') as src:
+                        while chunk := src.read(COPY_CHUNK_SIZE):
+                            dst.write(decompressor.decompress(chunk))
+                    dst.write(decompressor.flush())
+
+    def _manifest_objects(self, manifest_path: Path) -> Optional[set]:
+        """Object hashes a manifest references, or None if it can't be read."""
+        try:
+            manifest = self._load_manifest(manifest_path)
+            objects = set()
+            for entry in manifest.get("files", {}).values():
+                objects.update(entry.get("chunks") or [entry["hash"]])
+            return objects
+        except Exception:
+            return None
+
+    def _collect_garbage_objects(self, candidates: Optional[set] = None):
+        """
+        Delete objects that no manifest under the backup root references.
+        With `candidates` (the objects of just-deleted manifests), only those
+        are checked instead of walking the whole store, except every
+        GC_FULL_SWEEP_INTERVAL passes or once no manifests are left, when
+        the whole store is swept anyway.
+        """
+        if not self._objects_dir.exists():
+            return
+        with self._objects_lock:
+            referenced = set()
+            manifest_paths = []
+            for name, game_dir in self._iter_subdirs(self.backup_root):
+                if name.startswith("."):
+                    continue
                 try:
-                    with open(file_path, 'rb') as f:
-                        while chunk := f.read(65536):  # 64KB chunks
-                            hasher.update(chunk)
-                except Exception:
-                    pass  # Skip unreadable files
-        
-        return hasher.hexdigest()[:16]  # Short hash is enough for dedup
+                    with os.scandir(game_dir) as it:
+                        manifest_paths.extend(
+                            Path(entry.path) for entry in it if entry.name.endswith(MANIFEST_SUFFIX)
+                        )
+                except OSError:
+                    # Its manifests can't be seen, so any object might still be
+                    # in use; keep everything rather than fail the caller
+                    return
+            for manifest_path in manifest_paths:
+                objects = self._manifest_objects(manifest_path)
+                if objects is None:
+                    return  # Can't tell what is still in use; keep everything
+                referenced |= objects
+
+            if candidates is not None and manifest_paths:
+                self._gc_passes += 1
+                if self._gc_passes < GC_FULL_SWEEP_INTERVAL:
+                    for digest_hex in candidates - referenced:
+                        object_path = self._object_path(digest_hex)
+                        try:
+                            os.remove(object_path)
+                            os.rmdir(object_path.parent)  # Only succeeds once the fan-out folder is empty
+                        except OSError:
+                            pass
+                    return
+            self._gc_passes = 0
+
+            for rel_path, full_path, _size, _mtime_ns in self._iter_files(self._objects_dir):
+                name = os.path.basename(rel_path)
+                if name.startswith(".") or name in referenced:
+                    continue  # In use, or an in-flight temp file
+                try:
+                    os.remove(full_path)
+                except OSError:
+                    pass
+            for _name, fanout_dir in list(self._iter_subdirs(self._objects_dir)):
+                try:
+                    os.rmdir(fanout_dir)  # Empty fan-out folders only
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _compute_quick_signature(files: List[tuple]) -> str:
+        """
+        Hash the (path, size, mtime) listing of a folder without reading any
+        file contents. If it matches the latest backup, nothing has changed.
+        """
+        hasher = _make_sha256()
+        for rel_path, _full_path, size, mtime_ns in files:
+            hasher.update(f"{rel_path}|{size}|{mtime_ns}\n".encode('utf-8'))
+        return hasher.hexdigest()[:16]
+
+    @staticmethod
+    def _compute_layout_signature(files: List[tuple]) -> str:
+        """
+        Hash the (path, size) listing of a folder. If it matches the latest
+        backup but the quick signature doesn't, only mtimes moved, which
+        usually means a game rewrote identical saves.
+        """
+        hasher = _make_sha256()
+        for rel_path, _full_path, size, _mtime_ns in files:
+            hasher.update(f"{rel_path}|{size}\n".encode('utf-8'))
+        return hasher.hexdigest()[:16]
+
+    def _hash_files(self, files: List[tuple]) -> List[Optional[bytes]]:
+        """Return per-file digests for _iter_files entries (None if unreadable)."""
+        def hash_one(item) -> Optional[bytes]:
+            _rel_path, full_path, size, _mtime_ns = item
+            try:
+                return self._hash_file(full_path, size)
+            except Exception:
+                return None  # Skip unreadable files
+
+        # Hash files concurrently (hashlib releases the GIL); map keeps order
+        with ThreadPoolExecutor(max_workers=HASH_WORKERS) as pool:
+            return list(pool.map(hash_one, files))
+
+    def _compute_folder_hash(
+        self,
+        folder_path: Path,
+        files: Optional[List[tuple]] = None,
+        digests: Optional[List[Optional[bytes]]] = None,
+    ) -> str:
+        """
+        Compute a hash of the entire folder contents (like git tree hash).
+        This is used for deduplication - if hash is same, skip backup.
+        Pass `files` (sorted _iter_files output) and/or their `digests` to
+        reuse work that was already done.
+        """
+        hasher = _new_hasher(0, self.hash_algo)
+
+        # Sort by relative path for consistent hashing
+        if files is None:
+            files = sorted(self._iter_files(folder_path))
+        if digests is None:
+            digests = self._hash_files(files)
+
+        for (rel_path, _full_path, _size, _mtime_ns), digest in zip(files, digests):
+            # Tree hash of length-prefixed relative path + per-file digest, so
+            # no two different listings can feed the same byte stream
+            path_bytes = rel_path.encode('utf-8')
+            hasher.update(len(path_bytes).to_bytes(4, 'little'))
+            hasher.update(path_bytes)
+            hasher.update(b"\x01" + digest if digest is not None else b"\x00")
+
+        # 8 raw bytes are enough for dedup; base64 keeps the JSON field short
+        return base64.urlsafe_b64encode(hasher.digest()[:8]).rstrip(b'=').decode('ascii')
     
     def _get_latest_backup_hash(self, game_backup_dir: Path) -> Optional[str]:
         """Get the hash of the most recent backup for comparison"""
-        if not game_backup_dir.exists():
-            return None
-        
-        backups = sorted(
-            [d for d in game_backup_dir.iterdir() if d.is_dir() or d.suffix == '.zip'],
-            key=lambda x: x.stat().st_mtime,
-            reverse=True
-        )
-        
-        if not backups:
-            return None
-        
-        latest = backups[0]
-        
-        # Check for zip file
-        if latest.suffix == '.zip':
-            metadata_in_zip = self._read_metadata_from_zip(latest)
-            if metadata_in_zip:
-                return metadata_in_zip.get("content_hash")
-        else:
-            # Check for metadata file in folder
-            metadata_path = latest / "_backup_info.json"
-            if metadata_path.exists():
-                try:
-                    with open(metadata_path, "r", encoding="utf-8") as f:
-                        metadata = json.load(f)
-                    return metadata.get("content_hash")
-                except Exception:
-                    pass
+        metadata = self._get_latest_backup_metadata(game_backup_dir)
+        return metadata.get("content_hash") if metadata else None
+
+    def _get_latest_backup_metadata(self, game_backup_dir: Path) -> Optional[Dict[str, Any]]:
+        """Get the metadata of the most recent backup for comparison"""
+        latest = self._get_latest_backup(game_backup_dir)
+        return self._read_backup_metadata(latest) if latest else None
+
+    def _get_latest_backup(self, game_backup_dir: Path) -> Optional[Path]:
+        """Get the most recent backup (file or folder) in a game backup folder"""
+        backups = self._scan_backup_entries(game_backup_dir)
+        return backups[-1][0] if backups else None
+
+    def _scan_backup_entries(self, game_backup_dir: Path) -> List[tuple]:
+        """
+        List (path, is_dir, mtime_ns) for the backups in a game folder, oldest
+        first. Uses os.scandir so each entry is stat'ed at most once.
+        """
+        backups = []
+        try:
+            with os.scandir(game_backup_dir) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                        if self._is_backup_entry(entry.name, is_dir):
+                            backups.append((Path(entry.path), is_dir, entry.stat().st_mtime_ns))
+                    except OSError:
+                        continue
+        except OSError:
+            return []
+        backups.sort(key=lambda item: item[2])
+        return backups
+
+    def _read_backup_metadata(self, backup_path: Path) -> Optional[Dict[str, Any]]:
+        """Read metadata of any backup: zip, tar.zst, manifest or folder"""
+        # Check for zip file or object-store manifest
+        if backup_path.is_file():
+            return self._read_metadata_from_zip(backup_path)
         
+        # Check for metadata file in folder
+        metadata_path = backup_path / "_backup_info.json"
+        if metadata_path.exists():
+            try:
+                with open(metadata_path, "rb") as f:
+                    return json_loads(f.read())
+            except Exception:
+                pass
         return None
+
+    def _get_latest_backup_fingerprint(self, latest_metadata: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Quick (path, size, mtime) signature stored with the latest backup"""
+        return (latest_metadata or {}).get("last_signature")
+
+    def _store_fingerprint(self, backup_path: Path, signature: str, layout_signature: str):
+        """
+        Record new quick and layout signatures on an existing backup. Used
+        when the content matched but mtimes moved (a game rewrote identical
+        saves, or the backup predates the signatures), so the next run can
+        skip hashing again.
+        """
+        try:
+            if self._is_manifest(backup_path):
+                manifest = self._load_manifest(backup_path)
+                manifest["last_signature"] = signature
+                manifest["layout_signature"] = layout_signature
+                self._write_manifest(backup_path, manifest)
+            elif backup_path.is_file():
+                metadata = self._read_metadata_from_zip(backup_path)
+                if not metadata:
+                    return
+                metadata["last_signature"] = signature
+                metadata["layout_signature"] = layout_signature
+                self._write_sidecar(backup_path, metadata)
+            else:
+                return  # Legacy folder backups are left untouched
+            self._invalidate_metadata(backup_path)
+            self._save_index()
+        except Exception:
+            pass  # Only an optimization; the content hash still decides
     
+    @staticmethod
+    def _is_manifest(path: Path) -> bool:
+        """Whether a path is an object-store backup manifest."""
+        return path.name.endswith(MANIFEST_SUFFIX)
+
+    @staticmethod
+    def _is_backup_entry(name: str, is_dir: bool) -> bool:
+        """Whether a game backup folder entry is a backup (folder, zip or manifest)."""
+        if is_dir:
+            return not name.startswith(".")
+        return name.endswith((".zip", TAR_ZST_SUFFIX, MANIFEST_SUFFIX))
+
+    @staticmethod
+    def _archive_stem(path: Path) -> str:
+        """Backup name of a backup file (its name without the archive suffix)."""
+        for suffix in (TAR_ZST_SUFFIX, MANIFEST_SUFFIX):
+            if path.name.endswith(suffix):
+                return path.name[:-len(suffix)]
+        return path.stem
+
+    @classmethod
+    def _sidecar_path(cls, zip_path: Path) -> Path:
+        """Metadata file kept next to a zip or tar.zst backup (<backup>.json).
+
+        A manifest already is its own metadata file.
+        """
+        if cls._is_manifest(zip_path):
+            return zip_path
+        return zip_path.with_name(cls._archive_stem(zip_path) + ".json")
+
+    def _write_sidecar(self, zip_path: Path, metadata: Dict[str, Any]):
+        """Write a zip backup's metadata sidecar next to it."""
+        with atomic_write(self._sidecar_path(zip_path), "wb") as f:
+            f.write(json_dumps(metadata))
+
     def _read_metadata_from_zip(self, zip_path: Path) -> Optional[Dict[str, Any]]:
-        """Read metadata from inside a zip backup"""
+        """
+        Read metadata for a zip backup, preferring its sidecar file. Also
+        handles manifests, minus their file list.
+        Results are cached until the zip or its sidecar changes on disk.
+        """
+        sidecar_path = self._sidecar_path(zip_path)
+        try:
+            zip_mtime_ns = zip_path.stat().st_mtime_ns
+        except OSError:
+            return None
+        try:
+            sidecar_mtime_ns = sidecar_path.stat().st_mtime_ns
+        except OSError:
+            sidecar_mtime_ns = 0
+        stamp = (zip_mtime_ns, sidecar_mtime_ns)
+
+        key = str(zip_path)
+        with self._index_lock:
+            cached = self._index.get(key)
+            if cached and cached[0] == stamp:
+                self._index.move_to_end(key)
+                return dict(cached[1])  # Callers decorate the dict they get back
+
+        metadata = self._load_zip_metadata(zip_path, sidecar_path)
+        if metadata is not None:
+            with self._index_lock:
+                self._index[key] = (stamp, dict(metadata))
+                self._index.move_to_end(key)
+                while len(self._index) > INDEX_MAX_ENTRIES:
+                    self._index.popitem(last=False)
+                self._index_dirty = True
+        return metadata
+
+    def _invalidate_metadata(self, backup_path: Path):
+        """Drop a backup's cached metadata after it is changed or deleted."""
+        with self._index_lock:
+            if self._index.pop(str(backup_path), None) is not None:
+                self._index_dirty = True
+
+    def _load_zip_metadata(self, zip_path: Path, sidecar_path: Path) -> Optional[Dict[str, Any]]:
+        """Read zip backup metadata from disk (sidecar first, then the zip)."""
+        if sidecar_path.exists():
+            try:
+                with open(sidecar_path, "rb") as f:
+                    metadata = json_loads(f.read())
+                metadata.pop("files", None)  # Manifest file list isn't metadata
+                return metadata
+            except Exception:
+                pass  # Fall back to the copy inside the zip
+        if self._is_manifest(zip_path):
+            return None
+        if zip_path.name.endswith(TAR_ZST_SUFFIX):
+            return self._read_metadata_from_tar_zst(zip_path)
         try:
             with zipfile.ZipFile(zip_path, 'r') as zf:
                 if "_backup_info.json" in zf.namelist():
                     with zf.open("_backup_info.json") as f:
-                        return json.load(f)
+                        return json_loads(f.read())
+        except Exception:
+            pass
+        return None
+
+    @staticmethod
+    def _read_metadata_from_tar_zst(tar_path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Read the metadata member of a tar.zst backup. Only used when the
+        sidecar is missing: the member is last, so the whole stream is read.
+        """
+        if _zstd is None:
+            return None
+        try:
+            with open(tar_path, 'rb') as fp, _zstd.ZstdDecompressor().stream_reader(fp) as reader:
+                with tarfile.open(fileobj=reader, mode='r|') as tf:
+                    for member in tf:
+                        if member.name == "_backup_info.json":
+                            return json_loads(tf.extractfile(member).read())
         except Exception:
             pass
         return None
@@ -100,8 +1114,8 @@ class BackupEngine:
         name = (name or "").strip()
         if not name:
             return ""
-        safe = re.sub(r"[^\w\s-]", "", name)
-        safe = re.sub(r"\s+", " ", safe).strip()
+        safe = _NAME_STRIP.sub("", name)
+        safe = _WS.sub(" ", safe).strip()
         safe = safe.replace(" ", "_").strip("_-")
         return safe[:40]
 
@@ -130,11 +1144,13 @@ class BackupEngine:
         legacy_dir = self.backup_root / game_id
         if legacy_dir.exists():
             dirs.append(legacy_dir)
-        for candidate in self.backup_root.glob(f"*__{game_id}"):
-            if candidate.is_dir() and candidate not in dirs:
+        suffix = f"__{game_id}"
+        for name, candidate in self._iter_subdirs(self.backup_root):
+            if name.endswith(suffix) and candidate not in dirs:
                 dirs.append(candidate)
         return dirs
     
+    @_invalidates_backup_listing
     def backup_game(
         self,
         game_id: str,
@@ -175,26 +1191,61 @@ class BackupEngine:
         # Create game backup directory
         game_backup_dir = self._resolve_game_backup_dir(game_id, game_name)
         
-        # Compute content hash for deduplication
-        current_hash = self._compute_folder_hash(save_path)
+        # Walk once; the listing feeds the signature, the hash and the zip
+        files = sorted(self._iter_files(save_path))
+        quick_signature = self._compute_quick_signature(files)
+        skipped_result = {
+            "success": True,
+            "error": None,
+            "backup_path": None,
+            "backup_name": None,
+            "skipped": True,
+            "message": "No changes detected - backup skipped (identical to latest)"
+        }
         
-        # Check if we already have this exact backup (deduplication)
-        if not force:
-            latest_hash = self._get_latest_backup_hash(game_backup_dir)
+        # Cheap check first: same paths, sizes and mtimes as the latest backup
+        latest_backup = None if force else self._get_latest_backup(game_backup_dir)
+        latest_metadata = self._read_backup_metadata(latest_backup) if latest_backup else None
+        if self._get_latest_backup_fingerprint(latest_metadata) == quick_signature:
+            return skipped_result
+        
+        latest_hash = (latest_metadata or {}).get("content_hash")
+        layout_signature = self._compute_layout_signature(files)
+        latest_layout = (latest_metadata or {}).get("layout_signature")
+        digests = None
+        current_hash = None
+        # Archive formats hash while compressing, so each file is only read
+        # once. When only mtimes moved (or the latest backup predates layout
+        # signatures) the content is probably unchanged, so hash first rather
+        # than compress a whole archive just to drop it.
+        if self.archive_format == "objects" or (
+            latest_hash and latest_layout in (None, layout_signature)
+        ):
+            digests = self._hash_files(files)
+            current_hash = self._compute_folder_hash(save_path, files, digests)
+            
+            # Check if we already have this exact backup (deduplication)
             if latest_hash and latest_hash == current_hash:
-                return {
-                    "success": True,
-                    "error": None,
-                    "backup_path": None,
-                    "backup_name": None,
-                    "skipped": True,
-                    "message": "No changes detected - backup skipped (identical to latest)"
-                }
+                self._store_fingerprint(latest_backup, quick_signature, layout_signature)
+                return skipped_result
         
         # Create timestamped backup
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if self.archive_format == "objects":
+            suffix = MANIFEST_SUFFIX
+        elif self.archive_format == "tar.zst":
+            suffix = TAR_ZST_SUFFIX
+        else:
+            suffix = ".zip"
+        # Two backups in the same second must not overwrite each other (an
+        # overwritten manifest would also orphan the objects it referenced)
         backup_name = f"{game_id}_{timestamp}"
-        zip_path = game_backup_dir / f"{backup_name}.zip"
+        zip_path = game_backup_dir / f"{backup_name}{suffix}"
+        serial = 1
+        while zip_path.exists():
+            serial += 1
+            backup_name = f"{game_id}_{timestamp}_{serial}"
+            zip_path = game_backup_dir / f"{backup_name}{suffix}"
         
         try:
             display_name = (display_name or "").strip()
@@ -211,22 +1262,44 @@ class BackupEngine:
                 "display_name": display_name,
                 "collection_id": collection_id,
                 "content_hash": current_hash,
-                "compression": "zip"
+                "last_signature": quick_signature,
+                "layout_signature": layout_signature,
+                "compression": self.archive_format
             }
             
-            # Create compressed backup
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=9) as zf:
-                # Add all files from save folder
-                for file_path in save_path.rglob("*"):
-                    if file_path.is_file():
-                        arcname = file_path.relative_to(save_path)
-                        zf.write(file_path, arcname)
+            if self.archive_format == "objects":
+                # Only content the store hasn't seen yet is written
+                with self._objects_lock:
+                    compressed_size = self._write_objects_backup(zip_path, files, digests, metadata)
+            else:
+                # Create compressed backup in a temp file; it is dropped if
+                # the content turns out to match the latest backup
+                def finish_metadata(file_digests):
+                    metadata["content_hash"] = self._compute_folder_hash(save_path, files, file_digests)
+                    return metadata
                 
-                # Add metadata inside the zip
-                zf.writestr("_backup_info.json", json.dumps(metadata, indent=2))
-            
-            # Get compressed size
-            compressed_size = zip_path.stat().st_size
+                tmp_path = zip_path.with_name(zip_path.name + ".tmp")
+                try:
+                    if self.archive_format == "tar.zst":
+                        self._write_tar_zst_backup(tmp_path, files, finish_metadata)
+                    else:
+                        self._write_zip_backup(tmp_path, files, finish_metadata)
+                    current_hash = metadata["content_hash"]
+                    
+                    # Check if we already have this exact backup (deduplication)
+                    if latest_hash and latest_hash == current_hash:
+                        tmp_path.unlink()
+                        self._store_fingerprint(latest_backup, quick_signature, layout_signature)
+                        return skipped_result
+                    os.replace(tmp_path, zip_path)
+                finally:
+                    tmp_path.unlink(missing_ok=True)
+                
+                # Sidecar copy so metadata edits never rewrite the archive
+                self._write_sidecar(zip_path, metadata)
+                
+                # Get compressed size
+                compressed_size = zip_path.stat().st_size
             
             # Apply rolling backup limit
             self._apply_rolling_limit(
@@ -236,6 +1309,10 @@ class BackupEngine:
                 retention_limit=retention_limit,
             )
             
+            # Index the new backup so the next listing doesn't open it
+            self._read_metadata_from_zip(zip_path)
+            self._save_index()
+            
             return {
                 "success": True,
                 "error": None,
@@ -253,6 +1330,10 @@ class BackupEngine:
             # Clean up failed backup
             if zip_path.exists():
                 zip_path.unlink()
+            self._sidecar_path(zip_path).unlink(missing_ok=True)
+            if self.archive_format == "objects":
+                # Objects written before the failure belong to no manifest
+                self._collect_garbage_objects()
             
             return {
                 "success": False,
@@ -263,17 +1344,7 @@ class BackupEngine:
     
     def _get_backup_collection_id(self, backup_path: Path) -> str:
         """Read the collection id from a backup's metadata."""
-        metadata = None
-        if backup_path.suffix == ".zip":
-            metadata = self._read_metadata_from_zip(backup_path)
-        elif backup_path.is_dir():
-            metadata_path = backup_path / "_backup_info.json"
-            if metadata_path.exists():
-                try:
-                    with open(metadata_path, "r", encoding="utf-8") as f:
-                        metadata = json.load(f)
-                except Exception:
-                    metadata = None
+        metadata = self._read_backup_metadata(backup_path)
         return (metadata or {}).get("collection_id") or "default"
 
     def _apply_rolling_limit(
@@ -300,79 +1371,136 @@ class BackupEngine:
         if retention_limit <= 0:
             return
 
-        # Get all backup files/folders
-        backups = [
-            item for item in game_backup_dir.iterdir()
-            if (item.is_dir() and not item.name.startswith(".")) or item.suffix == ".zip"
-        ]
-
+        # Get all backup files/folders, sorted by modification time (oldest first)
         target_collection = collection_id or "default"
         collection_backups = [
-            item for item in backups
+            (item, is_dir)
+            for item, is_dir, _mtime_ns in self._scan_backup_entries(game_backup_dir)
             if self._get_backup_collection_id(item) == target_collection
         ]
 
-        # Sort by modification time (oldest first)
-        collection_backups.sort(key=lambda x: x.stat().st_mtime)
-
         # Delete oldest backups if we exceed limit
-        while len(collection_backups) > retention_limit:
-            oldest = collection_backups.pop(0)
+        removed_manifest = False
+        orphan_candidates: Optional[set] = set()
+        excess = len(collection_backups) - retention_limit
+        for oldest, is_dir in collection_backups[:max(excess, 0)]:
             try:
-                if oldest.is_dir():
+                if is_dir:
                     shutil.rmtree(oldest)
                 else:
+                    if self._is_manifest(oldest):
+                        objects = self._manifest_objects(oldest)
+                        if objects is None or orphan_candidates is None:
+                            orphan_candidates = None  # Unknown; sweep the whole store
+                        else:
+                            orphan_candidates |= objects
                     oldest.unlink()
+                    self._sidecar_path(oldest).unlink(missing_ok=True)
+                    self._invalidate_metadata(oldest)
+                    removed_manifest = removed_manifest or self._is_manifest(oldest)
             except Exception:
                 pass  # Ignore deletion errors
+        
+        if removed_manifest:
+            self._collect_garbage_objects(orphan_candidates)
     
     def get_backups(self, game_id: str) -> List[Dict[str, Any]]:
         """Get list of backups for a game"""
-        
+        backups, _ = self._backup_listing(game_id)
+        return [dict(backup) for backup in backups]
+    
+    def get_backup_collection_ids(self, game_id: str) -> List[str]:
+        """
+        Get the collection ID of each backup of a game, in get_backups order.
+        Cheaper than get_backups when only collection membership is needed,
+        as no backup dicts are copied.
+        """
+        _, collection_ids = self._backup_listing(game_id)
+        return list(collection_ids)
+    
+    def _backup_listing(self, game_id: str) -> tuple:
+        """
+        Get (backups, collection IDs) for a game, newest first, from the
+        cache when the backup folders are unchanged. Both are shared with
+        the cache and must not be modified.
+        """
         game_backup_dirs = self._find_game_backup_dirs(game_id)
         if not game_backup_dirs:
-            return []
+            return (), ()
+        
+        try:
+            stamp = tuple((str(d), d.stat().st_mtime_ns) for d in game_backup_dirs)
+        except OSError:
+            stamp = None
+        cached = self._backups_cache.get(game_id)
+        if stamp is not None and cached and cached[0] == stamp:
+            return cached[1], cached[2]
         
         backups = []
+        zip_entries = []
         
         for game_backup_dir in game_backup_dirs:
-            for item in sorted(game_backup_dir.iterdir(), key=lambda x: x.stat().st_mtime, reverse=True):
-                metadata = None
-                item_stat = item.stat()
+            try:
+                with os.scandir(game_backup_dir) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            
+            for entry in entries:
+                try:
+                    # DirEntry caches the stat, so it is only fetched once
+                    item_stat = entry.stat()
+                    is_dir = entry.is_dir()
+                except OSError:
+                    continue
                 
-                if item.suffix == '.zip':
-                    # Read from zip
-                    metadata = self._read_metadata_from_zip(item)
-                    if metadata:
-                        metadata.setdefault("display_name", "")
-                        metadata.setdefault("collection_id", "default")
-                        metadata["path"] = str(item)
-                        metadata["size"] = item_stat.st_size
-                        metadata["is_compressed"] = True
-                        metadata["_sort_mtime"] = item_stat.st_mtime
-                        backups.append(metadata)
+                if not is_dir and self._is_backup_entry(entry.name, is_dir):
+                    zip_entries.append((entry, item_stat))
                 
-                elif item.is_dir():
+                elif is_dir:
                     # Read from folder
-                    metadata_path = item / "_backup_info.json"
+                    metadata_path = Path(entry.path) / "_backup_info.json"
                     if metadata_path.exists():
                         try:
-                            with open(metadata_path, "r", encoding="utf-8") as f:
-                                metadata = json.load(f)
+                            with open(metadata_path, "rb") as f:
+                                metadata = json_loads(f.read())
                             metadata.setdefault("display_name", "")
                             metadata.setdefault("collection_id", "default")
-                            metadata["path"] = str(item)
-                            metadata["size"] = self._get_folder_size(item)
+                            metadata["path"] = entry.path
+                            metadata["size"] = self._get_folder_size(Path(entry.path))
                             metadata["is_compressed"] = False
-                            metadata["_sort_mtime"] = item_stat.st_mtime
+                            metadata["_sort_mtime"] = item_stat.st_mtime_ns
                             backups.append(metadata)
                         except Exception:
                             pass
         
+        # Read zip metadata concurrently; opening archives is mostly I/O wait
+        if zip_entries:
+            with ThreadPoolExecutor(max_workers=METADATA_WORKERS) as pool:
+                zip_metadata = pool.map(
+                    lambda item: self._read_metadata_from_zip(Path(item[0].path)),
+                    zip_entries,
+                )
+                for (entry, item_stat), metadata in zip(zip_entries, zip_metadata):
+                    if metadata:
+                        metadata.setdefault("display_name", "")
+                        metadata.setdefault("collection_id", "default")
+                        metadata["path"] = entry.path
+                        metadata["size"] = metadata.get("stored_size", item_stat.st_size)
+                        metadata["is_compressed"] = True
+                        metadata["_sort_mtime"] = item_stat.st_mtime_ns
+                        backups.append(metadata)
+        
+        self._save_index()
+        
         backups.sort(key=lambda x: x.get("_sort_mtime", 0), reverse=True)
         for backup in backups:
             backup.pop("_sort_mtime", None)
-        return backups
+        backups = tuple(backups)
+        collection_ids = tuple(backup.get("collection_id") or "default" for backup in backups)
+        if stamp is not None:
+            self._backups_cache[game_id] = (stamp, backups, collection_ids)
+        return backups, collection_ids
     
     def restore_backup(self, backup_path: str, target_path: str) -> Dict[str, Any]:
         """
@@ -398,31 +1526,54 @@ class BackupEngine:
             # Create a safety backup of current saves before restoring
             if target_path.exists():
                 safety_backup = target_path.parent / f"{target_path.name}_pre_restore_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-                shutil.copytree(target_path, safety_backup)
-                shutil.rmtree(target_path)
+                try:
+                    # Same filesystem: moving the folder aside is instant
+                    target_path.rename(safety_backup)
+                except OSError as e:
+                    # The safety copy is a sibling, so EXDEV only happens when
+                    # the save folder is itself a mount point; copy it aside
+                    # then. Anything else (e.g. files locked by a running
+                    # game) would fail the delete too, so surface it before
+                    # touching the saves.
+                    if e.errno != errno.EXDEV:
+                        raise
+                    shutil.copytree(target_path, safety_backup, symlinks=True)
+                    shutil.rmtree(target_path)
             
             # Ensure target directory exists
             target_path.mkdir(parents=True, exist_ok=True)
             
-            if backup_path.suffix == '.zip':
-                # Extract from zip
+            if self._is_manifest(backup_path):
+                self._restore_objects_backup(backup_path, target_path.resolve())
+            elif backup_path.name.endswith(TAR_ZST_SUFFIX):
+                self._restore_tar_zst_backup(backup_path, target_path.resolve())
+            elif backup_path.suffix == '.zip':
+                # Stream members out of the zip in a single pass
+                target_root = target_path.resolve()
                 with zipfile.ZipFile(backup_path, 'r') as zf:
-                    for member in zf.namelist():
+                    for info in zf.infolist():
                         # Skip metadata file
-                        if member == "_backup_info.json":
+                        if info.filename == "_backup_info.json":
                             continue
-                        zf.extract(member, target_path)
+                        dest = (target_root / info.filename).resolve()
+                        if target_root not in dest.parents:
+                            continue  # Never write outside the save folder
+                        if info.is_dir():
+                            dest.mkdir(parents=True, exist_ok=True)
+                            continue
+                        dest.parent.mkdir(parents=True, exist_ok=True)
+                        with zf.open(info) as src, open(dest, 'wb') as dst:
+                            shutil.copyfileobj(src, dst, COPY_CHUNK_SIZE)
             else:
-                # Copy from folder (excluding metadata file)
-                for item in backup_path.iterdir():
-                    if item.name == "_backup_info.json":
-                        continue
-                    
-                    dest = target_path / item.name
-                    if item.is_dir():
-                        shutil.copytree(item, dest)
-                    else:
-                        shutil.copy2(item, dest)
+                # Copy from folder in one copytree, which lets shutil use its
+                # zero-copy fast paths per file. Only the top-level metadata
+                # file is skipped; a save file of that name deeper down is kept.
+                shutil.copytree(
+                    backup_path,
+                    target_path,
+                    dirs_exist_ok=True,
+                    ignore=lambda d, names: ["_backup_info.json"] if Path(d) == backup_path else [],
+                )
             
             return {
                 "success": True,
@@ -436,6 +1587,7 @@ class BackupEngine:
                 "error": str(e)
             }
 
+    @_invalidates_backup_listing
     def rename_backup(
         self,
         backup_path: str,
@@ -452,37 +1604,43 @@ class BackupEngine:
 
         display_name = (display_name or "").strip()
 
-        if backup_path.suffix == ".zip":
+        if self._is_manifest(backup_path):
+            try:
+                manifest = self._load_manifest(backup_path)
+                manifest["display_name"] = display_name
+                if collection_id is not None:
+                    manifest["collection_id"] = collection_id or "default"
+                self._write_manifest(backup_path, manifest)
+                self._invalidate_metadata(backup_path)
+                self._save_index()
+                return {"success": True, "error": None}
+            except Exception as e:
+                return {"success": False, "error": str(e)}
+
+        if backup_path.is_file():
             metadata = self._read_metadata_from_zip(backup_path) or {}
-            metadata.setdefault("backup_name", backup_path.stem)
+            metadata.setdefault("backup_name", self._archive_stem(backup_path))
             metadata.setdefault("backup_time", datetime.now().isoformat())
             metadata["display_name"] = display_name
             if collection_id is not None:
                 metadata["collection_id"] = collection_id or "default"
 
-            tmp_path = backup_path.with_name(backup_path.name + ".tmp")
+            # Only the sidecar changes; it takes precedence over the
+            # (now stale) copy inside the archive, so nothing is recompressed
             try:
-                with zipfile.ZipFile(backup_path, "r") as src, zipfile.ZipFile(
-                    tmp_path, "w", zipfile.ZIP_DEFLATED, compresslevel=9
-                ) as dst:
-                    for item in src.infolist():
-                        if item.filename == "_backup_info.json":
-                            continue
-                        dst.writestr(item, src.read(item.filename))
-                    dst.writestr("_backup_info.json", json.dumps(metadata, indent=2))
-                tmp_path.replace(backup_path)
+                self._write_sidecar(backup_path, metadata)
+                self._invalidate_metadata(backup_path)
+                self._save_index()
                 return {"success": True, "error": None}
             except Exception as e:
-                if tmp_path.exists():
-                    tmp_path.unlink()
                 return {"success": False, "error": str(e)}
 
         metadata_path = backup_path / "_backup_info.json"
         metadata = {}
         if metadata_path.exists():
             try:
-                with open(metadata_path, "r", encoding="utf-8") as f:
-                    metadata = json.load(f)
+                with open(metadata_path, "rb") as f:
+                    metadata = json_loads(f.read())
             except Exception:
                 metadata = {}
         metadata["display_name"] = display_name
@@ -490,12 +1648,13 @@ class BackupEngine:
             metadata["collection_id"] = collection_id or "default"
 
         try:
-            with open(metadata_path, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, indent=2)
+            with atomic_write(metadata_path, "wb") as f:
+                f.write(json_dumps(metadata))
             return {"success": True, "error": None}
         except Exception as e:
             return {"success": False, "error": str(e)}
     
+    @_invalidates_backup_listing
     def delete_backup(self, backup_path: str) -> Dict[str, Any]:
         """Delete a specific backup"""
         
@@ -510,21 +1669,25 @@ class BackupEngine:
             if backup_path.is_dir():
                 shutil.rmtree(backup_path)
             else:
+                # Objects this manifest used are the only ones it can orphan
+                orphan_candidates = (
+                    self._manifest_objects(backup_path) if self._is_manifest(backup_path) else None
+                )
                 backup_path.unlink()
+                if self._is_manifest(backup_path):
+                    self._invalidate_metadata(backup_path)
+                    self._collect_garbage_objects(orphan_candidates)
+                elif self._is_backup_entry(backup_path.name, False):
+                    self._sidecar_path(backup_path).unlink(missing_ok=True)
+                    self._invalidate_metadata(backup_path)
+                self._save_index()
             return {"success": True, "error": None}
         except Exception as e:
             return {"success": False, "error": str(e)}
     
     def _get_folder_size(self, path: Path) -> int:
         """Get total size of a folder in bytes"""
-        total = 0
-        try:
-            for entry in path.rglob("*"):
-                if entry.is_file():
-                    total += entry.stat().st_size
-        except Exception:
-            pass
-        return total
+        return sum(size for _rel, _full, size, _mtime_ns in self._iter_files(path))
     
     @staticmethod
     def format_size(size_bytes: int) -> str:
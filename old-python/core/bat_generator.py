@@ -4,6 +4,8 @@ GameVault - Game Save Backup Tool
 """
 
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -11,6 +13,10 @@ from typing import Optional
 class BatGenerator:
     """Generates .bat files for quick backup shortcuts"""
     
+    # Anything but letters, digits, "_", " " and "-" (\w is Unicode-aware,
+    # like str.isalnum, so non-Latin game names keep their letters)
+    _SAFE_RE = re.compile(r"[^\w \-]+")
+    
     BAT_TEMPLATE = '''@echo off
 title GameVault - {game_name} Backup
 echo ============================================
@@ -63,6 +69,12 @@ pause
         self.app_dir = Path(app_dir)
         self.exe_path = Path(exe_path) if exe_path else None
     
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _safe_name(game_name: str) -> str:
+        """Clean a game name for use in a filename"""
+        return BatGenerator._SAFE_RE.sub("", game_name).strip()
+    
     def generate_bat(
         self, 
         game_id: str, 
@@ -84,8 +96,7 @@ pause
         output_dir.mkdir(parents=True, exist_ok=True)
         
         # Clean game name for filename
-        safe_name = "".join(c for c in game_name if c.isalnum() or c in " _-").strip()
-        bat_filename = f"Backup_{safe_name}.bat"
+        bat_filename = f"Backup_{self._safe_name(game_name)}.bat"
         bat_path = output_dir / bat_filename
         
         # Use exe template if exe exists, otherwise python template
@@ -141,8 +152,7 @@ pause
         """Delete a .bat file for a game"""
         output_dir = Path(output_dir) if output_dir else self.app_dir
         
-        safe_name = "".join(c for c in game_name if c.isalnum() or c in " _-").strip()
-        bat_filename = f"Backup_{safe_name}.bat"
+        bat_filename = f"Backup_{self._safe_name(game_name)}.bat"
         bat_path = output_dir / bat_filename
         
         if bat_path.exists():
@@ -3,14 +3,23 @@ GameVault - Configuration Manager
 Handles loading and saving user configuration.
 """
 
+import copy
 import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from .fileio import atomic_write_bytes, json_dumps, json_loads
+
 # Default config
 DEFAULT_CONFIG = {
     "backup_directory": "",
     "max_backups": 10,
+    "archive_format": "zip",
+    "compression_level": 6,
+    "zstd_level": 3,
+    "hash_algo": "xxh3",
     "user_games": [],
     "backup_collections": {},
     "theme": "dark",
@@ -36,6 +45,56 @@ class ConfigManager:
         
         self.config_dir.mkdir(parents=True, exist_ok=True)
         self.config_file = self.config_dir / "config.json"
+        
+        # Parsed config, reused until config.json changes on disk, plus the
+        # same config as compact JSON that load_config copies from
+        self._cache: Optional[Dict[str, Any]] = None
+        self._cache_blob = b""
+        self._cache_mtime: Optional[tuple] = None
+        # Guards the cache fields above; background saves invalidate them
+        self._cache_lock = threading.RLock()
+        
+        # Values set inside a `with config_manager:` block, written on exit
+        self._pending: Optional[Dict[str, Any]] = None
+        self._batch_depth = 0
+        
+        # One worker, so background saves land on disk in the order made
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._last_save: Optional[Future] = None
+    
+    def _file_stamp(self) -> Optional[tuple]:
+        """Get (mtime_ns, size) of config.json, or None if it doesn't exist."""
+        try:
+            st = self.config_file.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+    
+    def _cached_config(self) -> Dict[str, Any]:
+        """Get the parsed config, re-reading the file only if it changed.
+        
+        Returns:
+            The cached configuration dictionary. Callers must not mutate it.
+        """
+        with self._cache_lock:
+            stamp = self._file_stamp()
+            if self._cache is not None and stamp == self._cache_mtime:
+                return self._cache
+            
+            config = copy.deepcopy(DEFAULT_CONFIG)
+            
+            if stamp is not None:
+                try:
+                    with open(self.config_file, "rb") as f:
+                        saved = json_loads(f.read())
+                        config.update(saved)
+                except (json.JSONDecodeError, IOError) as e:
+                    print(f"Warning: Could not load config: {e}")
+            
+            self._cache = config
+            self._cache_blob = json_dumps(config, indent=False)
+            self._cache_mtime = stamp
+            return config
     
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from disk.
@@ -43,17 +102,15 @@ class ConfigManager:
         Returns:
             Configuration dictionary with defaults filled in.
         """
-        config = DEFAULT_CONFIG.copy()
-        
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, "r", encoding="utf-8") as f:
-                    saved = json.load(f)
-                    config.update(saved)
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Warning: Could not load config: {e}")
-        
-        return config
+        with self._cache_lock:
+            config = self._cached_config()
+            blob = self._cache_blob
+        if self._pending:
+            # Deep copy so callers can edit nested lists/dicts freely
+            return copy.deepcopy({**config, **self._pending})
+        # Re-parsing the compact JSON is a much cheaper deep copy than
+        # copy.deepcopy (C parser instead of a Python-level walk)
+        return json_loads(blob)
     
     def save_config(self, config: Dict[str, Any]) -> bool:
         """Save configuration to disk.
@@ -64,14 +121,46 @@ class ConfigManager:
         Returns:
             True if saved successfully.
         """
+        self.wait_for_saves()  # Don't let an older background write land after this one
+        return self._write_config(json_dumps(config))
+    
+    def save_config_async(self, config: Dict[str, Any]) -> Future:
+        """Save configuration to disk on a background thread.
+        
+        The config is serialized before returning, so the caller may keep
+        editing it; only the file write happens in the background.
+        
+        Args:
+            config: Configuration dictionary to save.
+            
+        Returns:
+            Future resolving to True if saved successfully.
+        """
+        data = json_dumps(config)
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(max_workers=1)
+        self._last_save = self._writer.submit(self._write_config, data)
+        return self._last_save
+    
+    def _write_config(self, data: bytes) -> bool:
         try:
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                json.dump(config, f, indent=2)
+            # Written outside the lock, so readers on the UI thread never wait
+            # on the disk. Clearing afterwards also drops anything a reader
+            # cached from the old file meanwhile.
+            atomic_write_bytes(self.config_file, data)
+            with self._cache_lock:
+                self._cache = None  # Re-read (and re-merge defaults) on next access
             return True
         except IOError as e:
             print(f"Error saving config: {e}")
             return False
     
+    def wait_for_saves(self) -> None:
+        """Block until every save_config_async write has finished."""
+        last = self._last_save
+        if last is not None:
+            last.result()
+    
     def get(self, key: str, default: Any = None) -> Any:
         """Get a config value.
         
@@ -82,8 +171,9 @@ class ConfigManager:
         Returns:
             Config value or default.
         """
-        config = self.load_config()
-        return config.get(key, default)
+        if self._pending and key in self._pending:
+            return copy.deepcopy(self._pending[key])
+        return copy.deepcopy(self._cached_config().get(key, default))
     
     def set(self, key: str, value: Any) -> bool:
         """Set a config value.
@@ -95,10 +185,43 @@ class ConfigManager:
         Returns:
             True if saved successfully.
         """
+        return self.update({key: value})
+    
+    def update(self, values: Optional[Dict[str, Any]] = None, **kwargs: Any) -> bool:
+        """Set several config values with a single write.
+        
+        Args:
+            values: Mapping of config keys to values.
+            **kwargs: More keys to set.
+            
+        Returns:
+            True if saved successfully (always True inside a batch).
+        """
+        changes = dict(values or {}, **kwargs)
+        if self._pending is not None:
+            self._pending.update(changes)
+            return True
+        
         config = self.load_config()
-        config[key] = value
+        config.update(changes)
         return self.save_config(config)
     
+    def __enter__(self) -> "ConfigManager":
+        """Start a batch: set()/update() are held in memory until exit."""
+        if self._batch_depth == 0:
+            self._pending = {}
+        self._batch_depth += 1
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        """End a batch, writing its changes once (dropped on an exception)."""
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            pending, self._pending = self._pending, None
+            if pending and exc_type is None:
+                self.update(pending)
+        return False
+    
     def reset(self) -> bool:
         """Reset config to defaults.
         
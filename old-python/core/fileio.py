@@ -0,0 +1,90 @@
+"""
+GameVault - File I/O helpers
+Shared helpers for writing files safely and for fast JSON.
+"""
+
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any, Iterator, Optional, Union
+
+try:
+    import orjson as _orjson  # type: ignore
+except ImportError:
+    _orjson = None
+
+
+@contextmanager
+def atomic_write(
+    target: Path, mode: str = "w", encoding: Optional[str] = "utf-8", buffering: int = -1
+) -> Iterator[IO]:
+    """Write a file atomically.
+
+    Data goes to `<target>.tmp`, which replaces the target in a single
+    rename once the block finishes. A crash or exception mid-write leaves
+    the old file untouched instead of a truncated one.
+
+    Args:
+        target: File to write.
+        mode: "w" for text or "wb" for binary.
+        encoding: Text encoding (ignored in binary mode).
+        buffering: Passed to open(); 0 gives an unbuffered binary file.
+
+    Yields:
+        The open temp file.
+    """
+    target = Path(target)
+    tmp_path = target.with_name(target.name + ".tmp")
+    if "b" in mode:
+        encoding = None
+    try:
+        with open(tmp_path, mode, buffering, encoding=encoding) as f:
+            yield f
+        os.replace(tmp_path, target)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write_bytes(target: Path, data: bytes) -> None:
+    """Atomically replace target with data in one unbuffered write.
+
+    Cheaper than atomic_write for a payload that is already in memory
+    (such as json_dumps output): no buffered wrapper copies the bytes, and
+    the temp file sees a single write call, so antivirus and sync tools
+    scan it once rather than per buffer flush.
+    """
+    with atomic_write(target, "wb", buffering=0) as f:
+        view = memoryview(data)
+        while view:
+            view = view[f.write(view):]  # Raw writes may be partial
+
+
+def json_dumps(obj: Any, indent: bool = True) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when installed.
+
+    Args:
+        obj: Object to serialize.
+        indent: Pretty-print with two-space indentation; False gives
+            the most compact form.
+    """
+    if _orjson is not None:
+        return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    # No spaces after separators, matching orjson's compact output
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON bytes or text, using orjson when installed.
+
+    Both backends raise a json.JSONDecodeError subclass on bad input.
+    """
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
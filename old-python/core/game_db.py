@@ -4,9 +4,15 @@ Manages the database of known games and their save paths.
 """
 
 import json
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .fileio import json_loads
+
+# Distinct search queries remembered by GameDatabase.search_games
+SEARCH_CACHE_SIZE = 256
+
 
 class GameDatabase:
     """Game database for searching and managing known games."""
@@ -25,18 +31,35 @@ class GameDatabase:
         
         self.games_file = self.data_dir / "games.json"
         self._games: List[Dict[str, Any]] = []
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._search_index: List[tuple] = []
+        # (lowercased query, limit) -> matching games, most recently used last;
+        # typing and backspacing repeats the same prefixes
+        self._search_cache: "OrderedDict[tuple, List[Dict[str, Any]]]" = OrderedDict()
         self._load()
     
     def _load(self) -> None:
         """Load games from JSON file."""
         if self.games_file.exists():
             try:
-                with open(self.games_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                with open(self.games_file, "rb") as f:
+                    data = json_loads(f.read())
                     self._games = data.get("games", [])
             except (json.JSONDecodeError, IOError) as e:
                 print(f"Warning: Could not load games database: {e}")
                 self._games = []
+        
+        # Index by ID for O(1) lookups; first entry wins on duplicate IDs
+        self._by_id = {}
+        for game in self._games:
+            self._by_id.setdefault(game.get("id"), game)
+        
+        # Lowercased (name, developer, game) so searches don't re-lower per call
+        self._search_index = [
+            (game.get("name", "").lower(), game.get("developer", "").lower(), game)
+            for game in self._games
+        ]
+        self._search_cache.clear()
     
     def get_all_games(self) -> List[Dict[str, Any]]:
         """Get all games in the database.
@@ -55,10 +78,8 @@ class GameDatabase:
         Returns:
             Game dictionary or None if not found.
         """
-        for game in self._games:
-            if game.get("id") == game_id:
-                return game.copy()
-        return None
+        game = self._by_id.get(game_id)
+        return game.copy() if game is not None else None
     
     def search_games(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Search games by name or developer.
@@ -74,24 +95,32 @@ class GameDatabase:
             return self._games[:limit]
         
         query_lower = query.lower()
-        results = []
+        key = (query_lower, limit)
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            self._search_cache.move_to_end(key)
+            return [game.copy() for game in cached]
         
-        # First pass: starts with query
-        for game in self._games:
-            name = game.get("name", "").lower()
+        # Single pass; rank 0 = name starts with query, 1 = name contains it,
+        # 2 = developer contains it. Ties keep database order.
+        results = []
+        for i, (name, developer, game) in enumerate(self._search_index):
             if name.startswith(query_lower):
-                results.append(game.copy())
-        
-        # Second pass: contains query
-        for game in self._games:
-            if game in results:
+                rank = 0
+            elif query_lower in name:
+                rank = 1
+            elif query_lower in developer:
+                rank = 2
+            else:
                 continue
-            name = game.get("name", "").lower()
-            developer = game.get("developer", "").lower()
-            if query_lower in name or query_lower in developer:
-                results.append(game.copy())
+            results.append((rank, i, game))
         
-        return results[:limit]
+        results.sort(key=lambda t: (t[0], t[1]))
+        matches = [game for _rank, _i, game in results[:limit]]
+        self._search_cache[key] = matches
+        if len(self._search_cache) > SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
+        return [game.copy() for game in matches]
     
     def get_games_by_developer(self, developer: str) -> List[Dict[str, Any]]:
         """Get all games by a specific developer.
@@ -3,10 +3,76 @@ GameVault - Game Save Backup Tool
 Game detector - finds games and their save locations
 """
 
+import copy
 import os
-import json
+import re
+import stat
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
+
+from .fileio import atomic_write_bytes, json_dumps, json_loads
+
+# How long a detect_installed_games result is reused (UI refreshes come in bursts)
+DETECT_CACHE_TTL = 2.0
+# Threads used to stat save paths; each check is mostly syscall latency
+EXISTS_WORKERS = 16
+
+# Parsed games databases shared by GameDetector instances:
+# path -> ((mtime_ns, size), games_db)
+_DB_CACHE: Dict[str, tuple] = {}
+
+
+# Environment variable references: %VAR% (Windows only), ${VAR} and $VAR
+if os.name == "nt":
+    _ENV_RE = re.compile(r"%([^%]+)%|\$\{([^}]+)\}|\$(\w+)")
+else:
+    _ENV_RE = re.compile(r"\$\{([^}]+)\}|\$(\w+)")
+
+
+def _expand_path(path: str, env: Optional[Dict[str, str]] = None) -> str:
+    """
+    Expand environment variables like os.path.expandvars, but with one
+    compiled regex pass. Pass env (an os.environ.copy() snapshot) when
+    expanding many paths, so lookups are plain dict gets instead of going
+    through os.environ each time. Unset variables are left as written.
+    """
+    if "$" not in path and "%" not in path:
+        return path
+    if env is None:
+        env = os.environ
+    
+    def replace(match: "re.Match") -> str:
+        name = next(group for group in match.groups() if group is not None)
+        if os.name == "nt":
+            name = name.upper()  # Windows names are case-insensitive; copies are upper-case
+        value = env.get(name)
+        return match.group(0) if value is None else value
+    
+    return _ENV_RE.sub(replace, path)
+
+
+def _scan_files(root: str):
+    """
+    Yield a DirEntry for every file under root in one os.scandir walk, so
+    each entry's stat comes from the scan. Like rglob, symlinked
+    directories are not descended into; unreadable folders are skipped.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            yield entry
+                    except OSError:
+                        continue
+        except OSError:
+            continue
 
 
 class GameDetector:
@@ -15,66 +81,130 @@ class GameDetector:
     def __init__(self, games_db_path: str):
         self.games_db_path = Path(games_db_path)
         self.games_db = self._load_games_db()
+        self._build_indexes()
+        self._detect_cache: Optional[List[Dict[str, Any]]] = None
+        self._detect_cache_time = 0.0
+        # Expanded (index, path) candidates for detection and the environment
+        # they were expanded against; rebuilt when either changes
+        self._candidates: Optional[List[tuple]] = None
+        self._candidates_env: Optional[Dict[str, str]] = None
     
     def _load_games_db(self) -> Dict[str, Any]:
-        """Load the games database"""
-        if not self.games_db_path.exists():
+        """Load the games database, reusing the parse while the file is unchanged"""
+        try:
+            st = self.games_db_path.stat()
+        except OSError:
             return {"games": []}
         
+        key = str(self.games_db_path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _DB_CACHE.get(key)
+        if cached and cached[0] == stamp:
+            return copy.deepcopy(cached[1])  # add_custom_game edits games in place
+        
         try:
-            with open(self.games_db_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            games_db = json_loads(self.games_db_path.read_bytes())
         except Exception:
             return {"games": []}
+        _DB_CACHE[key] = (stamp, copy.deepcopy(games_db))
+        return games_db
+    
+    def _build_indexes(self):
+        """Index games by ID and pre-lowercase names for search; call after any change."""
+        games = self.games_db.get("games", [])
+        self._games_tuple: Tuple[Dict[str, Any], ...] = tuple(games)
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        for game in games:
+            self._by_id.setdefault(game.get("id"), game)  # First entry wins, like the old scan
+        self._search_index = [
+            (game, game.get("name", "").lower(), game.get("developer", "").lower())
+            for game in games
+        ]
     
-    def get_all_games(self) -> List[Dict[str, Any]]:
-        """Get all games from the database"""
-        return self.games_db.get("games", [])
+    def get_all_games(self) -> Tuple[Dict[str, Any], ...]:
+        """Get all games from the database (a shared tuple; treat the games as read-only)"""
+        return self._games_tuple
     
     def get_game_by_id(self, game_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific game by ID"""
-        for game in self.games_db.get("games", []):
-            if game.get("id") == game_id:
-                return game
-        return None
+        return self._by_id.get(game_id)
     
     def detect_installed_games(self) -> List[Dict[str, Any]]:
         """
         Detect which games from the database are installed
-        by checking if their save paths exist
+        by checking if their save paths exist.
+        Returns entries {"game", "detected_path", "is_installed"}; "game" is
+        the database dict itself (not a copy), so treat it as read-only.
         """
-        installed = []
-        
-        for game in self.games_db.get("games", []):
-            for save_path in game.get("save_paths", []):
-                expanded_path = os.path.expandvars(save_path)
-                if Path(expanded_path).exists():
-                    game_copy = game.copy()
-                    game_copy["detected_path"] = expanded_path
-                    game_copy["is_installed"] = True
-                    installed.append(game_copy)
-                    break
-            else:
-                # Game not found, but still include in list
-                game_copy = game.copy()
-                game_copy["detected_path"] = None
-                game_copy["is_installed"] = False
-                # installed.append(game_copy)  # Uncomment to show all games
-        
-        return installed
+        now = time.monotonic()
+        if self._detect_cache is not None and now - self._detect_cache_time < DETECT_CACHE_TTL:
+            return list(self._detect_cache)
+        
+        games = self.games_db.get("games", [])
+        candidates = self._get_candidates(games)
+        
+        # Check every candidate path concurrently (stat releases the GIL)
+        with ThreadPoolExecutor(max_workers=EXISTS_WORKERS) as pool:
+            exists = list(pool.map(os.path.exists, [path for _index, path in candidates]))
+        
+        # First existing path per game, in save_paths order
+        detected: Dict[int, str] = {}
+        for (index, expanded_path), found in zip(candidates, exists):
+            if found:
+                detected.setdefault(index, expanded_path)
+        
+        # Games that aren't found are left out of the list
+        installed = [
+            {"game": games[index], "detected_path": detected[index], "is_installed": True}
+            for index in sorted(detected)
+        ]
+        
+        self._detect_cache = installed
+        self._detect_cache_time = now
+        return list(installed)
     
-    def expand_save_path(self, path: str) -> str:
-        """Expand environment variables in a path"""
-        return os.path.expandvars(path)
+    def _get_candidates(self, games: List[Dict[str, Any]]) -> List[tuple]:
+        """
+        (game index, expanded save path) for every save path, in order.
+        Expansion is done once and reused until the games or the
+        environment change.
+        """
+        env = os.environ.copy()
+        if self._candidates is not None and env == self._candidates_env:
+            return self._candidates
+        
+        # One expansion per distinct path
+        expanded: Dict[str, str] = {}
+        
+        def expand(save_path: str) -> str:
+            result = expanded.get(save_path)
+            if result is None:
+                result = expanded[save_path] = _expand_path(save_path, env)
+            return result
+        
+        self._candidates = [
+            (index, expand(save_path))
+            for index, game in enumerate(games)
+            for save_path in game.get("save_paths", [])
+        ]
+        self._candidates_env = env
+        return self._candidates
     
-    def validate_save_path(self, path: str) -> Dict[str, Any]:
+    def expand_save_path(self, path: str, env: Optional[Dict[str, str]] = None) -> str:
+        """Expand environment variables in a path (optionally against an env snapshot)"""
+        return _expand_path(path, env)
+    
+    def validate_save_path(self, path: str, *, deep: bool = False) -> Dict[str, Any]:
         """
-        Validate a save path and get info about it
+        Validate a save path and get info about it.
+        Folder file_count/total_size are only computed with deep=True (a full
+        walk); otherwise they are None so quick UI checks stay a single stat.
         """
         expanded = self.expand_save_path(path)
-        path_obj = Path(expanded)
         
-        if not path_obj.exists():
+        try:
+            st = os.stat(expanded)
+        except OSError:
             return {
                 "valid": False,
                 "exists": False,
@@ -82,20 +212,29 @@ class GameDetector:
                 "error": "Path does not exist"
             }
         
-        # Get info about the path
-        if path_obj.is_dir():
-            files = list(path_obj.rglob("*"))
-            file_count = len([f for f in files if f.is_file()])
-            total_size = sum(f.stat().st_size for f in files if f.is_file())
-        else:
+        # Get info about the path (folders in a single scandir pass)
+        is_directory = stat.S_ISDIR(st.st_mode)
+        if not is_directory:
             file_count = 1
-            total_size = path_obj.stat().st_size
+            total_size = st.st_size
+        elif not deep:
+            file_count = None
+            total_size = None
+        else:
+            file_count = 0
+            total_size = 0
+            for entry in _scan_files(expanded):
+                try:
+                    total_size += entry.stat().st_size
+                except OSError:
+                    continue  # Vanished or unreadable mid-scan
+                file_count += 1
         
         return {
             "valid": True,
             "exists": True,
             "path": expanded,
-            "is_directory": path_obj.is_dir(),
+            "is_directory": is_directory,
             "file_count": file_count,
             "total_size": total_size,
             "error": None
@@ -105,52 +244,66 @@ class GameDetector:
         """Search for games by name"""
         query = query.lower().strip()
         if not query:
-            return self.get_all_games()
-        
-        results = []
-        for game in self.games_db.get("games", []):
-            name = game.get("name", "").lower()
-            developer = game.get("developer", "").lower()
-            
-            if query in name or query in developer:
-                results.append(game)
+            return list(self._games_tuple)
         
-        return results
+        return [
+            game for game, name, developer in self._search_index
+            if query in name or query in developer
+        ]
     
-    def add_custom_game(self, game_data: Dict[str, Any]) -> bool:
-        """Add a custom game to the database"""
+    def add_custom_game(self, game_data: Dict[str, Any], *, flush: bool = True) -> bool:
+        """
+        Add a custom game to the database.
+        
+        Pass flush=False when adding several games in a row and call flush()
+        once afterwards, instead of rewriting games.json for every game.
+        """
         # Generate ID from name
         game_id = game_data.get("name", "custom").lower().replace(" ", "_")
         game_id = "".join(c for c in game_id if c.isalnum() or c == "_")
         
-        # Check for duplicates
-        for existing in self.games_db.get("games", []):
-            if existing.get("id") == game_id:
-                # Update existing
-                existing.update(game_data)
-                self._save_games_db()
-                return True
-        
-        # Add new game
-        new_game = {
-            "id": game_id,
-            "name": game_data.get("name", "Unknown"),
-            "developer": game_data.get("developer", ""),
-            "icon": game_data.get("icon", ""),
-            "save_paths": game_data.get("save_paths", []),
-            "extensions": game_data.get("extensions", []),
-            "notes": game_data.get("notes", ""),
-            "custom": True
-        }
+        existing = self._by_id.get(game_id)
+        if existing is not None:
+            # Update existing
+            existing.update(game_data)
+            if "name" in game_data or "developer" in game_data:
+                self._build_indexes()  # Refresh the lowercased search keys
+        else:
+            # Add new game
+            existing = {
+                "id": game_id,
+                "name": game_data.get("name", "Unknown"),
+                "developer": game_data.get("developer", ""),
+                "icon": game_data.get("icon", ""),
+                "save_paths": game_data.get("save_paths", []),
+                "extensions": game_data.get("extensions", []),
+                "notes": game_data.get("notes", ""),
+                "custom": True
+            }
+            self.games_db.setdefault("games", []).append(existing)
+            self._games_tuple += (existing,)
+            self._by_id[game_id] = existing
+            self._search_index.append(
+                (existing, existing["name"].lower(), existing["developer"].lower())
+            )
         
-        self.games_db.setdefault("games", []).append(new_game)
-        self._save_games_db()
+        self._detect_cache = None  # The game list changed
+        self._candidates = None
+        if flush:
+            self._save_games_db()
         return True
     
+    def flush(self):
+        """Write pending add_custom_game(..., flush=False) changes to disk."""
+        self._save_games_db()
+    
     def _save_games_db(self):
         """Save the games database"""
         try:
-            with open(self.games_db_path, "w", encoding="utf-8") as f:
-                json.dump(self.games_db, f, indent=2)
+            atomic_write_bytes(self.games_db_path, json_dumps(self.games_db))
+            st = self.games_db_path.stat()
+            _DB_CACHE[str(self.games_db_path)] = (
+                (st.st_mtime_ns, st.st_size), copy.deepcopy(self.games_db)
+            )
         except Exception:
-            pass
+            _DB_CACHE.pop(str(self.games_db_path), None)
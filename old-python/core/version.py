@@ -24,11 +24,44 @@ def parse_version(version_str: str) -> tuple:
         return (0, 0, 0)
 
 
+def _release_cache_path():
+    """Where the last GitHub release response is cached (next to config.json)."""
+    from pathlib import Path
+    return Path.home() / "AppData" / "Local" / "GameVault" / "latest_release.json"
+
+
+def _load_release_cache() -> dict:
+    """Load the cached {"etag", "data"} of the last release lookup, or {}."""
+    import json
+    try:
+        with open(_release_cache_path(), "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_release_cache(etag: str, data: dict) -> None:
+    """Cache a release response with its ETag; failures are ignored."""
+    import json
+    from .fileio import atomic_write
+    try:
+        path = _release_cache_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_write(path) as f:
+            json.dump({"etag": etag, "data": data}, f)
+    except OSError:
+        pass
+
+
 def check_for_update() -> dict:
     """
     Check GitHub releases for a newer version.
+    The last response is cached with its ETag, so an unchanged release is a
+    body-less 304 that doesn't count against GitHub's rate limit.
     Returns dict with keys: has_update, latest_version, download_url, error
     """
+    import urllib.error
     import urllib.request
     import json
     import ssl
@@ -42,17 +75,25 @@ def check_for_update() -> dict:
     }
     
     try:
+        # Verified TLS; GitHub's chain is in the system trust store
         ctx = ssl.create_default_context()
-        ctx.check_hostname = False
-        ctx.verify_mode = ssl.CERT_NONE
         
-        req = urllib.request.Request(
-            GITHUB_API_URL,
-            headers={"User-Agent": "GameVault", "Accept": "application/vnd.github.v3+json"}
-        )
+        headers = {"User-Agent": "GameVault", "Accept": "application/vnd.github.v3+json"}
+        cache = _load_release_cache()
+        if cache.get("etag") and isinstance(cache.get("data"), dict):
+            headers["If-None-Match"] = cache["etag"]
+        req = urllib.request.Request(GITHUB_API_URL, headers=headers)
         
-        with urllib.request.urlopen(req, timeout=10, context=ctx) as response:
-            data = json.loads(response.read().decode("utf-8"))
+        try:
+            with urllib.request.urlopen(req, timeout=10, context=ctx) as response:
+                data = json.loads(response.read().decode("utf-8"))
+                etag = response.headers.get("ETag")
+            if etag:
+                _save_release_cache(etag, data)
+        except urllib.error.HTTPError as e:
+            if e.code != 304:
+                raise
+            data = cache["data"]  # Not modified since the cached response
         
         tag_name = data.get("tag_name", "")
         latest_version = parse_version(tag_name)
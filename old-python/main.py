@@ -5,7 +5,6 @@ Main application entry point
 
 import sys
 import os
-import json
 import argparse
 from pathlib import Path
 
@@ -13,15 +12,14 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from core import BackupEngine, GameDetector, BatGenerator
+from core.fileio import atomic_write_bytes, json_dumps, json_loads
 
 
 def load_config():
     """Load configuration"""
     config_path = PROJECT_ROOT / "data" / "config.json"
     if config_path.exists():
-        with open(config_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return json_loads(config_path.read_bytes())
     return {
         "backup_directory": "",
         "max_backups": 10,
@@ -56,8 +54,7 @@ def save_config(config):
     """Save configuration"""
     config_path = PROJECT_ROOT / "data" / "config.json"
     config_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(config_path, "w", encoding="utf-8") as f:
-        json.dump(config, f, indent=2)
+    atomic_write_bytes(config_path, json_dumps(config))
 
 
 def cli_backup(game_id: str):
@@ -69,6 +66,10 @@ def cli_backup(game_id: str):
         print("Please run GameVault GUI to configure settings first.")
         return 1
     
+    # Imported here so other CLI paths don't pay for the backup stack
+    from core.backup_engine import BackupEngine
+    from core.game_detector import GameDetector
+    
     games_db_path = PROJECT_ROOT / "data" / "games.json"
     detector = GameDetector(str(games_db_path))
     
@@ -79,9 +80,11 @@ def cli_backup(game_id: str):
     
     # Find the first valid save path
     save_path = None
+    env = os.environ.copy()
+    exists = os.path.exists  # Plain stat; no Path object per candidate
     for path in game.get("save_paths", []):
-        expanded = os.path.expandvars(path)
-        if Path(expanded).exists():
+        expanded = detector.expand_save_path(path, env)
+        if exists(expanded):
             save_path = expanded
             break
     
@@ -91,7 +94,11 @@ def cli_backup(game_id: str):
     
     engine = BackupEngine(
         config["backup_directory"],
-        max_backups=config.get("max_backups", 10)
+        max_backups=config.get("max_backups", 10),
+        archive_format=config.get("archive_format", "zip"),
+        compression_level=config.get("compression_level", 6),
+        zstd_level=config.get("zstd_level", 3),
+        hash_algo=config.get("hash_algo", "xxh3"),
     )
     
     print(f"Backing up: {game.get('name')}")
@@ -142,6 +149,8 @@ def main():
     
     # CLI mode: list games
     if args.list_games:
+        from core.game_detector import GameDetector
+        
         games_db_path = PROJECT_ROOT / "data" / "games.json"
         detector = GameDetector(str(games_db_path))
         print("\nAvailable games:")
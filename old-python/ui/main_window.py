@@ -7,23 +7,27 @@ References:
 - Brand Design System at E:/Web Development/_Projects/Portfolio/frontend/doc/DESIGN_SYSTEM.md
 """
 
+import itertools
 import os
 import sys
 import platform
 import subprocess
 import webbrowser
 import threading
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
 from tkinter import messagebox, filedialog
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 import customtkinter as ctk
 
 from core.config_manager import ConfigManager
 from core.game_db import GameDatabase
 from core.backup_engine import BackupEngine
-from core.bat_generator import BatGenerator
 from core.version import __version__, check_for_update, GITHUB_REPO
 
 # ==========================================
@@ -82,55 +86,104 @@ HEADER_GAME_NAME_MAX_CHARS = 34
 HEADER_DEVELOPER_MAX_CHARS = 32
 SUGGESTION_GAME_NAME_MAX_CHARS = 28
 SUGGESTION_DEVELOPER_MAX_CHARS = 26
+SUGGESTION_SLOTS = 8  # Suggestion cards shown (and pooled) in Add Game
 BACKUP_DISPLAY_NAME_MAX_CHARS = 38
 COLLECTION_NAME_MAX_CHARS = 24
 PROGRESS_GAME_NAME_MAX_CHARS = 26
 DEFAULT_COLLECTION_LIMIT = 10
+SEARCH_DEBOUNCE_MS = 150  # Add Game search waits this long after the last keystroke
+SPINNER_FRAMES = ("|", "/", "-", "\\")
+SPINNER_INTERVAL_MS = 120
+CONFIG_SAVE_DELAY_MS = 250  # Config edits are coalesced into one write over this window
+BACKUP_PAGE_SIZE = 25  # Backup rows built per collection before "Show more"
+BACKUP_ROW_HEIGHT_ESTIMATE = 60  # Placeholder height until a real row is measured
+BACKUP_ROW_BUILD_CHUNK = 20  # Rows built per idle pass, so the first ones paint sooner
+
+# Sidebar virtualization: only rows in view (plus overscan) exist as widgets
+SIDEBAR_ROW_PADY = 6
+SIDEBAR_ROW_HEIGHT_ESTIMATE = 66  # Used until the first row is measured
+SIDEBAR_ROW_OVERSCAN = 2
+SIDEBAR_VIEWPORT_FALLBACK = 600
+# Bind tag shared by every sidebar card widget; one class binding serves all rows
+GAME_CARD_BINDTAG = "GameVaultGameCard"
+# Same idea for the Add Game suggestion cards
+SUGGESTION_CARD_BINDTAG = "GameVaultSuggestionCard"
+
+# Project root (the folder with main.py), resolved once
+APP_DIR = Path(__file__).resolve().parents[1]
 
 
 def resource_path(relative_path: str) -> Path:
     """Resolve resource paths for dev + PyInstaller-style bundles."""
-    base = Path(getattr(sys, "_MEIPASS", Path(__file__).resolve().parents[1]))
+    base = Path(getattr(sys, "_MEIPASS", APP_DIR))
     return base / relative_path
 
 
+@lru_cache(maxsize=1)
+def find_app_exe() -> Optional[str]:
+    """Path of the GameVault executable that .bat shortcuts should call, if any.
+
+    Cached for the session; a build made while the app runs is picked up
+    on the next launch.
+    """
+    # Check if running as exe (PyInstaller)
+    if getattr(sys, 'frozen', False):
+        # Running as compiled exe
+        return sys.executable
+    # Running from source - check for dist/GameVault.exe
+    for exe_loc in [APP_DIR / "GameVault.exe", APP_DIR / "dist" / "GameVault.exe"]:
+        if exe_loc.exists():
+            return str(exe_loc)
+    return None
+
+
 def ensure_app_icon_ico() -> Optional[Path]:
     """Generate/update a cached .ico from the PNG for best Windows taskbar support."""
     if platform.system().lower() != "windows":
         return None
 
     png_path = resource_path(APP_ICON_PNG_REL)
-    if not png_path.exists():
+    try:
+        png_mtime = png_path.stat().st_mtime_ns
+    except OSError:
         return None
 
+    # Warm path: a cached .ico at least as new as the PNG is used as-is,
+    # without importing PIL
     ico_path = resource_path(APP_ICON_ICO_CACHE_REL)
+    try:
+        if ico_path.stat().st_mtime_ns >= png_mtime:
+            return ico_path
+    except OSError:
+        pass  # Not generated yet
+
     try:
         ico_path.parent.mkdir(parents=True, exist_ok=True)
+        from PIL import Image  # type: ignore
+
+        with Image.open(png_path) as img:
+            img = img.convert("RGBA")
+            img.save(
+                ico_path,
+                format="ICO",
+                sizes=[(256, 256), (128, 128), (64, 64), (48, 48), (32, 32), (16, 16)],
+            )
     except Exception:
         return None
 
-    try:
-        png_mtime = png_path.stat().st_mtime
-        ico_mtime = ico_path.stat().st_mtime if ico_path.exists() else 0
-    except OSError:
-        png_mtime = 0
-        ico_mtime = 0
+    return ico_path if ico_path.exists() else None
 
-    if (not ico_path.exists()) or (ico_mtime < png_mtime):
-        try:
-            from PIL import Image  # type: ignore
-
-            with Image.open(png_path) as img:
-                img = img.convert("RGBA")
-                img.save(
-                    ico_path,
-                    format="ICO",
-                    sizes=[(256, 256), (128, 128), (64, 64), (48, 48), (32, 32), (16, 16)],
-                )
-        except Exception:
-            return None
 
-    return ico_path if ico_path.exists() else None
+@lru_cache(maxsize=1)
+def _app_icon_image() -> Any:
+    """Decode the icon PNG once with PIL; None if PIL or the file is unavailable."""
+    try:
+        from PIL import Image  # type: ignore
+
+        with Image.open(resource_path(APP_ICON_PNG_REL)) as image:
+            return image.copy()
+    except Exception:
+        return None
 
 
 def apply_app_icon(window: Any, *, set_default: bool = False) -> None:
@@ -147,16 +200,17 @@ def apply_app_icon(window: Any, *, set_default: bool = False) -> None:
             pass
 
     # Keep a reference on the window object to prevent GC.
-    try:
-        from PIL import Image, ImageTk  # type: ignore
+    # Every window (and every scheduled re-apply) shares one decoded image
+    image = _app_icon_image()
+    if image is not None:
+        try:
+            from PIL import ImageTk  # type: ignore
 
-        with Image.open(png_path) as image:
-            image_copy = image.copy()
-        window._window_icon_image = ImageTk.PhotoImage(image_copy)
-        window.iconphoto(bool(set_default), window._window_icon_image)
-        return
-    except Exception:
-        pass
+            window._window_icon_image = ImageTk.PhotoImage(image)
+            window.iconphoto(bool(set_default), window._window_icon_image)
+            return
+        except Exception:
+            pass
 
     try:
         from tkinter import PhotoImage
@@ -176,7 +230,12 @@ def schedule_app_icon(window: Any, *, set_default: bool = False) -> None:
     def apply_once() -> None:
         apply_app_icon(window, set_default=set_default)
 
-    apply_once()
+    # First pass once the caller's __init__ has returned, so building the
+    # window isn't held up by icon work
+    try:
+        window.after_idle(apply_once)
+    except Exception:
+        apply_once()
     for delay_ms in (200, 700, 1500):
         try:
             window.after(delay_ms, apply_once)
@@ -204,19 +263,33 @@ def safe_close_toplevel(window: Any, *, delay_ms: int = 350) -> None:
         destroy_if_exists()
 
 
+@lru_cache(maxsize=64)
+def _shared_font(args: tuple, options: tuple):
+    # Cached: CTk widgets can share one CTkFont, and the whole UI only uses
+    # a dozen or so size/weight combinations
+    return ctk.CTkFont(*args, **dict(options))
+
+
 def ui_font(*args, **kwargs):
-    """Return a CTkFont using the brand font by default."""
+    """Return a (shared) CTkFont using the brand font by default."""
     kwargs.setdefault("family", FONT_FAMILY)
-    return ctk.CTkFont(*args, **kwargs)
+    return _shared_font(args, tuple(sorted(kwargs.items())))
 
 
 def icon_font(*args, **kwargs):
-    """Return a CTkFont for icon glyphs (fallbacks to system symbol font)."""
+    """Return a (shared) CTkFont for icon glyphs (fallbacks to system symbol font)."""
     kwargs.setdefault("family", ICON_FONT_FAMILY)
-    return ctk.CTkFont(*args, **kwargs)
+    return _shared_font(args, tuple(sorted(kwargs.items())))
+
 
+def short_id() -> str:
+    """Random 8-hex-char ID for user games and collections (uuid4().hex[:8] shape)."""
+    return os.urandom(4).hex()
 
+
+@lru_cache(maxsize=4096)
 def truncate_text(value: str, max_chars: int) -> str:
+    # Cached: the same names are truncated to the same widths on every redraw
     text = (value or "").strip()
     if max_chars <= 0:
         return ""
@@ -227,6 +300,64 @@ def truncate_text(value: str, max_chars: int) -> str:
     return text[: max_chars - 3].rstrip() + "..."
 
 
+@lru_cache(maxsize=4096)
+def format_backup_time(backup_time: str) -> Optional[str]:
+    # Cached: a backup's time never changes, and the same backups are shown
+    # again on every history refresh
+    try:
+        return datetime.fromisoformat(backup_time).strftime("%b %d, %Y at %I:%M %p")
+    except (TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=256)
+def _expand_path(raw_path: str) -> str:
+    # Environment variables don't change while the app runs
+    return os.path.expandvars(raw_path)
+
+
+def resolve_path(raw_path: str) -> Tuple[str, bool]:
+    """Expand environment variables in a stored path; returns (expanded, exists)."""
+    expanded = _expand_path(raw_path) if raw_path else ""
+    return expanded, bool(expanded) and os.path.exists(expanded)
+
+
+def center_on_parent(window: Any, parent: Any, width: int, height: int) -> None:
+    """Position a new width x height window over the middle of parent.
+
+    Reads only the parent's (already laid out) geometry, so there is no
+    update_idletasks() layout pass on the new window first.
+    """
+    x = parent.winfo_x() + (parent.winfo_width() - width) // 2
+    y = parent.winfo_y() + (parent.winfo_height() - height) // 2
+    window.geometry(f"+{x}+{y}")
+
+
+def set_entry_text(entry: Any, value: str) -> None:
+    """Replace an entry's text, skipping the delete/insert when it already matches."""
+    if entry.get() == value:
+        return
+    entry.delete(0, "end")
+    if value:
+        entry.insert(0, value)
+
+
+def show_error_later(widget: Any, title: str, message: str) -> None:
+    """Show an error box once the current callback returns, instead of nesting its modal loop here."""
+    widget.after_idle(lambda: messagebox.showerror(title, message))
+
+
+def field_label(parent: Any, text: str) -> Any:
+    """Build the small bold caption that sits above a dialog field (caller packs it)."""
+    return ctk.CTkLabel(
+        parent,
+        text=text,
+        font=ui_font(size=11, weight="bold"),
+        text_color=BRAND_COLORS["text_muted"],
+        anchor="w"
+    )
+
+
 def attach_tooltip(widget: Any, text: str) -> None:
     """Attach a lightweight tooltip to a widget."""
     if not text:
@@ -286,6 +417,459 @@ def attach_tooltip(widget: Any, text: str) -> None:
     widget.bind("<Leave>", lambda _e: _destroy(), add="+")
     widget.bind("<ButtonPress>", lambda _e: _destroy(), add="+")
 
+def card_row_for(owner: Any, widget: Any) -> Any:
+    """Walk up from an event widget to the pooled card row (card._gv_row) that owns it."""
+    if isinstance(widget, str):
+        try:
+            widget = owner.nametowidget(widget)
+        except Exception:
+            return None
+    while widget is not None:
+        row = getattr(widget, "_gv_row", None)
+        if row is not None:
+            return row
+        widget = getattr(widget, "master", None)
+    return None
+
+
+def add_bindtag(widget: Any, tag: str, skip: Any = None) -> None:
+    """Prepend a bind tag to a widget and all its descendants (except skip's subtree)."""
+    if widget is skip:
+        return
+    widget.bindtags((tag,) + widget.bindtags())
+    for child in widget.winfo_children():
+        add_bindtag(child, tag, skip)
+
+
+# Backup row action buttons (fonts are added at build time, once Tk exists)
+BACKUP_RESTORE_BUTTON = {
+    "width": 72,
+    "height": 28,
+    "fg_color": BRAND_COLORS["accent_muted"],
+    "hover_color": BRAND_COLORS["accent"],
+    "corner_radius": 4,
+}
+BACKUP_RENAME_BUTTON = {
+    "width": 72,
+    "height": 28,
+    "fg_color": BRAND_COLORS["bg_hover"],
+    "hover_color": BRAND_COLORS["border_hover"],
+    "corner_radius": 4,
+}
+BACKUP_DELETE_BUTTON = {
+    "width": 60,
+    "height": 28,
+    "fg_color": "transparent",
+    "hover_color": BRAND_COLORS["accent_muted"],
+    "text_color": BRAND_COLORS["text_muted"],
+    "corner_radius": 4,
+}
+
+# Game card (sidebar row, Add Game suggestion) widget styles per state:
+# card attribute -> configure() options
+GAME_CARD_STYLES: Dict[str, Dict[str, Dict[str, str]]] = {
+    "selected": {
+        "card": {"fg_color": BRAND_COLORS["accent_bg"], "border_color": BRAND_COLORS["accent"]},
+        "icon": {"fg_color": BRAND_COLORS["accent"]},
+        "icon_label": {"text_color": BRAND_COLORS["text_primary"]},
+        "name": {"text_color": BRAND_COLORS["text_primary"]},
+        "dev": {"text_color": BRAND_COLORS["text_secondary"]},
+        "status_dot": {"fg_color": BRAND_COLORS["accent"]},
+    },
+    "hover": {
+        "card": {"fg_color": BRAND_COLORS["bg_hover"], "border_color": BRAND_COLORS["border_hover"]},
+        "icon": {"fg_color": BRAND_COLORS["border_hover"]},
+        "icon_label": {"text_color": BRAND_COLORS["text_primary"]},
+        "name": {"text_color": BRAND_COLORS["text_primary"]},
+        "dev": {"text_color": BRAND_COLORS["text_muted"]},
+        "status_dot": {"fg_color": BRAND_COLORS["accent"]},
+    },
+    "normal": {
+        "card": {"fg_color": BRAND_COLORS["bg_card"], "border_color": BRAND_COLORS["border"]},
+        "icon": {"fg_color": BRAND_COLORS["bg_hover"]},
+        "icon_label": {"text_color": BRAND_COLORS["text_secondary"]},
+        "name": {"text_color": BRAND_COLORS["text_secondary"]},
+        "dev": {"text_color": BRAND_COLORS["text_muted"]},
+        "status_dot": {"fg_color": BRAND_COLORS["border"]},
+    },
+}
+
+
+class GameCardStyling:
+    """
+    Selection / hover styling shared by game cards. Subclasses set
+    `selected`, `_state` and the widget attributes named in GAME_CARD_STYLES.
+    """
+    
+    selected = False
+    _state = ""
+    
+    def apply_state(self, state: str):
+        """Restyle for a state in GAME_CARD_STYLES, touching only widgets whose style changes."""
+        if state == self._state:
+            return
+        previous = GAME_CARD_STYLES.get(self._state, {})
+        self._state = state
+        for role, style in GAME_CARD_STYLES[state].items():
+            if previous.get(role) != style:
+                getattr(self, role).configure(**style)
+    
+    def on_enter(self, _event: Any = None):
+        if not self.selected:
+            self.apply_state("hover")
+    
+    def on_leave(self, _event: Any = None):
+        if not self.selected:
+            self.apply_state("normal")
+
+
+class SidebarGameRow(GameCardStyling):
+    """
+    The widgets for one sidebar game card. Rows are pooled by the main
+    window and rebound to whichever game scrolls into their slot.
+    """
+    
+    def __init__(self, parent: Any, window: "GameVaultWindow"):
+        self.window = window
+        self.game: Dict[str, Any] = {}
+        self.selected = False
+        self._state = ""
+        self._source: Optional[tuple] = None  # Raw (name, developer) the labels were made from
+        
+        self.card = ctk.CTkFrame(
+            parent,
+            fg_color=BRAND_COLORS["bg_card"],
+            corner_radius=10,
+            border_width=1,
+            border_color=BRAND_COLORS["border"]
+        )
+        
+        inner = ctk.CTkFrame(self.card, fg_color="transparent")
+        inner.pack(fill="x", padx=12, pady=10)
+        inner.grid_columnconfigure(1, weight=1)
+        
+        self.icon = ctk.CTkFrame(
+            inner,
+            width=28,
+            height=28,
+            fg_color=BRAND_COLORS["bg_hover"],
+            corner_radius=6
+        )
+        self.icon.grid(row=0, column=0, rowspan=2, sticky="w", padx=(0, 10))
+        self.icon.pack_propagate(False)
+        
+        self.icon_label = ctk.CTkLabel(
+            self.icon,
+            text="?",
+            font=ui_font(size=12, weight="bold"),
+            text_color=BRAND_COLORS["text_secondary"]
+        )
+        self.icon_label.pack(expand=True)
+        
+        # Game name
+        self.name = ctk.CTkLabel(
+            inner,
+            text="",
+            font=ui_font(size=13, weight="bold"),
+            text_color=BRAND_COLORS["text_secondary"],
+            anchor="w"
+        )
+        self.name.grid(row=0, column=1, sticky="ew")
+        
+        # Developer
+        self.dev = ctk.CTkLabel(
+            inner,
+            text="",
+            font=ui_font(size=10),
+            text_color=BRAND_COLORS["text_muted"],
+            anchor="w"
+        )
+        self.dev.grid(row=1, column=1, sticky="ew")
+        
+        remove_btn = ctk.CTkButton(
+            inner,
+            text="×",
+            command=self._on_remove,
+            width=28,
+            height=28,
+            font=ui_font(size=14, weight="bold"),
+            fg_color="transparent",
+            hover_color=BRAND_COLORS["accent_muted"],
+            text_color=BRAND_COLORS["text_muted"],
+            corner_radius=6,
+        )
+        remove_btn.grid(row=0, column=3, rowspan=2, sticky="e", padx=(8, 0))
+        
+        self.status_dot = ctk.CTkFrame(
+            inner,
+            width=8,
+            height=8,
+            corner_radius=4,
+            fg_color=BRAND_COLORS["border"]
+        )
+        self.status_dot.grid(row=0, column=2, rowspan=2, sticky="e", padx=(8, 0))
+        self.status_dot.pack_propagate(False)
+        
+        # Make clickable: the window's GAME_CARD_BINDTAG class bindings find
+        # this row through card._gv_row, so no per-widget handlers are needed
+        self.card._gv_row = self
+        add_bindtag(self.card, GAME_CARD_BINDTAG, skip=remove_btn)
+        for widget in [self.card, inner, self.icon, self.icon_label, self.name, self.dev, self.status_dot]:
+            widget.configure(cursor="hand2")
+    
+    def show(self, game: Dict[str, Any], selected: bool):
+        """Bind the row to a game, only reconfiguring what changed."""
+        self.game = game
+        self.selected = selected
+        source = (game.get("name", "Unknown"), game.get("developer"))
+        if source != self._source:
+            self._source = source
+            name_value = (game.get("name") or "").strip()
+            self.icon_label.configure(text=name_value[:1].upper() if name_value else "?")
+            self.name.configure(text=truncate_text(source[0], SIDEBAR_GAME_NAME_MAX_CHARS))
+            self.dev.configure(text=truncate_text(source[1] or "Custom game", SIDEBAR_DEVELOPER_MAX_CHARS))
+        self.apply_state("selected" if selected else "normal")
+    
+    def _on_remove(self):
+        self.window._remove_game(self.game)
+
+
+class CollectionCard:
+    """A collection's card in the backup history, with its backup rows keyed by path."""
+    
+    def __init__(self, parent: Any, window: "GameVaultWindow"):
+        self.window = window
+        self.rows: Dict[str, BackupRow] = {}
+        self.order: List[str] = []
+        self.limit = BACKUP_PAGE_SIZE
+        self._backups: List[Dict[str, Any]] = []
+        self._game: Dict[str, Any] = {}
+        self._texts: tuple = ()
+        self._has_rows: Optional[bool] = None
+        
+        self.frame = ctk.CTkFrame(
+            parent,
+            fg_color=BRAND_COLORS["bg_hover"],
+            corner_radius=8
+        )
+        
+        card_header = ctk.CTkFrame(self.frame, fg_color="transparent")
+        card_header.pack(fill="x", padx=16, pady=(12, 4))
+        
+        self.name_label = ctk.CTkLabel(
+            card_header,
+            text="",
+            font=ui_font(size=13, weight="bold"),
+            text_color=BRAND_COLORS["text_primary"],
+            anchor="w"
+        )
+        self.name_label.pack(side="left")
+        
+        self.count_label = ctk.CTkLabel(
+            card_header,
+            text="",
+            font=ui_font(size=11),
+            text_color=BRAND_COLORS["text_muted"],
+            anchor="e"
+        )
+        self.count_label.pack(side="right")
+        
+        self.empty_label = ctk.CTkLabel(
+            self.frame,
+            text="No backups in this collection yet.",
+            font=ui_font(size=11),
+            text_color=BRAND_COLORS["text_muted"]
+        )
+        self.backups_inner = ctk.CTkFrame(self.frame, fg_color="transparent")
+        self.more_button: Optional[ctk.CTkButton] = None
+    
+    def show(self, name: str, backups: List[Dict[str, Any]], game: Dict[str, Any]):
+        """
+        Update the card for a new list of backups, reusing rows by backup
+        path. Only the first `limit` rows are built; the rest wait behind a
+        "Show more" button.
+        """
+        self._backups = backups
+        self._game = game
+        texts = (name, f"{len(backups)} backups")
+        if texts != self._texts:
+            self._texts = texts
+            self.name_label.configure(text=texts[0])
+            self.count_label.configure(text=texts[1])
+        
+        has_rows = bool(backups)
+        if has_rows != self._has_rows:
+            self._has_rows = has_rows
+            if has_rows:
+                self.empty_label.pack_forget()
+                self.backups_inner.pack(fill="both", expand=True, padx=12, pady=(0, 12))
+            else:
+                self.backups_inner.pack_forget()
+                self.empty_label.pack(padx=16, pady=(0, 12), anchor="w")
+        
+        remaining = len(backups) - self.limit
+        backups = backups[:self.limit]
+        keys = [backup.get("path") or backup.get("backup_name", "") for backup in backups]
+        for key in set(self.rows) - set(keys):
+            self.rows.pop(key).frame.destroy()
+        for key, backup in zip(keys, backups):
+            row = self.rows.get(key)
+            if row is None:
+                row = self.rows[key] = BackupRow(self.backups_inner, self.window)
+            row.show(backup, game)
+        
+        if keys != self.order:
+            for key in keys:
+                self.rows[key].frame.pack(fill="x", pady=3)
+            self.order = keys
+        
+        if remaining > 0:
+            if self.more_button is None:
+                self.more_button = ctk.CTkButton(
+                    self.frame,
+                    text="",
+                    command=self._show_more,
+                    height=28,
+                    font=ui_font(size=11, weight="bold"),
+                    fg_color="transparent",
+                    hover_color=BRAND_COLORS["border_hover"],
+                    text_color=BRAND_COLORS["text_secondary"],
+                    corner_radius=6
+                )
+            self.more_button.configure(text=f"Show more ({remaining} remaining)")
+            self.more_button.pack(after=self.backups_inner, fill="x", padx=12, pady=(0, 12))
+        elif self.more_button is not None:
+            self.more_button.pack_forget()
+    
+    def _show_more(self):
+        self.limit += BACKUP_PAGE_SIZE
+        name = self._texts[0] if self._texts else ""
+        self.show(name, self._backups, self._game)
+
+
+class BackupRow:
+    """
+    One backup row; showing a fresh copy of the same backup only updates its
+    text. Rows start as an empty placeholder frame and build their widgets
+    when they scroll near the viewport (see GameVaultWindow._materialize_visible_rows).
+    """
+    
+    # Placeholder height; replaced by a measured row once one has been laid out
+    placeholder_height = BACKUP_ROW_HEIGHT_ESTIMATE
+    
+    def __init__(self, parent: Any, window: "GameVaultWindow"):
+        self.window = window
+        self.backup: Dict[str, Any] = {}
+        self.game: Dict[str, Any] = {}
+        self.built = False
+        self._source: Optional[tuple] = None  # Backup fields the texts were made from
+        self._texts: tuple = ()
+        self._wanted_texts: tuple = ()
+        
+        self.frame = ctk.CTkFrame(
+            parent,
+            fg_color=BRAND_COLORS["bg_hover"],
+            corner_radius=6,
+            height=BackupRow.placeholder_height
+        )
+    
+    def build(self):
+        """Create the row's widgets (once)."""
+        if self.built:
+            return
+        self.built = True
+        
+        inner = ctk.CTkFrame(self.frame, fg_color="transparent")
+        inner.pack(fill="x", padx=16, pady=12)
+        
+        # Info
+        info = ctk.CTkFrame(inner, fg_color="transparent")
+        info.pack(side="left", fill="x", expand=True)
+        
+        self.title_label = ctk.CTkLabel(
+            info,
+            text="",
+            font=ui_font(size=13, weight="bold"),
+            text_color=BRAND_COLORS["text_primary"],
+            anchor="w"
+        )
+        self.title_label.pack(fill="x")
+        
+        self.meta_label = ctk.CTkLabel(
+            info,
+            text="",
+            font=ui_font(size=11),
+            text_color=BRAND_COLORS["text_muted"],
+            anchor="w"
+        )
+        self.meta_label.pack(fill="x")
+        
+        # Actions
+        actions = ctk.CTkFrame(inner, fg_color="transparent")
+        actions.pack(side="right")
+        
+        ctk.CTkButton(
+            actions, text="Restore", command=self._on_restore, **BACKUP_RESTORE_BUTTON, font=ui_font(size=11)
+        ).pack(side="left", padx=(0, 8))
+        ctk.CTkButton(
+            actions, text="Rename", command=self._on_rename, **BACKUP_RENAME_BUTTON, font=ui_font(size=11)
+        ).pack(side="left", padx=(0, 8))
+        ctk.CTkButton(
+            actions, text="Delete", command=self._on_delete, **BACKUP_DELETE_BUTTON, font=ui_font(size=11)
+        ).pack(side="left")
+        
+        self._apply_texts()
+    
+    def show(self, backup: Dict[str, Any], game: Dict[str, Any]):
+        self.backup = backup
+        self.game = game
+        source = (
+            backup.get("backup_time"),
+            backup.get("backup_name"),
+            backup.get("display_name"),
+            backup.get("size"),
+            backup.get("is_compressed"),
+        )
+        if source == self._source:
+            return
+        self._source = source
+        
+        # Date
+        date_str = format_backup_time(str(backup.get("backup_time", "")))
+        if date_str is None:
+            date_str = backup.get("backup_name", "Unknown")
+        
+        # Size info
+        size_str = BackupEngine.format_size(backup.get("size", 0))
+        compressed = backup.get("is_compressed", False)
+        info_text = f"Size: {size_str}" + (" (compressed)" if compressed else "")
+        
+        display_name = (backup.get("display_name") or "").strip()
+        title_text = display_name if display_name else date_str
+        title_text = truncate_text(title_text, BACKUP_DISPLAY_NAME_MAX_CHARS)
+        meta_text = f"{date_str} | {info_text}" if display_name else info_text
+        
+        self._wanted_texts = (title_text, meta_text)
+        if self.built:
+            self._apply_texts()
+    
+    def _apply_texts(self):
+        if self._wanted_texts != self._texts:
+            self._texts = self._wanted_texts
+            self.title_label.configure(text=self._texts[0])
+            self.meta_label.configure(text=self._texts[1])
+    
+    # Button commands read the row's current backup, so pooled rows need no rewiring
+    def _on_restore(self):
+        self.window._restore_backup(self.backup, self.game)
+    
+    def _on_rename(self):
+        self.window._rename_backup(self.backup, self.game)
+    
+    def _on_delete(self):
+        self.window._delete_backup(self.backup)
+
+
 # ==========================================
 # MAIN WINDOW
 # ==========================================
@@ -312,16 +896,41 @@ class GameVaultWindow(ctk.CTk):
         self.config = self.config_manager.load_config()
         self.game_db = GameDatabase()
         self.engine: Optional[BackupEngine] = None
+        self._bat_generator = None  # See _get_bat_generator
+        self._confirm_suppress: Set[str] = set()  # Confirmations skipped for this session
+        self._settings_dialog: Optional["SettingsDialog"] = None  # Hidden between opens
+        self._config_dirty = False
+        self._config_flush_id: Optional[str] = None
+        # Disk reads for the game view; results come back through after()
+        self._io_executor = ThreadPoolExecutor(max_workers=2)
+        # Backups, restores and deletes run here one at a time, so a restore
+        # can't rewrite a save folder mid-backup or a delete race a retention pass
+        self._task_executor = ThreadPoolExecutor(max_workers=1)
+        self._build_token = 0  # Bumped per backups request so stale results are dropped
+        # game_id -> (collections list, its length, {casefolded name: collection id})
+        self._collection_name_index: Dict[str, tuple] = {}
+        # game_id -> (collections list, its length, default limit) last normalized
+        self._collections_checked: Dict[str, tuple] = {}
+        # Bumped whenever a collection is added, renamed or dropped, so views
+        # built from collection names know when to rebuild
+        self._collections_version = 0
         
         # State
         self.selected_game: Optional[Dict[str, Any]] = None
-        self.user_games: List[Dict[str, Any]] = self.config.get("user_games", [])
+        self.user_games: List[Dict[str, Any]] = []
+        self._games_by_id: Dict[Any, Dict[str, Any]] = {}
+        self._collections_by_game: Dict[str, List[Dict[str, Any]]] = {}
+        self._bind_config()
         
         # Initialize engine if backup directory set
         if self.config.get("backup_directory"):
             self.engine = BackupEngine(
                 self.config["backup_directory"],
                 max_backups=self.config.get("max_backups", DEFAULT_COLLECTION_LIMIT),
+                archive_format=self.config.get("archive_format", "zip"),
+                compression_level=self.config.get("compression_level", 6),
+                zstd_level=self.config.get("zstd_level", 3),
+                hash_algo=self.config.get("hash_algo", "xxh3"),
             )
         
         # Check if first time
@@ -333,6 +942,56 @@ class GameVaultWindow(ctk.CTk):
     def _apply_window_icon(self) -> None:
         schedule_app_icon(self, set_default=True)
     
+    def _bind_config(self) -> None:
+        """Cache the config's user_games and backup_collections containers.
+
+        Called when self.config is loaded; the cached objects live
+        inside self.config, so edits through them are saved with it.
+        """
+        user_games = self.config.get("user_games")
+        if not isinstance(user_games, list):
+            user_games = self.config["user_games"] = []
+        self.user_games = user_games
+        self._index_user_games()
+        collections_by_game = self.config.get("backup_collections")
+        if not isinstance(collections_by_game, dict):
+            collections_by_game = self.config["backup_collections"] = {}
+        self._collections_by_game = collections_by_game
+        self._collection_name_index.clear()
+        self._collections_checked.clear()
+        self._collections_version += 1
+
+    def _index_user_games(self) -> None:
+        """Rebuild the game ID -> user_games entry lookup (first entry wins)."""
+        self._games_by_id = {}
+        for game in self.user_games:
+            self._games_by_id.setdefault(game.get("id"), game)
+
+    def _mark_config_dirty(self) -> None:
+        """Save the config shortly, folding bursts of changes into one write."""
+        self._config_dirty = True
+        if self._config_flush_id is None:
+            self._config_flush_id = self.after(CONFIG_SAVE_DELAY_MS, self._flush_config)
+    
+    def _flush_config(self) -> None:
+        """Start writing a pending _mark_config_dirty save now (in the background)."""
+        if self._config_flush_id is not None:
+            try:
+                self.after_cancel(self._config_flush_id)
+            except Exception:
+                pass
+            self._config_flush_id = None
+        if self._config_dirty:
+            self._config_dirty = False
+            self.config_manager.save_config_async(self.config)
+    
+    def destroy(self):
+        self._flush_config()  # Don't drop a pending write on exit
+        self.config_manager.wait_for_saves()
+        self._io_executor.shutdown(wait=False)
+        self._task_executor.shutdown(wait=False)
+        super().destroy()
+    
     # ==========================================
     # SETUP WIZARD
     # ==========================================
@@ -343,7 +1002,7 @@ class GameVaultWindow(ctk.CTk):
         
         if wizard.result:
             # Save config
-            self.config = wizard.result
+            self.config.update(wizard.result)
             self.config["setup_complete"] = True
             self.config_manager.save_config(self.config)
             
@@ -352,6 +1011,10 @@ class GameVaultWindow(ctk.CTk):
                 self.engine = BackupEngine(
                     self.config["backup_directory"],
                     max_backups=self.config.get("max_backups", DEFAULT_COLLECTION_LIMIT),
+                    archive_format=self.config.get("archive_format", "zip"),
+                    compression_level=self.config.get("compression_level", 6),
+                    zstd_level=self.config.get("zstd_level", 3),
+                    hash_algo=self.config.get("hash_algo", "xxh3"),
                 )
             
             self._build_ui()
@@ -436,6 +1099,44 @@ class GameVaultWindow(ctk.CTk):
         )
         self.games_scroll.pack(fill="both", expand=True, padx=8, pady=(0, 8))
         
+        # Sidebar card events, shared by all rows
+        self.bind_class(GAME_CARD_BINDTAG, "<Button-1>", self._on_game_card_click)
+        self.bind_class(GAME_CARD_BINDTAG, "<Enter>", self._on_game_card_enter)
+        self.bind_class(GAME_CARD_BINDTAG, "<Leave>", self._on_game_card_leave)
+        
+        # Virtualized rows (see _render_visible_games)
+        self._game_rows: List[SidebarGameRow] = []
+        self._games_visible = 0
+        self._games_range: Optional[tuple] = None
+        self._games_row_height = 0
+        self._games_render_pending = False
+        self._games_empty: Optional[ctk.CTkFrame] = None
+        self._games_top_spacer = tk.Frame(
+            self.games_scroll, height=0, bg=BRAND_COLORS["bg_card"], highlightthickness=0, bd=0
+        )
+        self._games_bottom_spacer = tk.Frame(
+            self.games_scroll, height=0, bg=BRAND_COLORS["bg_card"], highlightthickness=0, bd=0
+        )
+        
+        games_canvas = self.games_scroll._parent_canvas
+        scrollbar_set = self.games_scroll._scrollbar.set
+        
+        def on_games_scroll(first, last):
+            scrollbar_set(first, last)
+            self._schedule_games_render()
+        
+        games_canvas.configure(yscrollcommand=on_games_scroll)
+        games_canvas.bind("<Configure>", self._schedule_games_render, add="+")
+        
+        # Game view widgets kept between _build_game_view calls
+        self._view_game: Optional[Dict[str, Any]] = None
+        self._placeholder_shown = False
+        self._backups_frame: Optional[ctk.CTkFrame] = None
+        self._collection_cards: Dict[str, CollectionCard] = {}
+        self._collection_order: List[str] = []
+        self._backups_message: Optional[ctk.CTkFrame] = None
+        self._backups_message_lines: tuple = ()
+        
         # Bottom section
         bottom = ctk.CTkFrame(self.sidebar, fg_color="transparent", height=90)
         bottom.pack(fill="x", side="bottom")
@@ -494,6 +1195,18 @@ class GameVaultWindow(ctk.CTk):
         )
         self.content_area.pack(fill="both", expand=True, padx=32, pady=24)
         
+        # Backup rows build their widgets as they scroll into view
+        self._materialize_pending = False
+        content_canvas = self.content_area._parent_canvas
+        content_scrollbar_set = self.content_area._scrollbar.set
+        
+        def on_content_scroll(first, last):
+            content_scrollbar_set(first, last)
+            self._schedule_materialize_rows()
+        
+        content_canvas.configure(yscrollcommand=on_content_scroll)
+        content_canvas.bind("<Configure>", self._schedule_materialize_rows, add="+")
+        
         # Load games
         self._refresh_games()
         self._build_placeholder_content()
@@ -518,175 +1231,147 @@ class GameVaultWindow(ctk.CTk):
     
     def _refresh_games(self):
         """Refresh the games list"""
-        for widget in self.games_scroll.winfo_children():
-            widget.destroy()
-        
         if not self.user_games:
-            # Empty state
-            empty = ctk.CTkFrame(self.games_scroll, fg_color="transparent")
-            empty.pack(fill="x", pady=20)
-            
-            ctk.CTkLabel(
-                empty,
-                text="No games added yet",
-                font=ui_font(size=13),
-                text_color=BRAND_COLORS["text_muted"]
-            ).pack()
+            for row in self._game_rows:
+                row.card.pack_forget()
+            self._games_top_spacer.pack_forget()
+            self._games_bottom_spacer.pack_forget()
+            self._games_range = None
+            self._games_visible = 0
             
-            ctk.CTkLabel(
-                empty,
-                text="Click '+ Add Game' to get started",
-                font=ui_font(size=11),
-                text_color=BRAND_COLORS["text_muted"]
-            ).pack(pady=(4, 0))
+            if self._games_empty is None:
+                # Empty state
+                self._games_empty = ctk.CTkFrame(self.games_scroll, fg_color="transparent")
+                
+                ctk.CTkLabel(
+                    self._games_empty,
+                    text="No games added yet",
+                    font=ui_font(size=13),
+                    text_color=BRAND_COLORS["text_muted"]
+                ).pack()
+                
+                ctk.CTkLabel(
+                    self._games_empty,
+                    text="Click '+ Add Game' to get started",
+                    font=ui_font(size=11),
+                    text_color=BRAND_COLORS["text_muted"]
+                ).pack(pady=(4, 0))
+            self._games_empty.pack(fill="x", pady=20)
             return
         
-        for game in self.user_games:
-            self._create_game_button(game)
+        if self._games_empty is not None:
+            self._games_empty.pack_forget()
+        self._games_range = None  # Rebind every visible row
+        self._render_visible_games()
     
-    def _create_game_button(self, game: Dict[str, Any]):
-        """Create a game button in the sidebar"""
-        is_selected = (
-            self.selected_game and 
-            self.selected_game.get("id") == game.get("id")
-        )
-        
-        card = ctk.CTkFrame(
-            self.games_scroll,
-            fg_color=BRAND_COLORS["accent_bg"] if is_selected else BRAND_COLORS["bg_card"],
-            corner_radius=10,
-            border_width=1,
-            border_color=BRAND_COLORS["accent"] if is_selected else BRAND_COLORS["border"]
-        )
-        card.pack(fill="x", pady=6, padx=4)
-        
-        inner = ctk.CTkFrame(card, fg_color="transparent")
-        inner.pack(fill="x", padx=12, pady=10)
-        inner.grid_columnconfigure(1, weight=1)
-        
-        name_value = (game.get("name") or "").strip()
-        icon_letter = name_value[:1].upper() if name_value else "?"
-        icon = ctk.CTkFrame(
-            inner,
-            width=28,
-            height=28,
-            fg_color=BRAND_COLORS["accent_bg"] if is_selected else BRAND_COLORS["bg_hover"],
-            corner_radius=6
-        )
-        icon.grid(row=0, column=0, rowspan=2, sticky="w", padx=(0, 10))
-        icon.pack_propagate(False)
-        
-        icon_label = ctk.CTkLabel(
-            icon,
-            text=icon_letter,
-            font=ui_font(size=12, weight="bold"),
-            text_color=BRAND_COLORS["text_primary"] if is_selected else BRAND_COLORS["text_secondary"]
-        )
-        icon_label.pack(expand=True)
-        
-        # Game name
-        display_name = truncate_text(game.get("name", "Unknown"), SIDEBAR_GAME_NAME_MAX_CHARS)
-        name = ctk.CTkLabel(
-            inner,
-            text=display_name,
-            font=ui_font(size=13, weight="bold"),
-            text_color=BRAND_COLORS["text_primary"] if is_selected else BRAND_COLORS["text_secondary"],
-            anchor="w"
-        )
-        name.grid(row=0, column=1, sticky="ew")
-        
-        # Developer
-        developer_text = truncate_text(game.get("developer") or "Custom game", SIDEBAR_DEVELOPER_MAX_CHARS)
-        dev = ctk.CTkLabel(
-            inner,
-            text=developer_text,
-            font=ui_font(size=10),
-            text_color=BRAND_COLORS["text_muted"],
-            anchor="w"
-        )
-        dev.grid(row=1, column=1, sticky="ew")
-
-        remove_btn = ctk.CTkButton(
-            inner,
-            text="×",
-            command=lambda g=game: self._remove_game(g),
-            width=28,
-            height=28,
-            font=ui_font(size=14, weight="bold"),
-            fg_color="transparent",
-            hover_color=BRAND_COLORS["accent_muted"],
-            text_color=BRAND_COLORS["text_muted"],
-            corner_radius=6,
-        )
-        remove_btn.grid(row=0, column=3, rowspan=2, sticky="e", padx=(8, 0))
-        
-        status_dot = ctk.CTkFrame(
-            inner,
-            width=8,
-            height=8,
-            corner_radius=4,
-            fg_color=BRAND_COLORS["accent"] if is_selected else BRAND_COLORS["border"]
-        )
-        status_dot.grid(row=0, column=2, rowspan=2, sticky="e", padx=(8, 0))
-        status_dot.pack_propagate(False)
+    def _game_row_for(self, widget: Any) -> Optional[SidebarGameRow]:
+        """Walk up from an event widget to the SidebarGameRow that owns it."""
+        return card_row_for(self, widget)
+    
+    def _on_game_card_click(self, event):
+        row = self._game_row_for(event.widget)
+        if row is not None:
+            self._select_game(row.game)
+    
+    def _on_game_card_enter(self, event):
+        row = self._game_row_for(event.widget)
+        if row is not None:
+            row.on_enter()
+    
+    def _on_game_card_leave(self, event):
+        row = self._game_row_for(event.widget)
+        if row is not None:
+            row.on_leave()
+    
+    def _schedule_games_render(self, *_args):
+        """Re-window the sidebar rows on the next loop pass (coalesces scroll/resize bursts)."""
+        if not self._games_render_pending:
+            self._games_render_pending = True
+            self.after(0, self._render_visible_games)
+    
+    def _render_visible_games(self):
+        """
+        Show only the sidebar rows in (or just around) the scroll viewport.
+        A small pool of SidebarGameRow widgets is rebound to whichever games
+        are in view, and two spacer frames stand in for the rows above and
+        below so the list keeps its full scroll height.
+        """
+        self._games_render_pending = False
+        games = self.user_games or []
+        total = len(games)
+        if not total:
+            return
         
-        def apply_state(state: str):
-            if state == "selected":
-                card.configure(
-                    fg_color=BRAND_COLORS["accent_bg"],
-                    border_color=BRAND_COLORS["accent"]
-                )
-                icon.configure(fg_color=BRAND_COLORS["accent"])
-                icon_label.configure(text_color=BRAND_COLORS["text_primary"])
-                name.configure(text_color=BRAND_COLORS["text_primary"])
-                dev.configure(text_color=BRAND_COLORS["text_secondary"])
-                status_dot.configure(fg_color=BRAND_COLORS["accent"])
-            elif state == "hover":
-                card.configure(
-                    fg_color=BRAND_COLORS["bg_hover"],
-                    border_color=BRAND_COLORS["border_hover"]
-                )
-                icon.configure(fg_color=BRAND_COLORS["border_hover"])
-                icon_label.configure(text_color=BRAND_COLORS["text_primary"])
-                name.configure(text_color=BRAND_COLORS["text_primary"])
-                dev.configure(text_color=BRAND_COLORS["text_muted"])
-                status_dot.configure(fg_color=BRAND_COLORS["accent"])
-            else:
-                card.configure(
-                    fg_color=BRAND_COLORS["bg_card"],
-                    border_color=BRAND_COLORS["border"]
-                )
-                icon.configure(fg_color=BRAND_COLORS["bg_hover"])
-                icon_label.configure(text_color=BRAND_COLORS["text_secondary"])
-                name.configure(text_color=BRAND_COLORS["text_secondary"])
-                dev.configure(text_color=BRAND_COLORS["text_muted"])
-                status_dot.configure(fg_color=BRAND_COLORS["border"])
-        
-        apply_state("selected" if is_selected else "normal")
-        
-        # Make clickable
-        def on_enter(_event):
-            if not is_selected:
-                apply_state("hover")
-        
-        def on_leave(_event):
-            if not is_selected:
-                apply_state("normal")
-        
-        for widget in [card, inner, icon, icon_label, name, dev, status_dot]:
-            widget.bind("<Button-1>", lambda e, g=game: self._select_game(g))
-            widget.bind("<Enter>", on_enter)
-            widget.bind("<Leave>", on_leave)
-            widget.configure(cursor="hand2")
+        row_height = self._games_row_height or SIDEBAR_ROW_HEIGHT_ESTIMATE
+        canvas = self.games_scroll._parent_canvas
+        viewport = canvas.winfo_height()
+        if viewport <= 1:
+            viewport = SIDEBAR_VIEWPORT_FALLBACK  # Not mapped yet
+        top = max(0, int(canvas.canvasy(0)))
+        first = min(max(0, top // row_height - SIDEBAR_ROW_OVERSCAN), total - 1)
+        last = min(total, (top + viewport) // row_height + 1 + SIDEBAR_ROW_OVERSCAN)
+        if (first, last, total) == self._games_range:
+            return
+        self._games_range = (first, last, total)
+        
+        count = last - first
+        while len(self._game_rows) < count:
+            self._game_rows.append(SidebarGameRow(self.games_scroll, self))
+        for row in self._game_rows[count:self._games_visible]:
+            row.card.pack_forget()
+        
+        selected_id = self.selected_game.get("id") if self.selected_game else None
+        top_height = first * row_height
+        bottom_height = (total - last) * row_height
+        
+        # Packing in order moves each widget to the end, so this restores
+        # spacer / rows / spacer order without touching the row contents
+        if top_height:
+            self._games_top_spacer.configure(height=top_height)
+            self._games_top_spacer.pack(fill="x")
+        else:
+            self._games_top_spacer.pack_forget()
+        for row, game in zip(self._game_rows, games[first:last]):
+            row.show(game, game.get("id") == selected_id)
+            row.card.pack(fill="x", pady=SIDEBAR_ROW_PADY, padx=4)
+        if bottom_height:
+            self._games_bottom_spacer.configure(height=bottom_height)
+            self._games_bottom_spacer.pack(fill="x")
+        else:
+            self._games_bottom_spacer.pack_forget()
+        self._games_visible = count
+        
+        if not self._games_row_height:
+            # Measure the real row pitch (card plus scaled padding) once
+            self.games_scroll.update_idletasks()
+            content = self.games_scroll.winfo_reqheight() - top_height - bottom_height
+            if content > count:
+                self._games_row_height = max(1, content // count)
+                self._games_range = None
+                self._render_visible_games()
     
     def _select_game(self, game: Dict[str, Any]):
         """Select a game"""
+        previous = self.selected_game
         self.selected_game = game
-        self._refresh_games()
+        self._update_selection(previous, game)
         self._build_game_view(game)
     
+    def _update_selection(self, old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]):
+        """Restyle just the visible sidebar rows whose selection changed."""
+        old_id = old.get("id") if old else None
+        new_id = new.get("id") if new else None
+        for row in self._game_rows[:self._games_visible]:
+            row_id = row.game.get("id")
+            if row_id is not None and row_id in (old_id, new_id):
+                row.show(row.game, row_id == new_id)
+    
     def _build_placeholder_content(self):
-        """Build placeholder content"""
+        """Build placeholder content (kept as is if it is already showing)"""
+        self._view_game = None
+        if self._placeholder_shown:
+            return
+        self._placeholder_shown = True
         for widget in self.header.winfo_children():
             widget.destroy()
         for widget in self.content_area.winfo_children():
@@ -726,6 +1411,13 @@ class GameVaultWindow(ctk.CTk):
     
     def _build_game_view(self, game: Dict[str, Any]):
         """Build the main view for a selected game"""
+        if game is not self._view_game:
+            self._build_game_chrome(game)
+        self._render_backups(game)
+    
+    def _build_game_chrome(self, game: Dict[str, Any]):
+        """Build the per-game header, actions row and (empty) backups frame"""
+        self._placeholder_shown = False
         # Clear
         for widget in self.header.winfo_children():
             widget.destroy()
@@ -751,7 +1443,7 @@ class GameVaultWindow(ctk.CTk):
         settings_btn = ctk.CTkButton(
             title_row,
             text=ICON_SETTINGS,
-            command=lambda g=game: self._show_game_settings(g),
+            command=partial(self._show_game_settings, game),
             width=28,
             height=28,
             font=icon_font(size=ICON_FONT_SIZE, weight="bold"),
@@ -767,7 +1459,7 @@ class GameVaultWindow(ctk.CTk):
         del_btn = ctk.CTkButton(
             title_row,
             text=ICON_REMOVE,
-            command=lambda: self._remove_game(game),
+            command=partial(self._remove_game, game),
             width=28,
             height=28,
             font=icon_font(size=ICON_FONT_SIZE, weight="bold"),
@@ -805,7 +1497,7 @@ class GameVaultWindow(ctk.CTk):
                 actions,
                 icon=ICON_PLAY,
                 label="Play",
-                command=lambda: self._launch_game(game),
+                command=partial(self._launch_game, game),
                 fg_color=BRAND_COLORS["success"],
                 hover_color=BRAND_COLORS["success"],
                 text_color=BRAND_COLORS["bg_dark"],
@@ -819,7 +1511,7 @@ class GameVaultWindow(ctk.CTk):
                 actions,
                 icon=ICON_BACKUP_PLAY,
                 label="Backup & Play",
-                command=lambda: self._backup_and_play(game),
+                command=partial(self._backup_and_play, game),
                 fg_color=BRAND_COLORS["accent_bg"],
                 hover_color=BRAND_COLORS["accent_muted"],
                 text_color=BRAND_COLORS["text_primary"],
@@ -832,7 +1524,7 @@ class GameVaultWindow(ctk.CTk):
                 actions,
                 icon=ICON_BACKUP,
                 label="Backup Now",
-                command=lambda: self._backup_game(game),
+                command=partial(self._backup_game, game),
                 fg_color=BRAND_COLORS["accent"],
                 hover_color=BRAND_COLORS["accent_hover"],
                 text_color=BRAND_COLORS["text_primary"],
@@ -845,7 +1537,7 @@ class GameVaultWindow(ctk.CTk):
                 actions,
                 icon=ICON_OPEN_FOLDER,
                 label="Open Save",
-                command=lambda: self._open_save_folder(game),
+                command=partial(self._open_save_folder, game),
                 fg_color=BRAND_COLORS["bg_hover"],
                 hover_color=BRAND_COLORS["border_hover"],
                 text_color=BRAND_COLORS["text_secondary"],
@@ -858,7 +1550,7 @@ class GameVaultWindow(ctk.CTk):
                 actions,
                 icon=ICON_SCRIPT,
                 label="Backup Script",
-                command=lambda: self._generate_quick_backup_bat(game),
+                command=partial(self._generate_quick_backup_bat, game),
                 fg_color=BRAND_COLORS["bg_hover"],
                 hover_color=BRAND_COLORS["border_hover"],
                 text_color=BRAND_COLORS["text_secondary"],
@@ -884,7 +1576,7 @@ class GameVaultWindow(ctk.CTk):
         ctk.CTkButton(
             backups_header,
             text="Manage Collections",
-            command=lambda g=game: self._show_manage_collections(g),
+            command=partial(self._show_manage_collections, game),
             height=28,
             font=ui_font(size=11, weight="bold"),
             fg_color=BRAND_COLORS["bg_hover"],
@@ -901,38 +1593,68 @@ class GameVaultWindow(ctk.CTk):
         )
         backups_frame.pack(fill="both", expand=True)
         
+        self._view_game = game
+        self._backups_frame = backups_frame
+        self._collection_cards = {}
+        self._collection_order = []
+        self._backups_message = None
+        self._backups_message_lines = ()
+    
+    def _render_backups(self, game: Dict[str, Any]):
+        """Fill the backups frame (asynchronously, see _populate_backups)"""
         if not self.engine:
-            ctk.CTkLabel(
-                backups_frame,
-                text="Set a backup directory in Settings first",
-                font=ui_font(size=12),
-                text_color=BRAND_COLORS["text_muted"]
-            ).pack(pady=40)
+            self._show_backups_message(("Set a backup directory in Settings first", 12, 40))
             return
         
-        backups = self.engine.get_backups(game.get("id", ""))
+        # List the backups on a worker thread; rows already on screen stay
+        # until the fresh list arrives
+        self._build_token += 1
+        token = self._build_token
+        if not self._collection_cards and self._backups_message is None:
+            self._show_backups_message(("Loading backups...", 12, 40))
+        
+        future = self._io_executor.submit(self.engine.get_backups, game.get("id", ""))
+        
+        def on_done(done_future):
+            try:
+                backups = done_future.result()
+            except Exception:
+                backups = []
+            try:
+                self.after(0, lambda: self._populate_backups(game, token, backups))
+            except Exception:
+                pass  # Window closed meanwhile
+        
+        future.add_done_callback(on_done)
+    
+    def _populate_backups(self, game: Dict[str, Any], token: int, backups: List[Dict[str, Any]]):
+        """
+        Show a get_backups result, unless the view moved on since it was
+        requested. Collection cards and backup rows from the previous render
+        are kept (keyed by collection ID and backup path) and only updated;
+        just the ones that appeared or went away are created or destroyed.
+        """
+        if token != self._build_token or game is not self._view_game:
+            return
         
         if not backups:
-            ctk.CTkLabel(
-                backups_frame,
-                text="No backups yet",
-                font=ui_font(size=13),
-                text_color=BRAND_COLORS["text_muted"]
-            ).pack(pady=(30, 4))
-            ctk.CTkLabel(
-                backups_frame,
-                text="Click 'Backup Now' to create your first backup",
-                font=ui_font(size=11),
-                text_color=BRAND_COLORS["text_muted"]
-            ).pack(pady=(0, 30))
+            self._show_backups_message(
+                ("No backups yet", 13, (30, 4)),
+                ("Click 'Backup Now' to create your first backup", 11, (0, 30)),
+            )
             return
         
-        collections = self._get_game_collections(game.get("id", ""))
+        game_id = game.get("id", "")
+        collections = self._get_game_collections(game_id)
         collection_map = {collection["id"]: collection["name"] for collection in collections}
-        updated = False
-
+        
+        # Bucket backups by collection in one pass (newest first, like backups)
+        buckets: Dict[str, List[Dict[str, Any]]] = {}
         for backup in backups:
-            collection_id = backup.get("collection_id") or "default"
+            buckets.setdefault(backup.get("collection_id") or "default", []).append(backup)
+        
+        updated = False
+        for collection_id in buckets:
             if collection_id not in collection_map:
                 collections.append(
                     {
@@ -944,8 +1666,9 @@ class GameVaultWindow(ctk.CTk):
                 updated = True
 
         if updated:
-            self.config.setdefault("backup_collections", {})[game.get("id", "")] = collections
-            self.config_manager.save_config(self.config)
+            self._collections_by_game[game_id] = collections
+            self._collections_version += 1
+            self._mark_config_dirty()
 
         def collection_sort_key(item: Dict[str, str]) -> str:
             if item.get("id") == "default":
@@ -954,57 +1677,100 @@ class GameVaultWindow(ctk.CTk):
 
         collections_sorted = sorted(collections, key=collection_sort_key)
 
+        if self._backups_message is not None:
+            self._backups_message.destroy()
+            self._backups_message = None
+            self._backups_message_lines = ()
+        
+        cards = self._collection_cards
+        order = []
         for collection in collections_sorted:
             collection_id = collection.get("id", "default")
+            if collection_id in order:
+                continue  # Duplicate entry in the config
             collection_name = truncate_text(
                 collection.get("name", "Collection"),
                 COLLECTION_NAME_MAX_CHARS
             )
-            collection_backups = [
-                backup for backup in backups
-                if (backup.get("collection_id") or "default") == collection_id
-            ]
-
-            collection_card = ctk.CTkFrame(
-                backups_frame,
-                fg_color=BRAND_COLORS["bg_hover"],
-                corner_radius=8
-            )
-            collection_card.pack(fill="x", padx=8, pady=8)
-
-            card_header = ctk.CTkFrame(collection_card, fg_color="transparent")
-            card_header.pack(fill="x", padx=16, pady=(12, 4))
-
-            ctk.CTkLabel(
-                card_header,
-                text=collection_name,
-                font=ui_font(size=13, weight="bold"),
-                text_color=BRAND_COLORS["text_primary"],
-                anchor="w"
-            ).pack(side="left")
-
-            ctk.CTkLabel(
-                card_header,
-                text=f"{len(collection_backups)} backups",
-                font=ui_font(size=11),
-                text_color=BRAND_COLORS["text_muted"],
-                anchor="e"
-            ).pack(side="right")
-
-            if not collection_backups:
-                ctk.CTkLabel(
-                    collection_card,
-                    text="No backups in this collection yet.",
-                    font=ui_font(size=11),
-                    text_color=BRAND_COLORS["text_muted"]
-                ).pack(padx=16, pady=(0, 12), anchor="w")
-                continue
-
-            backups_inner = ctk.CTkFrame(collection_card, fg_color="transparent")
-            backups_inner.pack(fill="both", expand=True, padx=12, pady=(0, 12))
-
-            for backup in collection_backups:
-                self._create_backup_row(backups_inner, backup, game)
+            collection_backups = buckets.get(collection_id, [])
+            
+            card = cards.get(collection_id)
+            if card is None:
+                card = cards[collection_id] = CollectionCard(self._backups_frame, self)
+            card.show(collection_name, collection_backups, game)
+            order.append(collection_id)
+        
+        for collection_id in set(cards) - set(order):
+            cards.pop(collection_id).frame.destroy()
+        
+        if order != self._collection_order:
+            # Re-packing in order moves each card to the end
+            for collection_id in order:
+                cards[collection_id].frame.pack(fill="x", padx=8, pady=8)
+            self._collection_order = order
+        
+        self._schedule_materialize_rows()
+    
+    def _schedule_materialize_rows(self, *_args):
+        """Build the backup rows near the viewport once layout has settled."""
+        if not self._materialize_pending:
+            self._materialize_pending = True
+            self.after_idle(self._materialize_visible_rows)
+    
+    def _materialize_visible_rows(self):
+        """
+        Build placeholder backup rows within one viewport height of the
+        visible area, BACKUP_ROW_BUILD_CHUNK at a time; each chunk gets
+        drawn before the next idle pass builds more.
+        """
+        self._materialize_pending = False
+        canvas = self.content_area._parent_canvas
+        try:
+            top = canvas.winfo_rooty()
+            height = canvas.winfo_height()
+        except tk.TclError:
+            return
+        low, high = top - height, top + 2 * height
+        
+        measured = BackupRow.placeholder_height != BACKUP_ROW_HEIGHT_ESTIMATE
+        budget = BACKUP_ROW_BUILD_CHUNK
+        for card in self._collection_cards.values():
+            for row in card.rows.values():
+                if not row.built:
+                    if budget and low <= row.frame.winfo_rooty() <= high:
+                        row.build()
+                        budget -= 1
+                        if not budget:
+                            # Carry on once this chunk has been drawn
+                            self._schedule_materialize_rows()
+                elif not measured and row.frame.winfo_height() > 1:
+                    # Size later placeholders like real rows (in unscaled units)
+                    scale = row.frame._apply_widget_scaling(1.0) or 1.0
+                    BackupRow.placeholder_height = max(1, round(row.frame.winfo_height() / scale))
+                    measured = True
+    
+    def _show_backups_message(self, *lines: tuple):
+        """Replace the backups list with muted (text, font size, pady) message lines"""
+        for card in self._collection_cards.values():
+            card.frame.destroy()
+        self._collection_cards = {}
+        self._collection_order = []
+        
+        if self._backups_message is not None:
+            if lines == self._backups_message_lines:
+                return
+            self._backups_message.destroy()
+        
+        self._backups_message = ctk.CTkFrame(self._backups_frame, fg_color="transparent")
+        self._backups_message.pack(fill="x")
+        for text, size, pady in lines:
+            ctk.CTkLabel(
+                self._backups_message,
+                text=text,
+                font=ui_font(size=size),
+                text_color=BRAND_COLORS["text_muted"]
+            ).pack(pady=pady)
+        self._backups_message_lines = lines
 
     def _create_action_item(
         self,
@@ -1035,112 +1801,24 @@ class GameVaultWindow(ctk.CTk):
         return btn
 
     
-    def _create_backup_row(self, parent, backup: Dict[str, Any], game: Dict[str, Any]):
-        """Create a backup row"""
-        row = ctk.CTkFrame(parent, fg_color=BRAND_COLORS["bg_hover"], corner_radius=6)
-        row.pack(fill="x", pady=3)
-        
-        inner = ctk.CTkFrame(row, fg_color="transparent")
-        inner.pack(fill="x", padx=16, pady=12)
-        
-        # Info
-        info = ctk.CTkFrame(inner, fg_color="transparent")
-        info.pack(side="left", fill="x", expand=True)
-        
-        # Date
-        try:
-            dt = datetime.fromisoformat(backup.get("backup_time", ""))
-            date_str = dt.strftime("%b %d, %Y at %I:%M %p")
-        except Exception:
-            date_str = backup.get("backup_name", "Unknown")
-
-        # Size info
-        size_str = BackupEngine.format_size(backup.get("size", 0))
-        compressed = backup.get("is_compressed", False)
-        info_text = f"Size: {size_str}" + (" (compressed)" if compressed else "")
-
-        display_name = (backup.get("display_name") or "").strip()
-        title_text = display_name if display_name else date_str
-        title_text = truncate_text(title_text, BACKUP_DISPLAY_NAME_MAX_CHARS)
-        meta_text = f"{date_str} | {info_text}" if display_name else info_text
-
-        ctk.CTkLabel(
-            info,
-            text=title_text,
-            font=ui_font(size=13, weight="bold"),
-            text_color=BRAND_COLORS["text_primary"],
-            anchor="w"
-        ).pack(fill="x")
-
-        ctk.CTkLabel(
-            info,
-            text=meta_text,
-            font=ui_font(size=11),
-            text_color=BRAND_COLORS["text_muted"],
-            anchor="w"
-        ).pack(fill="x")
-        
-        # Actions
-        actions = ctk.CTkFrame(inner, fg_color="transparent")
-        actions.pack(side="right")
-        
-        ctk.CTkButton(
-            actions,
-            text="Restore",
-            command=lambda: self._restore_backup(backup, game),
-            width=72,
-            height=28,
-            font=ui_font(size=11),
-            fg_color=BRAND_COLORS["accent_muted"],
-            hover_color=BRAND_COLORS["accent"],
-            corner_radius=4
-        ).pack(side="left", padx=(0, 8))
-
-        ctk.CTkButton(
-            actions,
-            text="Rename",
-            command=lambda: self._rename_backup(backup, game),
-            width=72,
-            height=28,
-            font=ui_font(size=11),
-            fg_color=BRAND_COLORS["bg_hover"],
-            hover_color=BRAND_COLORS["border_hover"],
-            corner_radius=4
-        ).pack(side="left", padx=(0, 8))
-        
-        ctk.CTkButton(
-            actions,
-            text="Delete",
-            command=lambda: self._delete_backup(backup),
-            width=60,
-            height=28,
-            font=ui_font(size=11),
-            fg_color="transparent",
-            hover_color=BRAND_COLORS["accent_muted"],
-            text_color=BRAND_COLORS["text_muted"],
-            corner_radius=4
-        ).pack(side="left")
-    
     # ==========================================
     # ACTIONS
     # ==========================================
     def _show_add_game(self):
         """Show add game dialog"""
-        if not isinstance(self.user_games, list):
-            self.user_games = []
         dialog = AddGameDialog(self, self.game_db)
         self.wait_window(dialog)
         
         if dialog.result:
             # Add to user games
             self.user_games.append(dialog.result)
-            self.config["user_games"] = self.user_games
-            self.config_manager.save_config(self.config)
+            self._games_by_id.setdefault(dialog.result.get("id"), dialog.result)
+            self._mark_config_dirty()
             self._refresh_games()
             self._select_game(dialog.result)
 
     def _get_game_collections(self, game_id: str) -> List[Dict[str, Any]]:
-        collections_by_game = self.config.setdefault("backup_collections", {})
+        collections_by_game = self._collections_by_game
         collections = collections_by_game.get(game_id)
         default_limit = self.config.get("max_backups", DEFAULT_COLLECTION_LIMIT)
         try:
@@ -1148,6 +1826,16 @@ class GameVaultWindow(ctk.CTk):
         except (TypeError, ValueError):
             default_limit = DEFAULT_COLLECTION_LIMIT
 
+        checked = self._collections_checked.get(game_id)
+        if (
+            checked
+            and checked[0] is collections
+            and checked[1] == len(collections)
+            and checked[2] == default_limit
+        ):
+            # Unchanged since the last pass below; edits elsewhere keep entries valid
+            return collections
+
         updated = False
         if not collections:
             collections = [{
@@ -1182,9 +1870,22 @@ class GameVaultWindow(ctk.CTk):
                 updated = True
 
         if updated:
-            self.config_manager.save_config(self.config)
+            self._collections_version += 1
+            self._mark_config_dirty()
+        self._collections_checked[game_id] = (collections, len(collections), default_limit)
         return collections
 
+    def _collection_names(self, game_id: str, collections: List[Dict[str, Any]]) -> Dict[str, str]:
+        """Casefolded name -> ID for a game's collections, rebuilt only when the list changes."""
+        cached = self._collection_name_index.get(game_id)
+        if cached and cached[0] is collections and cached[1] == len(collections):
+            return cached[2]
+        index: Dict[str, str] = {}
+        for collection in collections:
+            index.setdefault(collection.get("name", "").casefold(), collection.get("id"))
+        self._collection_name_index[game_id] = (collections, len(collections), index)
+        return index
+
     def _get_collection_map(self, game_id: str) -> Dict[str, str]:
         return {collection["id"]: collection["name"] for collection in self._get_game_collections(game_id)}
 
@@ -1210,10 +1911,10 @@ class GameVaultWindow(ctk.CTk):
     def _collection_is_empty(self, game_id: str, collection_id: str) -> bool:
         if not self.engine:
             return True
-        backups = self.engine.get_backups(game_id)
-        return not any(backup.get("collection_id") == collection_id for backup in backups)
+        return collection_id not in self.engine.get_backup_collection_ids(game_id)
 
-    def _create_collection(self, game_id: str, name: str) -> Optional[str]:
+    def _create_collection(self, game_id: str, name: str, collection_id: Optional[str] = None) -> Optional[str]:
+        """Add a collection (or return the ID of one with that name); collection_id reuses a reserved ID."""
         name = (name or "").strip()
         if not name:
             return None
@@ -1223,18 +1924,21 @@ class GameVaultWindow(ctk.CTk):
             default_limit = int(default_limit)
         except (TypeError, ValueError):
             default_limit = DEFAULT_COLLECTION_LIMIT
-        for collection in collections:
-            if collection.get("name", "").lower() == name.lower():
-                return collection.get("id")
-        import uuid
-        new_id = uuid.uuid4().hex[:8]
+        names = self._collection_names(game_id, collections)
+        existing = names.get(name.casefold())
+        if existing is not None:
+            return existing
+        new_id = collection_id or short_id()
         collections.append({
             "id": new_id,
             "name": name,
             "limit_enabled": False,
             "max_backups": default_limit,
         })
-        self.config_manager.save_config(self.config)
+        names[name.casefold()] = new_id
+        self._collection_name_index[game_id] = (collections, len(collections), names)
+        self._collections_version += 1
+        self._mark_config_dirty()
         return new_id
 
     def _rename_collection(self, game_id: str, collection_id: str, new_name: str) -> Dict[str, Any]:
@@ -1242,13 +1946,18 @@ class GameVaultWindow(ctk.CTk):
         if not new_name:
             return {"success": False, "error": "Collection name is required."}
         collections = self._get_game_collections(game_id)
-        for collection in collections:
-            if collection.get("id") != collection_id and collection.get("name", "").lower() == new_name.lower():
-                return {"success": False, "error": "A collection with that name already exists."}
+        names = self._collection_names(game_id, collections)
+        owner = names.get(new_name.casefold())
+        if owner is not None and owner != collection_id:
+            return {"success": False, "error": "A collection with that name already exists."}
         for collection in collections:
             if collection.get("id") == collection_id:
+                if collection.get("name") == new_name:
+                    return {"success": True, "error": None}
                 collection["name"] = new_name
-                self.config_manager.save_config(self.config)
+                self._collection_name_index.pop(game_id, None)  # Rebuilt on next lookup
+                self._collections_version += 1
+                self._mark_config_dirty()
                 return {"success": True, "error": None}
         return {"success": False, "error": "Collection not found."}
 
@@ -1257,31 +1966,26 @@ class GameVaultWindow(ctk.CTk):
             return {"success": False, "error": "The default collection cannot be deleted."}
         if not self._collection_is_empty(game_id, collection_id):
             return {"success": False, "error": "Collection is not empty."}
-        collections = self._get_game_collections(game_id)
-        updated = [collection for collection in collections if collection.get("id") != collection_id]
-        self.config.setdefault("backup_collections", {})[game_id] = updated
-        self.config_manager.save_config(self.config)
+        self._drop_collections(game_id, {collection_id})
         return {"success": True, "error": None}
 
+    def _drop_collections(self, game_id: str, collection_ids: Iterable[str]) -> None:
+        """Remove collections from a game's list without checking that they are empty."""
+        remove_ids = set(collection_ids)
+        collections = self._get_game_collections(game_id)
+        updated = [collection for collection in collections if collection.get("id") not in remove_ids]
+        self._collections_by_game[game_id] = updated
+        self._collections_version += 1
+        self._mark_config_dirty()
+
     def _set_save_path(self, game: Dict[str, Any]):
         """Set or update the save folder path for a game."""
         path = filedialog.askdirectory(title="Select Save Folder")
         if not path:
             return
         
-        game["save_path"] = path
-        
-        for existing in self.user_games:
-            if existing.get("id") == game.get("id"):
-                existing["save_path"] = path
-                break
-        
-        if self.selected_game and self.selected_game.get("id") == game.get("id"):
-            self.selected_game["save_path"] = path
-        
-        self.config["user_games"] = self.user_games
-        self.config_manager.save_config(self.config)
-        self._build_game_view(game)
+        # The game view doesn't show paths, so it needs no rebuild
+        self._set_game_field(game, "save_path", path)
 
     def _set_game_exe_path(self, game: Dict[str, Any]) -> Optional[str]:
         """Set or update the game executable path."""
@@ -1292,27 +1996,23 @@ class GameVaultWindow(ctk.CTk):
         if not path:
             return None
 
-        game["exe_path"] = path
-
-        for existing in self.user_games:
-            if existing.get("id") == game.get("id"):
-                existing["exe_path"] = path
-                break
-
-        if self.selected_game and self.selected_game.get("id") == game.get("id"):
-            self.selected_game["exe_path"] = path
-
-        self.config["user_games"] = self.user_games
-        self.config_manager.save_config(self.config)
-        self._build_game_view(game)
+        self._set_game_field(game, "exe_path", path)
         return path
 
+    def _set_game_field(self, game: Dict[str, Any], key: str, value: Any) -> None:
+        """Set a field on a game, its saved user_games entry and the selection, then save."""
+        game_id = game.get("id")
+        game[key] = value
+        existing = self._games_by_id.get(game_id)
+        if existing is not None:
+            existing[key] = value
+        if self.selected_game and self.selected_game.get("id") == game_id:
+            self.selected_game[key] = value
+        self._mark_config_dirty()
+
     def _resolve_game_exe_path(self, game: Dict[str, Any]) -> Optional[str]:
-        raw_path = game.get("exe_path", "")
-        expanded_path = os.path.expandvars(raw_path) if raw_path else ""
-        if expanded_path and Path(expanded_path).exists():
-            return expanded_path
-        return None
+        expanded_path, exists = resolve_path(game.get("exe_path", ""))
+        return expanded_path if exists else None
 
     def _ensure_game_exe_path(self, game: Dict[str, Any]) -> Optional[str]:
         resolved = self._resolve_game_exe_path(game)
@@ -1352,17 +2052,25 @@ class GameVaultWindow(ctk.CTk):
     
     def _remove_game(self, game: Dict[str, Any]):
         """Remove a game from the list"""
-        if messagebox.askyesno(
+        if self._confirm(
+            "remove_game",
             "Remove Game",
             f"Remove {game.get('name')} from your list?\n\nThis won't delete your backups."
         ):
-            self.user_games = [g for g in self.user_games if g.get("id") != game.get("id")]
-            self.config["user_games"] = self.user_games
-            self.config_manager.save_config(self.config)
+            self._remove_games({game.get("id")})
             self.selected_game = None
-            self._refresh_games()
             self._build_placeholder_content()
 
+    def _remove_games(self, game_ids: Iterable[Any]) -> int:
+        """Drop every user_games entry with one of game_ids; returns how many IDs were present."""
+        remove_ids = {game_id for game_id in game_ids if self._games_by_id.pop(game_id, None) is not None}
+        if remove_ids:
+            # In place, so self.config["user_games"] stays the same list
+            self.user_games[:] = [g for g in self.user_games if g.get("id") not in remove_ids]
+            self._mark_config_dirty()
+        self._refresh_games()
+        return len(remove_ids)
+
     def _show_game_settings(self, game: Dict[str, Any]):
         """Show game-specific settings menu."""
         dialog = GameSettingsDialog(
@@ -1377,24 +2085,41 @@ class GameVaultWindow(ctk.CTk):
     
     def _show_settings(self):
         """Show settings dialog"""
-        dialog = SettingsDialog(self, self.config)
-        self.wait_window(dialog)
+        dialog = self._settings_dialog
+        if dialog is not None and dialog.winfo_exists():
+            dialog.reopen(self.config)
+        else:
+            dialog = self._settings_dialog = SettingsDialog(self, self.config)
+        dialog.wait_closed()
         
         if dialog.result:
-            self.config = dialog.result
-            self.config_manager.save_config(self.config)
+            self.config.update(dialog.result)
+            self._mark_config_dirty()
             
             # Re-initialize engine
             if self.config.get("backup_directory"):
                 self.engine = BackupEngine(
                     self.config["backup_directory"],
                     max_backups=self.config.get("max_backups", DEFAULT_COLLECTION_LIMIT),
+                    archive_format=self.config.get("archive_format", "zip"),
+                    compression_level=self.config.get("compression_level", 6),
+                    zstd_level=self.config.get("zstd_level", 3),
+                    hash_algo=self.config.get("hash_algo", "xxh3"),
                 )
             
             # Refresh view
             if self.selected_game:
                 self._build_game_view(self.selected_game)
 
+    def _get_bat_generator(self) -> Any:
+        """The session's BatGenerator, created on first use."""
+        if self._bat_generator is None:
+            # Imported here; most sessions never create a shortcut
+            from core.bat_generator import BatGenerator
+
+            self._bat_generator = BatGenerator(app_dir=str(APP_DIR), exe_path=find_app_exe())
+        return self._bat_generator
+
     def _generate_quick_backup_bat(self, game: Dict[str, Any]):
         """Generate a .bat shortcut that runs a CLI backup for this game."""
         game_id = (game.get("id") or "").strip()
@@ -1408,21 +2133,7 @@ class GameVaultWindow(ctk.CTk):
             return
 
         try:
-            app_dir = Path(__file__).resolve().parents[1]
-            exe_path = None
-            
-            # Check if running as exe (PyInstaller)
-            if getattr(sys, 'frozen', False):
-                # Running as compiled exe
-                exe_path = sys.executable
-            else:
-                # Running from source - check for dist/GameVault.exe
-                for exe_loc in [app_dir / "GameVault.exe", app_dir / "dist" / "GameVault.exe"]:
-                    if exe_loc.exists():
-                        exe_path = str(exe_loc)
-                        break
-
-            generator = BatGenerator(app_dir=str(app_dir), exe_path=exe_path)
+            generator = self._get_bat_generator()
             bat_path = generator.generate_bat(game_id=game_id, game_name=game_name, output_dir=output_dir)
 
             messagebox.showinfo(
@@ -1438,14 +2149,17 @@ class GameVaultWindow(ctk.CTk):
             messagebox.showerror("Error", "Please set a backup directory in Settings first.")
             return
         
+        # Whether the folder exists is checked on the backup thread; probing
+        # a network or cloud-synced path can stall the UI
         save_path = game.get("save_path", "")
-        expanded_path = os.path.expandvars(save_path) if save_path else ""
+        expanded_path = _expand_path(save_path) if save_path else ""
         
-        if not expanded_path or not Path(expanded_path).exists():
-            messagebox.showerror("Error", f"Save folder not found:\n{expanded_path}")
+        if not expanded_path:
+            messagebox.showerror("Error", "No save folder is set for this game.")
             return
 
-        collections = self._get_game_collections(game.get("id", ""))
+        game_id = game.get("id", "")
+        collections = self._get_game_collections(game_id)
         dialog = BackupMetaDialog(
             self,
             title="Create Backup",
@@ -1461,14 +2175,24 @@ class GameVaultWindow(ctk.CTk):
         collection_id = dialog.result.get("collection_id", "default")
         new_collection_name = dialog.result.get("new_collection_name", "")
 
+        new_collection_name = (new_collection_name or "").strip()
         if new_collection_name:
-            created_id = self._create_collection(game.get("id", ""), new_collection_name)
-            if not created_id:
-                messagebox.showerror("Error", "Please enter a collection name.")
-                return
-            collection_id = created_id
+            existing_id = self._collection_names(game_id, collections).get(new_collection_name.casefold())
+            if existing_id is not None:
+                collection_id = existing_id
+                new_collection_name = ""
+            else:
+                # Reserved only; _start_backup adds the collection once a backup lands in it
+                collection_id = short_id()
 
-        self._start_backup(game, expanded_path, display_name, collection_id, post_backup_action=post_backup_action)
+        self._start_backup(
+            game,
+            expanded_path,
+            display_name,
+            collection_id,
+            post_backup_action=post_backup_action,
+            new_collection_name=new_collection_name,
+        )
 
     def _start_backup(
         self,
@@ -1477,8 +2201,14 @@ class GameVaultWindow(ctk.CTk):
         display_name: str,
         collection_id: str,
         post_backup_action: Optional[Any] = None,
+        new_collection_name: str = "",
     ):
-        """Run backup in a thread with progress UI."""
+        """
+        Run backup in a thread with progress UI. If new_collection_name is
+        set, collection_id is a reserved ID that is only added as that
+        collection once the backup succeeds, so a failed or skipped backup
+        leaves no empty collection behind.
+        """
         if not self.engine:
             return
         
@@ -1493,15 +2223,14 @@ class GameVaultWindow(ctk.CTk):
         progress.resizable(False, False)
         
         # Center
-        progress.update_idletasks()
-        x = self.winfo_x() + (self.winfo_width() - 320) // 2
-        y = self.winfo_y() + (self.winfo_height() - 100) // 2
-        progress.geometry(f"+{x}+{y}")
+        center_on_parent(progress, self, 320, 100)
         
         progress_body = ctk.CTkFrame(progress, fg_color="transparent")
         progress_body.pack(fill="both", expand=True, padx=16, pady=16)
         
-        progress_name = truncate_text(game.get("name", ""), PROGRESS_GAME_NAME_MAX_CHARS)
+        game_id = game.get("id", "")
+        game_name = game.get("name", "")
+        progress_name = truncate_text(game_name, PROGRESS_GAME_NAME_MAX_CHARS)
         ctk.CTkLabel(
             progress_body,
             text=f"Backing up {progress_name}...",
@@ -1520,32 +2249,75 @@ class GameVaultWindow(ctk.CTk):
         self._progress_window = progress
         self._spinner_running = True
         
-        def spin(index: int = 0):
+        frames = itertools.cycle(SPINNER_FRAMES)
+        
+        def spin():
             if not getattr(self, "_spinner_running", False):
                 return
-            frames = ["|", "/", "-", "\\"]
-            spinner_label.configure(text=frames[index % len(frames)])
-            self._spinner_after_id = progress.after(120, lambda: spin(index + 1))
+            frame = next(frames)
+            if progress.winfo_viewable():  # No redraws while minimized / hidden
+                spinner_label.configure(text=frame)
+            self._spinner_after_id = progress.after(SPINNER_INTERVAL_MS, spin)
         
         spin()
         
+        # Read from the config here: the worker thread must not touch it (or Tk)
+        retention = self._get_collection_retention(game_id, collection_id)
+        retention_enabled = retention.get("enabled", False)
+        retention_limit = retention.get("limit") if retention_enabled else None
+        
+        engine = self.engine
+        
         def do_backup():
-            retention = self._get_collection_retention(game.get("id", ""), collection_id)
-            retention_enabled = retention.get("enabled", False)
-            retention_limit = retention.get("limit") if retention_enabled else None
-            result = self.engine.backup_game(
-                game.get("id", ""),
-                game.get("name", ""),
-                expanded_path,
-                display_name=display_name,
-                collection_id=collection_id,
-                retention_enabled=retention_enabled,
-                retention_limit=retention_limit,
-            )
-            self.after(0, lambda: self._on_backup_complete(result, game, post_backup_action))
+            try:
+                if not os.path.isdir(expanded_path):
+                    result = {"success": False, "error": f"Save folder not found:\n{expanded_path}"}
+                else:
+                    result = engine.backup_game(
+                        game_id,
+                        game_name,
+                        expanded_path,
+                        display_name=display_name,
+                        collection_id=collection_id,
+                        retention_enabled=retention_enabled,
+                        retention_limit=retention_limit,
+                    )
+            except Exception as e:
+                # The executor would swallow this and leave the progress window up
+                result = {"success": False, "error": str(e)}
+            self.after(0, lambda: complete(result))
+        
+        def complete(result: Dict[str, Any]):
+            if new_collection_name and result.get("success") and not result.get("skipped"):
+                self._create_collection(game_id, new_collection_name, collection_id=collection_id)
+            self._on_backup_complete(result, game, post_backup_action)
+        
+        # Queued behind any running restore/delete (see _task_executor)
+        self._task_executor.submit(do_backup)
+    
+    def _run_task(self, work: Any, on_done: Any) -> None:
+        """Run work() off the UI thread; on_done(result) is called back on it."""
+        self.configure(cursor="watch")
+        future = self._task_executor.submit(work)
         
-        thread = threading.Thread(target=do_backup, daemon=True)
-        thread.start()
+        def finish(result: Dict[str, Any]):
+            try:
+                self.configure(cursor="")
+            except Exception:
+                pass
+            on_done(result)
+        
+        def on_future_done(done_future):
+            try:
+                result = done_future.result()
+            except Exception as e:
+                result = {"success": False, "error": str(e)}
+            try:
+                self.after(0, lambda: finish(result))
+            except Exception:
+                pass  # Window closed meanwhile
+        
+        future.add_done_callback(on_future_done)
     
     def _on_backup_complete(self, result: Dict[str, Any], game: Dict[str, Any], post_backup_action: Optional[Any] = None):
         """Handle backup completion"""
@@ -1579,7 +2351,8 @@ class GameVaultWindow(ctk.CTk):
 
     def _rename_backup(self, backup: Dict[str, Any], game: Dict[str, Any]):
         """Rename a backup or move it to a collection."""
-        collections = self._get_game_collections(game.get("id", ""))
+        game_id = game.get("id", "")
+        collections = self._get_game_collections(game_id)
         dialog = BackupMetaDialog(
             self,
             title="Edit Backup",
@@ -1596,12 +2369,21 @@ class GameVaultWindow(ctk.CTk):
         collection_id = dialog.result.get("collection_id", "default")
         new_collection_name = dialog.result.get("new_collection_name", "")
 
+        created_id = None  # Set when the collection is new, so a failed rename can drop it
         if new_collection_name:
-            created_id = self._create_collection(game.get("id", ""), new_collection_name)
-            if not created_id:
+            is_new = self._collection_names(game_id, collections).get(new_collection_name.strip().casefold()) is None
+            collection_id = self._create_collection(game_id, new_collection_name)
+            if not collection_id:
                 messagebox.showerror("Error", "Please enter a collection name.")
                 return
-            collection_id = created_id
+            if is_new:
+                created_id = collection_id
+
+        if (
+            (display_name or "").strip() == (backup.get("display_name") or "").strip()
+            and collection_id == backup.get("collection_id", "default")
+        ):
+            return  # Nothing changed; skip rewriting the metadata and the refresh
 
         result = self.engine.rename_backup(
             backup.get("path", ""),
@@ -1611,69 +2393,206 @@ class GameVaultWindow(ctk.CTk):
         if result.get("success"):
             self._build_game_view(game)
         else:
+            if created_id:
+                self._drop_collections(game_id, {created_id})
             messagebox.showerror("Rename Failed", result.get("error", "Unknown error"))
 
-    def _show_manage_collections(self, game: Dict[str, Any]):
-        dialog = ManageCollectionsDialog(self, game.get("id", ""))
-        self.wait_window(dialog)
-        if self.selected_game and self.selected_game.get("id") == game.get("id"):
-            self._build_game_view(game)
-    
-    def _restore_backup(self, backup: Dict[str, Any], game: Dict[str, Any]):
-        """Restore a backup"""
-        if not self.engine:
-            return
-        
-        if not messagebox.askyesno(
-            "Restore Backup",
-            f"Restore this backup?\n\nThis will overwrite your current saves for {game.get('name')}."
-        ):
-            return
-        
-        save_path = game.get("save_path", "")
-        expanded_path = os.path.expandvars(save_path) if save_path else ""
-        
-        result = self.engine.restore_backup(
-            backup.get("path", ""),
-            expanded_path
-        )
-        
-        if result["success"]:
-            messagebox.showinfo("Restored", "Backup restored successfully!")
-        else:
-            messagebox.showerror("Restore Failed", result.get("error", "Unknown error"))
-    
-    def _delete_backup(self, backup: Dict[str, Any]):
-        """Delete a backup"""
-        if not self.engine:
-            return
-        
-        if not messagebox.askyesno("Delete Backup", "Delete this backup permanently?"):
-            return
-        
-        # Get game_id from backup path
-        backup_path = Path(backup.get("path", ""))
-        if backup_path.exists():
-            result = self.engine.delete_backup(str(backup_path))
-            
-            if result["success"]:
-                # Refresh view
-                if self.selected_game:
-                    self._build_game_view(self.selected_game)
-            else:
-                messagebox.showerror("Delete Failed", result.get("error", "Unknown error"))
-        else:
-            messagebox.showerror("Delete Failed", "Backup does not exist")
-    
-    def _open_save_folder(self, game: Dict[str, Any]):
-        """Open save folder in explorer"""
-        save_path = game.get("save_path", "")
-        expanded_path = os.path.expandvars(save_path) if save_path else ""
-        
-        if expanded_path and Path(expanded_path).exists():
-            os.startfile(expanded_path)
-        else:
-            messagebox.showerror("Error", f"Folder not found:\n{expanded_path}")
+    def _show_manage_collections(self, game: Dict[str, Any]):
+        dialog = ManageCollectionsDialog(self, game.get("id", ""))
+        self.wait_window(dialog)
+        if self.selected_game and self.selected_game.get("id") == game.get("id"):
+            self._build_game_view(game)
+    
+    def _restore_backup(self, backup: Dict[str, Any], game: Dict[str, Any]):
+        """Restore a backup"""
+        if not self.engine:
+            return
+        
+        if not self._confirm(
+            "restore_backup",
+            "Restore Backup",
+            f"Restore this backup?\n\nThis will overwrite your current saves for {game.get('name')}.",
+            allow_dont_ask=False,
+        ):
+            return
+        
+        save_path = game.get("save_path", "")
+        expanded_path = _expand_path(save_path) if save_path else ""
+        
+        engine = self.engine
+        
+        def on_done(result: Dict[str, Any]):
+            if result["success"]:
+                messagebox.showinfo("Restored", "Backup restored successfully!")
+            else:
+                messagebox.showerror("Restore Failed", result.get("error", "Unknown error"))
+        
+        self._run_task(
+            lambda: engine.restore_backup(backup.get("path", ""), expanded_path),
+            on_done
+        )
+    
+    def _delete_backup(self, backup: Dict[str, Any]):
+        """Delete a backup"""
+        if not self.engine:
+            return
+        
+        if not self._confirm("delete_backup", "Delete Backup", "Delete this backup permanently?"):
+            return
+        
+        # Get game_id from backup path
+        backup_path = Path(backup.get("path", ""))
+        if backup_path.exists():
+            engine = self.engine
+            
+            def on_done(result: Dict[str, Any]):
+                if result["success"]:
+                    # Refresh view
+                    if self.selected_game:
+                        self._build_game_view(self.selected_game)
+                else:
+                    messagebox.showerror("Delete Failed", result.get("error", "Unknown error"))
+            
+            self._run_task(lambda: engine.delete_backup(str(backup_path)), on_done)
+        else:
+            messagebox.showerror("Delete Failed", "Backup does not exist")
+    
+    def _confirm(self, action: str, title: str, message: str, allow_dont_ask: bool = True) -> bool:
+        """
+        Ask a yes/no question, unless the user opted out of it for this session.
+        allow_dont_ask=False always asks; use it for actions that overwrite saves.
+        """
+        if allow_dont_ask and action in self._confirm_suppress:
+            return True
+        dialog = ConfirmDialog(self, title=title, message=message, allow_dont_ask=allow_dont_ask)
+        self.wait_window(dialog)
+        if dialog.result and dialog.dont_ask_again:
+            self._confirm_suppress.add(action)
+        return bool(dialog.result)
+
+    def _open_save_folder(self, game: Dict[str, Any]):
+        """Open save folder in explorer"""
+        expanded_path, exists = resolve_path(game.get("save_path", ""))
+        
+        if exists:
+            os.startfile(expanded_path)
+        else:
+            messagebox.showerror("Error", f"Folder not found:\n{expanded_path}")
+
+
+# ==========================================
+# CONFIRM DIALOG
+# ==========================================
+class ConfirmDialog(ctk.CTkToplevel):
+    """Yes/no confirmation with an optional "Don't ask again this session" checkbox."""
+
+    def __init__(
+        self,
+        parent: ctk.CTk,
+        *,
+        title: str,
+        message: str,
+        confirm_label: str = "Yes",
+        allow_dont_ask: bool = True,
+    ):
+        super().__init__(parent)
+
+        self.title(title)
+        self.geometry("420x240")
+        schedule_app_icon(self)
+        self.transient(parent)
+        self.grab_set()
+        self.configure(fg_color=BRAND_COLORS["bg_dark"])
+        self.resizable(False, False)
+        self.protocol("WM_DELETE_WINDOW", self._safe_close)
+
+        self.result = False
+        self.dont_ask_again = False
+
+        # Center
+        center_on_parent(self, parent, 420, 240)
+
+        self._build_ui(title, message, confirm_label, allow_dont_ask)
+
+    def _build_ui(self, title: str, message: str, confirm_label: str, allow_dont_ask: bool) -> None:
+        content = ctk.CTkFrame(self, fg_color="transparent")
+        content.pack(fill="both", expand=True, padx=28, pady=24)
+
+        content.grid_rowconfigure(0, weight=1)
+        content.grid_rowconfigure(1, weight=0)
+        content.grid_columnconfigure(0, weight=1)
+
+        body = ctk.CTkFrame(content, fg_color="transparent")
+        body.grid(row=0, column=0, sticky="nsew")
+
+        ctk.CTkLabel(
+            body,
+            text=title,
+            font=ui_font(size=18, weight="bold"),
+            text_color=BRAND_COLORS["text_primary"],
+            anchor="w"
+        ).pack(fill="x")
+
+        ctk.CTkLabel(
+            body,
+            text=message,
+            font=ui_font(size=12),
+            text_color=BRAND_COLORS["text_secondary"],
+            anchor="w",
+            justify="left",
+            wraplength=360
+        ).pack(fill="x", pady=(8, 12))
+
+        self.dont_ask_var = ctk.BooleanVar(value=False)
+        if allow_dont_ask:
+            ctk.CTkCheckBox(
+                body,
+                text="Don't ask again this session",
+                variable=self.dont_ask_var,
+                font=ui_font(size=11),
+                text_color=BRAND_COLORS["text_muted"],
+                fg_color=BRAND_COLORS["accent"],
+                hover_color=BRAND_COLORS["accent_hover"],
+                border_color=BRAND_COLORS["border"],
+                checkbox_width=18,
+                checkbox_height=18
+            ).pack(anchor="w")
+
+        btn_frame = ctk.CTkFrame(content, fg_color="transparent")
+        btn_frame.grid(row=1, column=0, sticky="ew", pady=(16, 0))
+
+        ctk.CTkButton(
+            btn_frame,
+            text="Cancel",
+            command=self._safe_close,
+            width=100,
+            height=36,
+            font=ui_font(size=12),
+            fg_color=BRAND_COLORS["bg_hover"],
+            hover_color=BRAND_COLORS["border_hover"]
+        ).pack(side="left")
+
+        ctk.CTkButton(
+            btn_frame,
+            text=confirm_label,
+            command=self._accept,
+            width=100,
+            height=36,
+            font=ui_font(size=12, weight="bold"),
+            fg_color=BRAND_COLORS["accent"],
+            hover_color=BRAND_COLORS["accent_hover"]
+        ).pack(side="right")
+
+        self.bind("<Return>", lambda _e: self._accept())
+        self.bind("<Escape>", lambda _e: self._safe_close())
+
+    def _accept(self) -> None:
+        self.result = True
+        self.dont_ask_again = bool(self.dont_ask_var.get())
+        self._safe_close()
+
+    def _safe_close(self) -> None:
+        safe_close_toplevel(self)
 
 
 # ==========================================
@@ -1694,14 +2613,11 @@ class SetupWizard(ctk.CTkToplevel):
         self.resizable(False, False)
         self.protocol("WM_DELETE_WINDOW", self._safe_close)
         
-        self.config = config.copy()
+        self.config = MappingProxyType(config)  # Read-only view; result holds the changes
         self.result = None
         
         # Center
-        self.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() - 500) // 2
-        y = parent.winfo_y() + (parent.winfo_height() - 400) // 2
-        self.geometry(f"+{x}+{y}")
+        center_on_parent(self, parent, 500, 400)
         
         self._build_ui()
     
@@ -1833,8 +2749,7 @@ class SetupWizard(ctk.CTkToplevel):
             messagebox.showerror("Error", f"Could not create directory:\n{e}")
             return
         
-        self.config["backup_directory"] = backup_dir
-        self.result = self.config
+        self.result = {"backup_directory": backup_dir}
         self._safe_close()
 
     def _safe_close(self):
@@ -1873,10 +2788,7 @@ class BackupMetaDialog(ctk.CTkToplevel):
         self.result: Optional[Dict[str, str]] = None
 
         # Center
-        self.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() - 460) // 2
-        y = parent.winfo_y() + (parent.winfo_height() - 360) // 2
-        self.geometry(f"+{x}+{y}")
+        center_on_parent(self, parent, 460, 360)
 
         self._build_ui(initial_display_name, initial_collection_id)
 
@@ -1907,13 +2819,7 @@ class BackupMetaDialog(ctk.CTkToplevel):
             anchor="w"
         ).pack(fill="x", pady=(4, 16))
 
-        ctk.CTkLabel(
-            body,
-            text="Backup Name (optional)",
-            font=ui_font(size=11, weight="bold"),
-            text_color=BRAND_COLORS["text_muted"],
-            anchor="w"
-        ).pack(fill="x")
+        field_label(body, "Backup Name (optional)").pack(fill="x")
 
         self.name_entry = ctk.CTkEntry(
             body,
@@ -1928,24 +2834,24 @@ class BackupMetaDialog(ctk.CTkToplevel):
         if initial_display_name:
             self.name_entry.insert(0, initial_display_name)
 
-        ctk.CTkLabel(
-            body,
-            text="Collection",
-            font=ui_font(size=11, weight="bold"),
-            text_color=BRAND_COLORS["text_muted"],
-            anchor="w"
-        ).pack(fill="x")
+        field_label(body, "Collection").pack(fill="x")
 
-        self.collection_names = [collection["name"] for collection in self.collections]
-        self.collection_name_to_id = {collection["name"]: collection["id"] for collection in self.collections}
+        # Names, name -> ID and the initial choice in one pass over the collections
         self.new_collection_label = "Create new collection"
+        self.collection_names: List[str] = []
+        self.collection_name_to_id: Dict[str, str] = {}
+        initial_name = None
+        for collection in self.collections:
+            name = collection["name"]
+            self.collection_names.append(name)
+            self.collection_name_to_id[name] = collection["id"]
+            if initial_name is None and collection.get("id") == initial_collection_id:
+                initial_name = collection.get("name")
+        if initial_name is None:
+            initial_name = self.collection_names[0] if self.collection_names else ""
         options = self.collection_names + [self.new_collection_label]
 
-        self.collection_var = ctk.StringVar(value=self.collection_names[0] if self.collection_names else "")
-        for collection in self.collections:
-            if collection.get("id") == initial_collection_id:
-                self.collection_var.set(collection.get("name", self.collection_var.get()))
-                break
+        self.collection_var = ctk.StringVar(value=initial_name)
 
         self.collection_menu = ctk.CTkOptionMenu(
             body,
@@ -2057,11 +2963,13 @@ class ManageCollectionsDialog(ctk.CTkToplevel):
         self.protocol("WM_DELETE_WINDOW", self._safe_close)
 
         # Center
-        self.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() - 560) // 2
-        y = parent.winfo_y() + (parent.winfo_height() - 460) // 2
-        self.geometry(f"+{x}+{y}")
+        center_on_parent(self, parent, 560, 460)
 
+        self._menu_version: Optional[int] = None  # parent's _collections_version behind the menu
+        self._menu_names: List[str] = []
+        self._selected_name = ""  # Mirrors collection_var, so handlers skip the Tcl read
+        # collection ID -> whether it has no backups, until the next refresh
+        self._empty_cache: Dict[str, bool] = {}
         self._build_ui()
         self._refresh_collections()
 
@@ -2098,20 +3006,14 @@ class ManageCollectionsDialog(ctk.CTkToplevel):
             anchor="w"
         ).pack(fill="x", pady=(4, 16))
 
-        ctk.CTkLabel(
-            body,
-            text="Select Collection",
-            font=ui_font(size=11, weight="bold"),
-            text_color=BRAND_COLORS["text_muted"],
-            anchor="w"
-        ).pack(fill="x")
+        field_label(body, "Select Collection").pack(fill="x")
 
         self.collection_var = ctk.StringVar(value="")
         self.collection_menu = ctk.CTkOptionMenu(
             body,
             values=[],
             variable=self.collection_var,
-            command=lambda _value: self._sync_selection(),
+            command=self._sync_selection,
             font=ui_font(size=12),
             fg_color=BRAND_COLORS["bg_card"],
             button_color=BRAND_COLORS["bg_hover"],
@@ -2122,13 +3024,7 @@ class ManageCollectionsDialog(ctk.CTkToplevel):
         )
         self.collection_menu.pack(fill="x", pady=(4, 12))
 
-        ctk.CTkLabel(
-            body,
-            text="Rename Selected",
-            font=ui_font(size=11, weight="bold"),
-            text_color=BRAND_COLORS["text_muted"],
-            anchor="w"
-        ).pack(fill="x")
+        field_label(body, "Rename Selected").pack(fill="x")
 
         self.rename_entry = ctk.CTkEntry(
             body,
@@ -2152,13 +3048,7 @@ class ManageCollectionsDialog(ctk.CTkToplevel):
         )
         self.rename_btn.pack(anchor="w", pady=(0, 16))
 
-        ctk.CTkLabel(
-            body,
-            text="Retention Limit (Per Collection)",
-            font=ui_font(size=11, weight="bold"),
-            text_color=BRAND_COLORS["text_muted"],
-            anchor="w"
-        ).pack(fill="x")
+        field_label(body, "Retention Limit (Per Collection)").pack(fill="x")
 
         self.retention_enabled_var = ctk.BooleanVar(value=False)
         self.retention_switch = ctk.CTkSwitch(
@@ -2210,13 +3100,7 @@ class ManageCollectionsDialog(ctk.CTkToplevel):
         )
         self.retention_hint.pack(fill="x", pady=(0, 16))
 
-        ctk.CTkLabel(
-            body,
-            text="Create New Collection",
-            font=ui_font(size=11, weight="bold"),
-            text_color=BRAND_COLORS["text_muted"],
-            anchor="w"
-        ).pack(fill="x")
+        field_label(body, "Create New Collection").pack(fill="x")
 
         self.new_entry = ctk.CTkEntry(
             body,
@@ -2278,33 +3162,42 @@ class ManageCollectionsDialog(ctk.CTkToplevel):
     def _refresh_collections(self, select_id: Optional[str] = None) -> None:
         collections = self.parent_window._get_game_collections(self.game_id)
         self.collections = collections
-        self.name_to_id = {collection["name"]: collection["id"] for collection in collections}
-        names = [collection["name"] for collection in collections]
-        self.collection_menu.configure(values=names)
+        self._empty_cache.clear()  # Create/rename/delete all land here
+        version = self.parent_window._collections_version
+        if version != self._menu_version:
+            # One pass for the menu values and both lookups
+            names: List[str] = []
+            name_to_id: Dict[str, str] = {}
+            id_to_name: Dict[str, str] = {}
+            for collection in collections:
+                name = collection["name"]
+                collection_id = collection["id"]
+                names.append(name)
+                name_to_id[name] = collection_id
+                id_to_name.setdefault(collection_id, name)
+            self.name_to_id = name_to_id
+            self._id_to_name = id_to_name
+            if names != self._menu_names:
+                # Each configure rebuilds every dropdown entry
+                self.collection_menu.configure(values=names)
+                self._menu_names = names
+            self._menu_version = version
+        names = self._menu_names
 
         selected_name = names[0] if names else ""
         if select_id:
-            for collection in collections:
-                if collection.get("id") == select_id:
-                    selected_name = collection.get("name", selected_name)
-                    break
+            selected_name = self._id_to_name.get(select_id, selected_name)
         self.collection_var.set(selected_name)
-        self.rename_entry.delete(0, "end")
-        if selected_name:
-            self.rename_entry.insert(0, selected_name)
-        self._update_delete_state()
-        self._load_retention_settings()
+        self._sync_selection(selected_name)
 
-    def _sync_selection(self) -> None:
-        selected_name = self.collection_var.get()
-        self.rename_entry.delete(0, "end")
-        if selected_name:
-            self.rename_entry.insert(0, selected_name)
+    def _sync_selection(self, selected_name: str) -> None:
+        self._selected_name = selected_name
+        set_entry_text(self.rename_entry, selected_name)
         self._update_delete_state()
         self._load_retention_settings()
 
     def _update_delete_state(self) -> None:
-        selected_name = self.collection_var.get()
+        selected_name = self._selected_name
         collection_id = self.name_to_id.get(selected_name)
         if not collection_id:
             self.delete_btn.configure(state="disabled")
@@ -2314,15 +3207,22 @@ class ManageCollectionsDialog(ctk.CTkToplevel):
             self.delete_btn.configure(state="disabled")
             self.delete_hint.configure(text="The default collection cannot be deleted.")
             return
-        if not self.parent_window._collection_is_empty(self.game_id, collection_id):
+        if not self._is_collection_empty(collection_id):
             self.delete_btn.configure(state="disabled")
             self.delete_hint.configure(text="Collection is not empty.")
             return
         self.delete_btn.configure(state="normal")
         self.delete_hint.configure(text="")
 
+    def _is_collection_empty(self, collection_id: str) -> bool:
+        empty = self._empty_cache.get(collection_id)
+        if empty is None:
+            empty = self.parent_window._collection_is_empty(self.game_id, collection_id)
+            self._empty_cache[collection_id] = empty
+        return empty
+
     def _get_selected_collection(self) -> Optional[Dict[str, Any]]:
-        selected_name = self.collection_var.get()
+        selected_name = self._selected_name
         collection_id = self.name_to_id.get(selected_name)
         if not collection_id:
             return None
@@ -2354,8 +3254,7 @@ class ManageCollectionsDialog(ctk.CTkToplevel):
 
         self.retention_enabled_var.set(enabled)
         self.retention_entry.configure(state="normal")
-        self.retention_entry.delete(0, "end")
-        self.retention_entry.insert(0, str(limit_value))
+        set_entry_text(self.retention_entry, str(limit_value))
 
     def _parse_retention_limit(self) -> Optional[int]:
         raw = self.retention_entry.get().strip()
@@ -2380,23 +3279,23 @@ class ManageCollectionsDialog(ctk.CTkToplevel):
 
         collection["max_backups"] = limit_value
         collection["limit_enabled"] = enabled
-        self.parent_window.config_manager.save_config(self.parent_window.config)
+        self.parent_window._mark_config_dirty()
         self._load_retention_settings()
 
     def _create_collection(self) -> None:
         name = self.new_entry.get().strip()
         if not name:
-            messagebox.showerror("Required", "Please enter a collection name.")
+            show_error_later(self, "Required", "Please enter a collection name.")
             return
         new_id = self.parent_window._create_collection(self.game_id, name)
         if not new_id:
-            messagebox.showerror("Error", "Unable to create collection.")
+            show_error_later(self, "Error", "Unable to create collection.")
             return
         self.new_entry.delete(0, "end")
         self._refresh_collections(select_id=new_id)
 
     def _rename_collection(self) -> None:
-        selected_name = self.collection_var.get()
+        selected_name = self._selected_name
         collection_id = self.name_to_id.get(selected_name)
         if not collection_id:
             return
@@ -2406,18 +3305,18 @@ class ManageCollectionsDialog(ctk.CTkToplevel):
             self.rename_entry.get()
         )
         if not result.get("success"):
-            messagebox.showerror("Rename Failed", result.get("error", "Unknown error"))
+            show_error_later(self, "Rename Failed", result.get("error", "Unknown error"))
             return
         self._refresh_collections(select_id=collection_id)
 
     def _delete_collection(self) -> None:
-        selected_name = self.collection_var.get()
+        selected_name = self._selected_name
         collection_id = self.name_to_id.get(selected_name)
         if not collection_id:
             return
         result = self.parent_window._delete_collection(self.game_id, collection_id)
         if not result.get("success"):
-            messagebox.showerror("Delete Failed", result.get("error", "Unknown error"))
+            show_error_later(self, "Delete Failed", result.get("error", "Unknown error"))
             return
         self._refresh_collections()
 
@@ -2428,6 +3327,96 @@ class ManageCollectionsDialog(ctk.CTkToplevel):
 # ==========================================
 # ADD GAME DIALOG
 # ==========================================
+class SuggestionRow(GameCardStyling):
+    """One Add Game suggestion card; AddGameDialog rebinds it to each search's results."""
+    
+    def __init__(self, parent: Any):
+        self.game: Dict[str, Any] = {}
+        self._source: Optional[tuple] = None  # Raw (name, developer) the labels were made from
+        
+        self.card = ctk.CTkFrame(
+            parent,
+            fg_color=BRAND_COLORS["bg_card"],
+            corner_radius=8,
+            border_width=1,
+            border_color=BRAND_COLORS["border"]
+        )
+        
+        inner = ctk.CTkFrame(self.card, fg_color="transparent")
+        inner.pack(fill="x", padx=10, pady=8)
+        
+        self.icon = ctk.CTkFrame(
+            inner,
+            width=24,
+            height=24,
+            fg_color=BRAND_COLORS["bg_hover"],
+            corner_radius=6
+        )
+        self.icon.pack(side="left", padx=(0, 8))
+        self.icon.pack_propagate(False)
+        
+        self.icon_label = ctk.CTkLabel(
+            self.icon,
+            text="?",
+            font=ui_font(size=11, weight="bold"),
+            text_color=BRAND_COLORS["text_secondary"]
+        )
+        self.icon_label.pack(expand=True)
+        
+        text_stack = ctk.CTkFrame(inner, fg_color="transparent")
+        text_stack.pack(side="left", fill="x", expand=True)
+        
+        self.name = ctk.CTkLabel(
+            text_stack,
+            text="",
+            font=ui_font(size=12, weight="bold"),
+            text_color=BRAND_COLORS["text_secondary"],
+            anchor="w"
+        )
+        self.name.pack(fill="x")
+        
+        self.dev = ctk.CTkLabel(
+            text_stack,
+            text="",
+            font=ui_font(size=10),
+            text_color=BRAND_COLORS["text_muted"],
+            anchor="w"
+        )
+        self.dev.pack(fill="x")
+        
+        self.status_dot = ctk.CTkFrame(
+            inner,
+            width=7,
+            height=7,
+            corner_radius=4,
+            fg_color=BRAND_COLORS["border"]
+        )
+        self.status_dot.pack(side="right", padx=(8, 0))
+        self.status_dot.pack_propagate(False)
+        
+        self.apply_state("normal")
+        
+        # Clicks and hover go through the dialog's SUGGESTION_CARD_BINDTAG
+        # class bindings, which find this row through card._gv_row
+        self.card._gv_row = self
+        add_bindtag(self.card, SUGGESTION_CARD_BINDTAG)
+        for widget in [self.card, inner, self.icon, self.icon_label, text_stack, self.name, self.dev, self.status_dot]:
+            widget.configure(cursor="hand2")
+    
+    def show(self, game: Dict[str, Any], selected: bool):
+        """Bind the card to a game, only reconfiguring what changed."""
+        self.game = game
+        self.selected = selected
+        source = (game.get("name", ""), game.get("developer", ""))
+        if source != self._source:
+            self._source = source
+            name_value = (game.get("name") or "").strip()
+            self.icon_label.configure(text=name_value[:1].upper() if name_value else "?")
+            self.name.configure(text=truncate_text(source[0], SUGGESTION_GAME_NAME_MAX_CHARS))
+            self.dev.configure(text=truncate_text(source[1], SUGGESTION_DEVELOPER_MAX_CHARS))
+        self.apply_state("selected" if selected else "normal")
+
+
 class AddGameDialog(ctk.CTkToplevel):
     """Dialog for adding a game"""
     
@@ -2446,12 +3435,14 @@ class AddGameDialog(ctk.CTkToplevel):
         self.game_db = game_db
         self.result = None
         self.selected_suggestion: Optional[Dict[str, Any]] = None
+        self._search_after_id: Optional[str] = None
+        # Suggestion cards, rebound to new results instead of rebuilt
+        self._suggestion_rows: List[SuggestionRow] = []
+        self._suggestions_visible = 0
+        self._suggestions_empty: Optional[ctk.CTkFrame] = None
         
         # Center
-        self.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() - 560) // 2
-        y = parent.winfo_y() + (parent.winfo_height() - 620) // 2
-        self.geometry(f"+{x}+{y}")
+        center_on_parent(self, parent, 560, 620)
         
         self._build_ui()
     
@@ -2493,13 +3484,7 @@ class AddGameDialog(ctk.CTkToplevel):
         search_frame = ctk.CTkFrame(body, fg_color="transparent")
         search_frame.pack(fill="x")
         
-        ctk.CTkLabel(
-            search_frame,
-            text="Search Games",
-            font=ui_font(size=11, weight="bold"),
-            text_color=BRAND_COLORS["text_muted"],
-            anchor="w"
-        ).pack(fill="x")
+        field_label(search_frame, "Search Games").pack(fill="x")
         
         self.search_entry = ctk.CTkEntry(
             search_frame,
@@ -2514,21 +3499,19 @@ class AddGameDialog(ctk.CTkToplevel):
         self.search_entry.bind("<KeyRelease>", self._on_search)
         
         # Suggestions
-        ctk.CTkLabel(
-            body,
-            text="Suggestions",
-            font=ui_font(size=11, weight="bold"),
-            text_color=BRAND_COLORS["text_muted"],
-            anchor="w"
-        ).pack(fill="x", pady=(16, 4))
+        field_label(body, "Suggestions").pack(fill="x", pady=(16, 4))
         
-        self.suggestions_frame = ctk.CTkScrollableFrame(
+        # Card events, shared by every suggestion card (see SuggestionRow)
+        self.bind_class(SUGGESTION_CARD_BINDTAG, "<Button-1>", self._on_suggestion_click)
+        self.bind_class(SUGGESTION_CARD_BINDTAG, "<Enter>", self._on_suggestion_enter)
+        self.bind_class(SUGGESTION_CARD_BINDTAG, "<Leave>", self._on_suggestion_leave)
+        
+        # Plain frame: there are at most SUGGESTION_SLOTS cards, and the
+        # dialog body around it already scrolls
+        self.suggestions_frame = ctk.CTkFrame(
             body,
-            height=120,
             fg_color=BRAND_COLORS["bg_card"],
-            corner_radius=8,
-            scrollbar_button_color=BRAND_COLORS["border"],
-            scrollbar_button_hover_color=BRAND_COLORS["border_hover"]
+            corner_radius=8
         )
         self.suggestions_frame.pack(fill="x")
         
@@ -2598,153 +3581,67 @@ class AddGameDialog(ctk.CTkToplevel):
         ).pack(side="right")
     
     def _populate_suggestions(self, query: str = ""):
-        """Populate suggestions list"""
-        for widget in self.suggestions_frame.winfo_children():
-            widget.destroy()
-        
-        games = self.game_db.search_games(query) if query else self.game_db.get_all_games()[:10]
+        """Populate suggestions list, reusing the card widgets from the last refresh"""
+        # An empty query returns the database head, sliced without copying the whole list
+        games = self.game_db.search_games(query, limit=SUGGESTION_SLOTS)
         
         if not games:
-            empty = ctk.CTkFrame(self.suggestions_frame, fg_color="transparent")
-            empty.pack(fill="x", padx=8, pady=12)
-            
-            ctk.CTkLabel(
-                empty,
-                text="No matches found",
-                font=ui_font(size=12, weight="bold"),
-                text_color=BRAND_COLORS["text_secondary"],
-                anchor="w"
-            ).pack(fill="x")
-            
-            ctk.CTkLabel(
-                empty,
-                text="Use 'Add Custom Game' to add it manually.",
-                font=ui_font(size=11),
-                text_color=BRAND_COLORS["text_muted"],
-                anchor="w"
-            ).pack(fill="x", pady=(4, 0))
+            for row in self._suggestion_rows:
+                row.card.pack_forget()
+            self._suggestions_visible = 0
+            if self._suggestions_empty is None:
+                self._suggestions_empty = ctk.CTkFrame(self.suggestions_frame, fg_color="transparent")
+                
+                ctk.CTkLabel(
+                    self._suggestions_empty,
+                    text="No matches found",
+                    font=ui_font(size=12, weight="bold"),
+                    text_color=BRAND_COLORS["text_secondary"],
+                    anchor="w"
+                ).pack(fill="x")
+                
+                ctk.CTkLabel(
+                    self._suggestions_empty,
+                    text="Use 'Add Custom Game' to add it manually.",
+                    font=ui_font(size=11),
+                    text_color=BRAND_COLORS["text_muted"],
+                    anchor="w"
+                ).pack(fill="x", pady=(4, 0))
+            self._suggestions_empty.pack(fill="x", padx=8, pady=12)
             return
         
-        for game in games[:8]:
-            self._create_suggestion_item(game)
-    
-    def _create_suggestion_item(self, game: Dict[str, Any]):
-        """Create a suggestion item"""
-        is_selected = (
-            self.selected_suggestion and
-            self.selected_suggestion.get("id") == game.get("id")
-        )
-        
-        card = ctk.CTkFrame(
-            self.suggestions_frame,
-            fg_color=BRAND_COLORS["accent_bg"] if is_selected else BRAND_COLORS["bg_card"],
-            corner_radius=8,
-            border_width=1,
-            border_color=BRAND_COLORS["accent"] if is_selected else BRAND_COLORS["border"]
-        )
-        card.pack(fill="x", padx=4, pady=3)
-        
-        inner = ctk.CTkFrame(card, fg_color="transparent")
-        inner.pack(fill="x", padx=10, pady=8)
-        
-        name_value = (game.get("name") or "").strip()
-        icon_letter = name_value[:1].upper() if name_value else "?"
-        icon = ctk.CTkFrame(
-            inner,
-            width=24,
-            height=24,
-            fg_color=BRAND_COLORS["accent_bg"] if is_selected else BRAND_COLORS["bg_hover"],
-            corner_radius=6
-        )
-        icon.pack(side="left", padx=(0, 8))
-        icon.pack_propagate(False)
-        
-        icon_label = ctk.CTkLabel(
-            icon,
-            text=icon_letter,
-            font=ui_font(size=11, weight="bold"),
-            text_color=BRAND_COLORS["text_primary"] if is_selected else BRAND_COLORS["text_secondary"]
-        )
-        icon_label.pack(expand=True)
-        
-        text_stack = ctk.CTkFrame(inner, fg_color="transparent")
-        text_stack.pack(side="left", fill="x", expand=True)
-        
-        name = ctk.CTkLabel(
-            text_stack,
-            text=truncate_text(game.get("name", ""), SUGGESTION_GAME_NAME_MAX_CHARS),
-            font=ui_font(size=12, weight="bold"),
-            text_color=BRAND_COLORS["text_primary"] if is_selected else BRAND_COLORS["text_secondary"],
-            anchor="w"
-        )
-        name.pack(fill="x")
+        if self._suggestions_empty is not None:
+            self._suggestions_empty.pack_forget()
         
-        dev = ctk.CTkLabel(
-            text_stack,
-            text=truncate_text(game.get("developer", ""), SUGGESTION_DEVELOPER_MAX_CHARS),
-            font=ui_font(size=10),
-            text_color=BRAND_COLORS["text_muted"],
-            anchor="w"
-        )
-        dev.pack(fill="x")
+        while len(self._suggestion_rows) < len(games):
+            self._suggestion_rows.append(SuggestionRow(self.suggestions_frame))
         
-        status_dot = ctk.CTkFrame(
-            inner,
-            width=7,
-            height=7,
-            corner_radius=4,
-            fg_color=BRAND_COLORS["accent"] if is_selected else BRAND_COLORS["border"]
-        )
-        status_dot.pack(side="right", padx=(8, 0))
-        status_dot.pack_propagate(False)
+        selected_id = self.selected_suggestion.get("id") if self.selected_suggestion else None
+        for row, game in zip(self._suggestion_rows, games):
+            row.show(game, selected_id is not None and game.get("id") == selected_id)
         
-        def apply_state(state: str):
-            if state == "selected":
-                card.configure(
-                    fg_color=BRAND_COLORS["accent_bg"],
-                    border_color=BRAND_COLORS["accent"]
-                )
-                icon.configure(fg_color=BRAND_COLORS["accent"])
-                icon_label.configure(text_color=BRAND_COLORS["text_primary"])
-                name.configure(text_color=BRAND_COLORS["text_primary"])
-                dev.configure(text_color=BRAND_COLORS["text_secondary"])
-                status_dot.configure(fg_color=BRAND_COLORS["accent"])
-            elif state == "hover":
-                card.configure(
-                    fg_color=BRAND_COLORS["bg_hover"],
-                    border_color=BRAND_COLORS["border_hover"]
-                )
-                icon.configure(fg_color=BRAND_COLORS["border_hover"])
-                icon_label.configure(text_color=BRAND_COLORS["text_primary"])
-                name.configure(text_color=BRAND_COLORS["text_primary"])
-                dev.configure(text_color=BRAND_COLORS["text_muted"])
-                status_dot.configure(fg_color=BRAND_COLORS["accent"])
-            else:
-                card.configure(
-                    fg_color=BRAND_COLORS["bg_card"],
-                    border_color=BRAND_COLORS["border"]
-                )
-                icon.configure(fg_color=BRAND_COLORS["bg_hover"])
-                icon_label.configure(text_color=BRAND_COLORS["text_secondary"])
-                name.configure(text_color=BRAND_COLORS["text_secondary"])
-                dev.configure(text_color=BRAND_COLORS["text_muted"])
-                status_dot.configure(fg_color=BRAND_COLORS["border"])
-        
-        apply_state("selected" if is_selected else "normal")
-        
-        def on_enter(_event):
-            if not is_selected:
-                apply_state("hover")
-        
-        def on_leave(_event):
-            if not is_selected:
-                apply_state("normal")
-        
-        for widget in [card, inner, icon, icon_label, text_stack, name, dev, status_dot]:
-            widget.bind("<Button-1>", lambda e, g=game: self._select_suggestion(g))
-            widget.bind("<Enter>", on_enter)
-            widget.bind("<Leave>", on_leave)
-            widget.configure(cursor="hand2")
+        if len(games) != self._suggestions_visible:
+            # Re-pack in order so the visible cards stay first
+            for row in self._suggestion_rows:
+                row.card.pack_forget()
+            for row in self._suggestion_rows[:len(games)]:
+                row.card.pack(fill="x", padx=4, pady=3)
+            self._suggestions_visible = len(games)
+    
+    def _on_suggestion_click(self, event):
+        row = card_row_for(self, event.widget)
+        if row is not None:
+            self._select_suggestion(row.game)
+    
+    def _on_suggestion_enter(self, event):
+        row = card_row_for(self, event.widget)
+        if row is not None:
+            row.on_enter()
+    
+    def _on_suggestion_leave(self, event):
+        row = card_row_for(self, event.widget)
+        if row is not None:
+            row.on_leave()
     
     def _select_suggestion(self, game: Dict[str, Any]):
         """Select a suggestion"""
@@ -2752,11 +3649,16 @@ class AddGameDialog(ctk.CTkToplevel):
         self._populate_suggestions(self.search_entry.get().strip())
     
     def _on_search(self, event):
-        """Handle search input"""
-        query = self.search_entry.get().strip()
+        """Handle search input, refreshing suggestions once typing pauses"""
         if self.selected_suggestion:
             self.selected_suggestion = None
-        self._populate_suggestions(query)
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(SEARCH_DEBOUNCE_MS, self._run_search)
+    
+    def _run_search(self):
+        self._search_after_id = None
+        self._populate_suggestions(self.search_entry.get().strip())
 
     def _open_custom_game_dialog(self):
         dialog = CustomGameDialog(self)
@@ -2768,16 +3670,15 @@ class AddGameDialog(ctk.CTkToplevel):
     
     def _add_game(self):
         if not self.selected_suggestion:
-            messagebox.showerror(
+            show_error_later(
+                self,
                 "Select a game",
                 "Select a game from Suggestions, or click 'Add Custom Game'."
             )
             return
 
         selected = self.selected_suggestion or {}
-        import uuid
-
-        game_id = selected.get("id") or str(uuid.uuid4())[:8]
+        game_id = selected.get("id") or short_id()
         name = selected.get("name", "Unknown")
         developer = selected.get("developer", "")
         paths = selected.get("save_paths", [])
@@ -2792,6 +3693,9 @@ class AddGameDialog(ctk.CTkToplevel):
         self._safe_close()
 
     def _safe_close(self):
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+            self._search_after_id = None
         safe_close_toplevel(self)
 
 
@@ -2816,10 +3720,7 @@ class CustomGameDialog(ctk.CTkToplevel):
         self.result = None
 
         # Center
-        self.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() - 520) // 2
-        y = parent.winfo_y() + (parent.winfo_height() - 420) // 2
-        self.geometry(f"+{x}+{y}")
+        center_on_parent(self, parent, 520, 420)
 
         self._build_ui()
 
@@ -2972,15 +3873,14 @@ class CustomGameDialog(ctk.CTkToplevel):
     def _add_custom_game(self):
         name = self.name_entry.get().strip()
         if not name:
-            messagebox.showerror("Required", "Please enter a game name.")
+            show_error_later(self, "Required", "Please enter a game name.")
             return
 
         developer = self.developer_entry.get().strip()
         save_path = self.path_entry.get().strip()
 
-        import uuid
         self.result = {
-            "id": str(uuid.uuid4())[:8],
+            "id": short_id(),
             "name": name,
             "developer": developer,
             "save_path": save_path,
@@ -3028,10 +3928,7 @@ class GameSettingsDialog(ctk.CTkToplevel):
         self.exe_status = None
 
         # Center dialog
-        self.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() - 520) // 2
-        y = parent.winfo_y() + (parent.winfo_height() - 360) // 2
-        self.geometry(f"+{x}+{y}")
+        center_on_parent(self, parent, 520, 360)
 
         self._build_ui()
         self._refresh_status()
@@ -3062,13 +3959,7 @@ class GameSettingsDialog(ctk.CTkToplevel):
         info_inner = ctk.CTkFrame(info_row, fg_color="transparent")
         info_inner.pack(fill="x", padx=16, pady=12)
 
-        ctk.CTkLabel(
-            info_inner,
-            text="Save Folder",
-            font=ui_font(size=11, weight="bold"),
-            text_color=BRAND_COLORS["text_muted"],
-            anchor="w"
-        ).pack(fill="x")
+        field_label(info_inner, "Save Folder").pack(fill="x")
 
         self.save_status = ctk.CTkLabel(
             info_inner,
@@ -3110,13 +4001,7 @@ class GameSettingsDialog(ctk.CTkToplevel):
         exe_inner = ctk.CTkFrame(exe_row, fg_color="transparent")
         exe_inner.pack(fill="x", padx=16, pady=12)
 
-        ctk.CTkLabel(
-            exe_inner,
-            text="Game Executable",
-            font=ui_font(size=11, weight="bold"),
-            text_color=BRAND_COLORS["text_muted"],
-            anchor="w"
-        ).pack(fill="x")
+        field_label(exe_inner, "Game Executable").pack(fill="x")
 
         self.exe_status = ctk.CTkLabel(
             exe_inner,
@@ -3187,8 +4072,7 @@ class GameSettingsDialog(ctk.CTkToplevel):
 
     def _refresh_status(self):
         save_path = (self.game.get("save_path") or "").strip()
-        expanded_save = os.path.expandvars(save_path) if save_path else ""
-        save_exists = bool(expanded_save) and Path(expanded_save).exists()
+        expanded_save, save_exists = resolve_path(save_path)
 
         if not expanded_save:
             save_text = "Not set"
@@ -3204,8 +4088,7 @@ class GameSettingsDialog(ctk.CTkToplevel):
             self.save_status.configure(text=save_text, text_color=save_color)
 
         exe_path = (self.game.get("exe_path") or "").strip()
-        expanded_exe = os.path.expandvars(exe_path) if exe_path else ""
-        exe_exists = bool(expanded_exe) and Path(expanded_exe).exists()
+        expanded_exe, exe_exists = resolve_path(exe_path)
 
         if not expanded_exe:
             exe_text = "Not set"
@@ -3234,8 +4117,8 @@ class GameSettingsDialog(ctk.CTkToplevel):
 
     def _open_game_folder(self):
         exe_path = (self.game.get("exe_path") or "").strip()
-        expanded_exe = os.path.expandvars(exe_path) if exe_path else ""
-        if not expanded_exe or not Path(expanded_exe).exists():
+        expanded_exe, exe_exists = resolve_path(exe_path)
+        if not exe_exists:
             messagebox.showerror("Not found", "Game executable not set or missing.")
             return
 
@@ -3278,17 +4161,33 @@ class SettingsDialog(ctk.CTkToplevel):
         self.resizable(False, False)
         self.protocol("WM_DELETE_WINDOW", self._safe_close)
         
-        self.config = config.copy()
+        self.config = MappingProxyType(config)  # Read-only view; result holds the changes
         self.result = None
+        # Closing only hides the dialog (see reopen); this flips when it does
+        self._closed = tk.BooleanVar(self, value=False)
+        self.bind("<Destroy>", self._on_destroy, add="+")
         
         # Center
-        self.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() - 480) // 2
-        y = parent.winfo_y() + (parent.winfo_height() - 320) // 2
-        self.geometry(f"+{x}+{y}")
+        center_on_parent(self, parent, 480, 320)
         
         self._build_ui()
     
+    def reopen(self, config: Dict[str, Any]):
+        """Show the hidden dialog again, reloading its fields from config."""
+        self.config = MappingProxyType(config)
+        self.result = None
+        self._closed.set(False)
+        set_entry_text(self.dir_entry, self.config.get("backup_directory", ""))
+        center_on_parent(self, self.master, 480, 320)
+        self.deiconify()
+        self.lift()
+        self.grab_set()
+    
+    def wait_closed(self):
+        """Block (running the event loop) until the dialog is closed or destroyed."""
+        if not self._closed.get():
+            self.wait_variable(self._closed)
+    
     def _build_ui(self):
         content = ctk.CTkFrame(self, fg_color="transparent")
         content.pack(fill="both", expand=True, padx=32, pady=24)
@@ -3309,19 +4208,10 @@ class SettingsDialog(ctk.CTkToplevel):
             anchor="w"
         ).pack(fill="x", pady=(0, 20))
         
-        # Backup directory
-        dir_frame = ctk.CTkFrame(body, fg_color="transparent")
-        dir_frame.pack(fill="x")
-        
-        ctk.CTkLabel(
-            dir_frame,
-            text="Backup Directory",
-            font=ui_font(size=11, weight="bold"),
-            text_color=BRAND_COLORS["text_muted"],
-            anchor="w"
-        ).pack(fill="x")
+        # Backup directory (packed straight into body; it is the only section)
+        field_label(body, "Backup Directory").pack(fill="x")
         
-        path_row = ctk.CTkFrame(dir_frame, fg_color="transparent")
+        path_row = ctk.CTkFrame(body, fg_color="transparent")
         path_row.pack(fill="x", pady=(4, 0))
         
         self.dir_entry = ctk.CTkEntry(
@@ -3385,9 +4275,18 @@ class SettingsDialog(ctk.CTkToplevel):
             messagebox.showerror("Required", "Please select a backup directory.")
             return
         
-        self.config["backup_directory"] = backup_dir
-        self.result = self.config
+        self.result = {"backup_directory": backup_dir}
         self._safe_close()
 
     def _safe_close(self):
-        safe_close_toplevel(self)
+        # Hidden rather than destroyed, so the next open skips _build_ui
+        self.grab_release()
+        self.withdraw()
+        self._closed.set(True)
+    
+    def _on_destroy(self, event):
+        if event.widget is self:
+            try:
+                self._closed.set(True)  # Release wait_closed if the app is closing
+            except tk.TclError:
+                pass
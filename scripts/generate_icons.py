@@ -26,10 +26,13 @@ Requirements:
   pip install Pillow
 """
 
+import io
 import os
 import struct
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
 try:
     from PIL import Image
@@ -73,25 +76,60 @@ def load_source() -> Image.Image:
     return img
 
 
-def resize(img: Image.Image, size: int) -> Image.Image:
-    """High-quality resize to target size."""
+# Smallest icon size produced; the pyramid doesn't go below twice this
+MIN_ICON_SIZE = 16
+
+
+def build_pyramid(img: Image.Image) -> dict[int, Image.Image]:
+    """
+    Precompute successive 2x BOX downsamples of a square source, keyed by
+    width (the source included). BOX is near-ideal for exact halving, and
+    lets each final LANCZOS pass start from a level close to the target
+    instead of the full-resolution source.
+    """
+    levels = {img.size[0]: img}
+    cur = img
+    while cur.size[0] // 2 >= 2 * MIN_ICON_SIZE:
+        cur = cur.resize((cur.size[0] // 2, cur.size[1] // 2), Image.Resampling.BOX)
+        levels[cur.size[0]] = cur
+    return levels
+
+
+def resize(levels: dict[int, Image.Image], size: int) -> Image.Image:
+    """High-quality resize of a build_pyramid source to target size."""
+    # Smallest level still at least 2x the target keeps LANCZOS's
+    # anti-aliasing while touching far fewer pixels
+    img = levels[min((w for w in levels if w >= 2 * size), default=max(levels))]
     return img.resize((size, size), Image.Resampling.LANCZOS)
 
 
-def generate_png(img: Image.Image, size: int, path: Path, label: str):
-    """Generate a PNG icon at the given size."""
-    resized = resize(img, size)
-    resized.save(str(path), "PNG", optimize=True)
-    file_size = path.stat().st_size
+def generate_png(
+    levels: dict[int, Image.Image],
+    size: int,
+    path: Path,
+    label: str,
+    cache: Optional[dict[int, bytes]] = None,
+    optimize: bool = False,
+):
+    """
+    Generate a PNG icon at the given size, keeping the encoded bytes in cache if given.
+    optimize=True runs Pillow's slower multi-pass encoder for the smallest file;
+    it is reserved for the master and PWA icons.
+    """
+    data = _get_png_bytes(resize(levels, size), optimize=optimize)
+    path.write_bytes(data)
+    if cache is not None:
+        cache[size] = data
+    file_size = len(data)
     print(f"  [+] {label}: {size}x{size} ({file_size:,} bytes) -> {path.name}")
 
 
-def generate_ico(img: Image.Image, path: Path, sizes: list[int], label: str):
+def generate_ico(levels: dict[int, Image.Image], path: Path, sizes: list[int], label: str):
     """Generate a Windows .ico file with multiple resolutions."""
     # For ICO, we save the largest size and specify all target sizes
     # Pillow handles the multi-resolution encoding internally
     largest = max(sizes)
-    resized = resize(img, largest)
+    resized = resize(levels, largest)
     resized.save(
         str(path),
         format="ICO",
@@ -101,23 +139,25 @@ def generate_ico(img: Image.Image, path: Path, sizes: list[int], label: str):
     print(f"  [+] {label}: {sizes} ({file_size:,} bytes) -> {path.name}")
 
 
-def generate_icns(img: Image.Image, path: Path):
+def generate_icns(levels: dict[int, Image.Image], path: Path, png_cache: Optional[dict[int, bytes]] = None):
     """
     Generate a macOS .icns file.
-    Uses Pillow's ICNS support if available, otherwise creates a minimal valid icns.
+    Uses Pillow's ICNS support if available, otherwise creates a minimal valid icns
+    (reusing PNGs already encoded by generate_png when they are in png_cache).
     """
     try:
         # Pillow supports ICNS on macOS natively, and on other platforms
         # with the 'icnsutil' or via direct write
-        resized = resize(img, 512)
+        resized = resize(levels, 512)
         resized.save(str(path), format="ICNS")
         file_size = path.stat().st_size
         print(f"  [+] macOS icon: 512x512 ({file_size:,} bytes) -> {path.name}")
     except Exception:
         # Fallback: create a minimal ICNS with ic09 (512x512 JPEG2000) replaced by PNG
         # macOS accepts PNG data in icns icon types
-        png_data_256 = _get_png_bytes(resize(img, 256))
-        png_data_512 = _get_png_bytes(resize(img, 512))
+        png_cache = png_cache or {}
+        png_data_256 = png_cache.get(256) or _get_png_bytes(resize(levels, 256))
+        png_data_512 = png_cache.get(512) or _get_png_bytes(resize(levels, 512))
 
         entries = []
         # ic08 = 256x256 PNG
@@ -139,11 +179,10 @@ def generate_icns(img: Image.Image, path: Path):
         print(f"  [+] macOS icon (manual): 256+512 ({file_size:,} bytes) -> {path.name}")
 
 
-def _get_png_bytes(img: Image.Image) -> bytes:
+def _get_png_bytes(img: Image.Image, optimize: bool = True) -> bytes:
     """Get PNG bytes from a PIL Image."""
-    import io
     buf = io.BytesIO()
-    img.save(buf, format="PNG", optimize=True)
+    img.save(buf, format="PNG", optimize=optimize)
     return buf.getvalue()
 
 
@@ -154,33 +193,50 @@ def main():
     print()
 
     ensure_dirs()
-    img = load_source()
+    # Built before rendering starts, so worker threads only read it
+    levels = build_pyramid(load_source())
     print()
 
-    # ── Tauri Icons ──────────────────────────────
-    print("Generating Tauri icons...")
-
-    generate_png(img, 32, TAURI_ICONS / "32x32.png", "Small icon")
-    generate_png(img, 128, TAURI_ICONS / "128x128.png", "Standard icon")
-    generate_png(img, 256, TAURI_ICONS / "128x128@2x.png", "HiDPI icon")
-    generate_png(img, 512, TAURI_ICONS / "icon.png", "Master icon")
-
-    generate_ico(
-        img,
-        TAURI_ICONS / "icon.ico",
-        [16, 24, 32, 48, 64, 128, 256],
-        "Windows ICO",
-    )
-
-    generate_icns(img, TAURI_ICONS / "icon.icns")
-    print()
-
-    # ── Web / PWA Icons ──────────────────────────
-    print("Generating web icons...")
-
-    generate_ico(img, PUBLIC / "favicon.ico", [16, 32], "Favicon")
-    generate_png(img, 192, PUBLIC / "icon-192.png", "PWA small")
-    generate_png(img, 512, PUBLIC / "icon-512.png", "PWA large")
+    # Encoded PNGs by size, so the ICNS fallback doesn't re-encode them
+    png_cache: dict[int, bytes] = {}
+
+    # Every icon is independent, and Pillow releases the GIL while it
+    # resamples and encodes, so render them all concurrently
+    jobs = [
+        # ── Tauri Icons ──────────────────────────────
+        (generate_png, levels, 32, TAURI_ICONS / "32x32.png", "Small icon", png_cache),
+        (generate_png, levels, 128, TAURI_ICONS / "128x128.png", "Standard icon", png_cache),
+        (generate_png, levels, 256, TAURI_ICONS / "128x128@2x.png", "HiDPI icon", png_cache),
+        (generate_png, levels, 512, TAURI_ICONS / "icon.png", "Master icon", png_cache, True),
+        (
+            generate_ico,
+            levels,
+            TAURI_ICONS / "icon.ico",
+            [16, 24, 32, 48, 64, 128, 256],
+            "Windows ICO",
+        ),
+        # ── Web / PWA Icons ──────────────────────────
+        (generate_ico, levels, PUBLIC / "favicon.ico", [16, 32], "Favicon"),
+        (generate_png, levels, 192, PUBLIC / "icon-192.png", "PWA small", None, True),
+        (generate_png, levels, 512, PUBLIC / "icon-512.png", "PWA large", None, True),
+    ]
+
+    print("Generating Tauri and web icons...")
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as pool:
+        futures = []
+        cached_pngs = {}  # size -> future of the generate_png job filling png_cache
+        for fn, *args in jobs:
+            future = pool.submit(fn, *args)
+            futures.append(future)
+            if fn is generate_png and len(args) > 4 and args[4] is png_cache:
+                cached_pngs[args[1]] = future
+        # The ICNS fallback reuses the 256 and 512 px PNGs from png_cache,
+        # so only start it once the jobs that encode them have finished
+        for size in (256, 512):
+            cached_pngs[size].result()
+        futures.append(pool.submit(generate_icns, levels, TAURI_ICONS / "icon.icns", png_cache))
+        for future in futures:
+            future.result()  # Re-raise the first failure
     print()
 
     print("=" * 50)